@@ -1,8 +1,11 @@
 # Desarrolo 1
 
 from ejercicio1.desarrollo import Evento,EventoRiego,Parcela,ParcelaConRiego
+from comun.salida import configurar_salida, CONSOLA
 
 if __name__ == "__main__":
+    # Las operaciones son silenciosas por defecto; la demo las muestra por consola
+    configurar_salida(CONSOLA)
     
     print("  INICIO: GESTIÓN DE PARCELAS CON RIEGO")
     
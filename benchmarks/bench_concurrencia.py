@@ -0,0 +1,98 @@
+# Benchmark: subidas y bajadas concurrentes sobre una flota de autos desde varios hilos,
+# sin cerrojos, con un único cerrojo global (1 franja) y con cerrojos rayados (Vehiculo.cerrojos),
+# estos últimos también con un almacén de eventos de clase compartido (Vehiculo.almacen_eventos).
+#
+# Además del rendimiento, verifica los invariantes al terminar:
+#   - 0 <= ocupantes_actuales <= asientos_totales en cada auto
+#   - ocupantes_actuales coincide con la suma de subidas menos bajadas de eventos_ocupacion
+#     (si no coincide, hubo actualizaciones perdidas)
+# El intervalo de cambio de hilo se achica para que las carreras sin cerrojos aparezcan.
+#
+# Limitaciones: con el GIL las operaciones (cortas y sin E/S) no escalan con más hilos, así que
+# el benchmark mide el costo de los cerrojos, no una ganancia de paralelismo. Además la ventana
+# entre el chequeo y la escritura de subir_personas es tan corta que, aun con el intervalo
+# reducido, "sin cerrojos" puede terminar sin autos inconsistentes. Que la carrera existe lo
+# demuestra tests/test_concurrencia.py, que abre esa ventana a propósito.
+#
+# Uso (desde la raíz del repositorio):
+#     python -m benchmarks.bench_concurrencia [autos] [operaciones por hilo]
+
+import random
+import sys
+import threading
+import time
+
+from comun.almacen_eventos import AlmacenMemoria
+from comun.cerrojos import CerrojosRayados
+from ejercicio4.desarrollo4 import Auto, Vehiculo
+from ejercicio4.ocupacion import subir_en_varios
+
+N_AUTOS = 1_000
+N_OPERACIONES = 20_000
+HILOS = (1, 2, 4, 8)
+
+
+def trabajar(autos, n_operaciones: int, semilla: int):
+    azar = random.Random(semilla)
+    for _ in range(n_operaciones):
+        operacion = azar.random()
+        if operacion < 0.45:
+            azar.choice(autos).subir_personas(azar.randint(1, 2))
+        elif operacion < 0.9:
+            azar.choice(autos).bajar_personas(azar.randint(1, 2))
+        else:
+            subir_en_varios([(azar.choice(autos), 1), (azar.choice(autos), 1)])
+
+
+def violaciones(autos) -> int:
+    cantidad = 0
+    for auto in autos:
+        neto = 0
+        for evento in auto.eventos_ocupacion:
+            neto += evento.ocupantes_despues - evento.ocupantes_antes
+        if not 0 <= auto.ocupantes_actuales <= auto.asientos_totales or neto != auto.ocupantes_actuales:
+            cantidad += 1
+    return cantidad
+
+
+def correr(cerrojos, n_autos: int, n_hilos: int, n_operaciones: int, almacen=None):
+    Vehiculo.cerrojos = cerrojos
+    Vehiculo.almacen_eventos = almacen
+    autos = [Auto(f"A{i}", f"P{i}", 1200, 4) for i in range(n_autos)]
+    hilos = [threading.Thread(target=trabajar, args=(autos, n_operaciones, semilla)) for semilla in range(n_hilos)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    Vehiculo.cerrojos = None
+    errores = violaciones(autos)
+    if almacen is not None:
+        # Cada evento del almacén debe quedar completo y asignado a su auto
+        registrados = sum(len(auto.historial_eventos) for auto in autos)
+        errores += abs(almacen.total_registrados - registrados)
+        errores += sum(evento.tipo_evento is None for evento in almacen.consultar())
+    Vehiculo.almacen_eventos = None
+    return n_hilos * n_operaciones / segundos, errores
+
+
+def main():
+    n_autos = int(sys.argv[1]) if len(sys.argv) > 1 else N_AUTOS
+    n_operaciones = int(sys.argv[2]) if len(sys.argv) > 2 else N_OPERACIONES
+    sys.setswitchinterval(1e-6)
+
+    modos = [("sin cerrojos", lambda: None),
+             ("global (1 franja)", lambda: CerrojosRayados(1)),
+             ("rayado (64 franjas)", lambda: CerrojosRayados(64)),
+             ("rayado + almacén", lambda: CerrojosRayados(64))]
+    print(f"{n_autos:,} autos, {n_operaciones:,} operaciones por hilo")
+    for nombre, crear in modos:
+        for n_hilos in HILOS:
+            almacen = AlmacenMemoria(capacidad=1_000_000) if "almacén" in nombre else None
+            por_segundo, errores = correr(crear(), n_autos, n_hilos, n_operaciones, almacen)
+            print(f"  {nombre:<20} {n_hilos} hilo(s): {por_segundo:>10,.0f} op/s, inconsistencias: {errores}")
+
+
+if __name__ == "__main__":
+    main()
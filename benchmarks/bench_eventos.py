@@ -0,0 +1,55 @@
+# Benchmark: eventos compactos (__slots__ + marca de tiempo cruda) vs. eventos con
+# __dict__ y strftime en el constructor (diseño anterior).
+#
+# Uso (desde la raíz del repositorio):
+#     python -m benchmarks.bench_eventos [cantidad]
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from ejercicio1.desarrollo import Evento
+
+N_EVENTOS = 1_000_000
+
+
+# Réplica del Evento original para comparar
+class EventoAnterior:
+    def __init__(self, tipo: str, detalle: str):
+        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.tipo = tipo
+        self.detalle = detalle
+
+    def __str__(self):
+        return f"[{self.fecha}] {self.tipo}: {self.detalle}"
+
+
+def medir(clase, n: int):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    eventos = [clase("Carga", "Recarga de depósito") for _ in range(n)]
+    segundos = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del eventos
+    return segundos, memoria
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_EVENTOS
+
+    print(f"Creando {n:,} eventos por variante...")
+    resultados = {}
+    for nombre, clase in (("anterior", EventoAnterior), ("compacto", Evento)):
+        segundos, memoria = medir(clase, n)
+        resultados[nombre] = (segundos, memoria)
+        print(f"  {nombre:<9} {segundos:7.2f} s  {n / segundos:12,.0f} ev/s  "
+              f"{memoria / 1e6:8.1f} MB  ({memoria / n:.0f} B/evento)")
+
+    (t_ant, m_ant), (t_com, m_com) = resultados["anterior"], resultados["compacto"]
+    print(f"Aceleración: x{t_ant / t_com:.2f} | Memoria: x{m_ant / m_com:.2f} menos")
+
+
+if __name__ == "__main__":
+    main()
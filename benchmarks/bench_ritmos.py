@@ -0,0 +1,55 @@
+# Benchmark: ritmo y ranking de muchas carreras, llamando a Carrera.calcular_ritmo una por una
+# (con el chequeo de tipo del resultado) vs. el cálculo por lotes de ejercicio3.ritmos.
+#
+# Uso (desde la raíz del repositorio):
+#     python -m benchmarks.bench_ritmos [carreras]
+
+import random
+import sys
+import time
+
+from ejercicio3.desarrollo3 import Carrera
+from ejercicio3.ritmos import columnas, calcular_ritmos, posiciones, ranking
+
+N_CARRERAS = 1_000_000
+
+
+def medir(funcion) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def por_carrera(carreras):
+    ritmos = []
+    for carrera in carreras:
+        ritmo = carrera.calcular_ritmo()
+        ritmos.append(ritmo if isinstance(ritmo, float) else float("inf"))
+    orden = sorted(range(len(ritmos)), key=ritmos.__getitem__)
+    return orden
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_CARRERAS
+    random.seed(7)
+    carreras = [Carrera(f"C{i}", "Carrera", random.randint(15, 240),
+                        round(random.uniform(1, 42), 2) if i % 50 else 0.0) for i in range(n)]
+
+    t_bucle = medir(lambda: por_carrera(carreras))
+    duracion, distancia = columnas(carreras)
+
+    def lote():
+        ritmos = calcular_ritmos(duracion, distancia)
+        ranking(ritmos)
+        posiciones(ritmos)
+
+    t_lote = medir(lote)
+    t_extraccion = medir(lambda: columnas(carreras))
+    print(f"{n:,} carreras")
+    print(f"  calcular_ritmo + sorted:          {t_bucle:.3f} s ({n / t_bucle:,.0f} carreras/s)")
+    print(f"  columnas (extracción una vez):    {t_extraccion:.3f} s")
+    print(f"  calcular_ritmos + ranking:        {t_lote:.3f} s ({n / t_lote:,.0f} carreras/s)")
+
+
+if __name__ == "__main__":
+    main()
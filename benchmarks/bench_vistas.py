@@ -0,0 +1,42 @@
+# Benchmark: getters con copia (list(...)) vs. vistas de solo lectura (VistaSoloLectura)
+# sobre una entidad con muchos eventos, simulando un panel que consulta el historial
+# repetidamente y solo mira los últimos registros.
+#
+# Uso (desde la raíz del repositorio):
+#     python -m benchmarks.bench_vistas [eventos] [consultas]
+
+import sys
+import time
+
+from comun.vistas import VistaSoloLectura
+from ejercicio2.desarrollo2 import EventoLectura
+
+N_EVENTOS = 100_000
+N_CONSULTAS = 1_000
+
+
+def consultar(getter, n_consultas: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(n_consultas):
+        historial = getter()
+        len(historial)
+        historial[-10:]
+        next(reversed(historial))
+    return time.perf_counter() - inicio
+
+
+def main():
+    n_eventos = int(sys.argv[1]) if len(sys.argv) > 1 else N_EVENTOS
+    n_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else N_CONSULTAS
+    eventos = [EventoLectura(1, i + 1) for i in range(n_eventos)]
+
+    print(f"{n_consultas:,} consultas sobre un historial de {n_eventos:,} eventos...")
+    t_copia = consultar(lambda: list(eventos), n_consultas)
+    t_vista = consultar(lambda: VistaSoloLectura(eventos), n_consultas)
+    print(f"  copia  {t_copia:8.3f} s  ({t_copia / n_consultas * 1e6:10.1f} µs/consulta)")
+    print(f"  vista  {t_vista:8.3f} s  ({t_vista / n_consultas * 1e6:10.1f} µs/consulta)")
+    print(f"Aceleración: x{t_copia / t_vista:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from comun.textos import internar, internar_texto
+
+# Subsistema compartido de almacenamiento de eventos (historial_eventos).
+#
+# Las entidades (Parcela, Publicacion, Actividad, Vehiculo, CuerpoCeleste) guardan su historial
+# en una lista propia salvo que su clase tenga configurado un almacén:
+#
+#     Parcela.almacen_eventos = AlmacenMemoria(capacidad=100_000,
+#                                              desborde=RegistroSegmentos("historial", Evento))
+#
+# Cada almacén admite una sola clase de evento (la del módulo correspondiente), cuyos campos
+# se guardan como texto junto a la marca de tiempo y el id de la entidad.
+
+
+def campos_evento(clase) -> Tuple[str, ...]:
+    # Campos declarados en __slots__ (incluye los heredados), sin la marca de tiempo
+    campos: List[str] = []
+    for c in reversed(clase.__mro__):
+        for campo in c.__dict__.get("__slots__", ()):
+            if campo != "marca_tiempo":
+                campos.append(campo)
+    return tuple(campos)
+
+
+# Campos de los eventos con pocos valores distintos: los mismos que los constructores de los
+# eventos pasan por internar. El resto (detalles, valores anteriores/nuevos) es texto libre.
+_CAMPOS_POCO_VARIADOS = frozenset({"tipo", "campo", "modo", "usuario", "tipo_evento", "accion"})
+
+
+def materializar_evento(clase, campos: Tuple[str, ...], marca: float, valores):
+    # Reconstruye el evento sin pasar por __init__ (que tomaría la hora actual), internando
+    # cada texto con la misma variante que usaría el constructor
+    evento = clase.__new__(clase)
+    evento.marca_tiempo = marca
+    for campo, valor in zip(campos, valores):
+        setattr(evento, campo, internar(valor) if campo in _CAMPOS_POCO_VARIADOS else internar_texto(valor))
+    return evento
+
+
+# Interfaz común de los almacenes
+class AlmacenEventos:
+    def agregar(self, id_entidad: str, evento):
+        raise NotImplementedError
+
+    def consultar(self, id_entidad: Optional[str] = None, desde: Optional[float] = None,
+                  hasta: Optional[float] = None) -> list:
+        # Devuelve los eventos en orden de llegada, filtrados por entidad y rango [desde, hasta]
+        raise NotImplementedError
+
+
+# Buffer circular columnar en memoria. Al llenarse, el evento más antiguo se descarta
+# o, si hay un almacén de desborde, se traslada a él.
+class AlmacenMemoria(AlmacenEventos):
+    def __init__(self, capacidad: int = 100_000, desborde: Optional[AlmacenEventos] = None):
+        if capacidad < 1:
+            raise ValueError("La capacidad del almacén debe ser al menos 1.")
+        self.__capacidad = capacidad
+        self.__desborde = desborde
+        self.__clase = None
+        self.__campos: Tuple[str, ...] = ()
+
+        # Columnas
+        self.__marcas = array("d", bytes(8 * capacidad))
+        self.__entidades: List[Optional[str]] = [None] * capacidad
+        self.__valores: List[list] = []
+
+        self.__total = 0  # Secuencia absoluta del próximo evento
+        self.__por_entidad: Dict[str, Deque[int]] = {}
+        # Un almacén de clase lo comparten todas las entidades, que pueden escribir desde hilos
+        # distintos (p. ej. Vehiculo.cerrojos solo serializa a cada vehículo): agregar reserva
+        # la posición leyendo y escribiendo __total, así que las operaciones van bajo cerrojo
+        self.__cerrojo = threading.Lock()
+
+    # --- Propiedades (Getters) ---
+    @property
+    def capacidad(self) -> int:
+        return self.__capacidad
+
+    @property
+    def total_registrados(self) -> int:
+        return self.__total
+
+    @property
+    def desborde(self) -> Optional[AlmacenEventos]:
+        return self.__desborde
+
+    def __len__(self):
+        return min(self.__total, self.__capacidad)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _fijar_clase(self, evento):
+        if self.__clase is None:
+            self.__clase = type(evento)
+            self.__campos = campos_evento(self.__clase)
+            self.__valores = [[None] * self.__capacidad for _ in self.__campos]
+        elif type(evento) is not self.__clase:
+            raise TypeError(f"El almacén solo admite eventos de tipo {self.__clase.__name__}.")
+
+    def _materializar(self, pos: int):
+        return materializar_evento(self.__clase, self.__campos, self.__marcas[pos],
+                                   [columna[pos] for columna in self.__valores])
+
+    def _desalojar(self, pos: int):
+        id_entidad = self.__entidades[pos]
+        cola = self.__por_entidad[id_entidad]
+        cola.popleft()
+        if not cola:
+            del self.__por_entidad[id_entidad]
+        if self.__desborde is not None:
+            self.__desborde.agregar(id_entidad, self._materializar(pos))
+
+    # --- Operaciones ---
+
+    def agregar(self, id_entidad: str, evento):
+        with self.__cerrojo:
+            self._fijar_clase(evento)
+            pos = self.__total % self.__capacidad
+            if self.__total >= self.__capacidad:
+                self._desalojar(pos)
+
+            self.__marcas[pos] = evento.marca_tiempo
+            self.__entidades[pos] = id_entidad
+            for columna, campo in zip(self.__valores, self.__campos):
+                columna[pos] = getattr(evento, campo)
+
+            self.__por_entidad.setdefault(id_entidad, deque()).append(self.__total)
+            self.__total += 1
+
+    def consultar(self, id_entidad: Optional[str] = None, desde: Optional[float] = None,
+                  hasta: Optional[float] = None) -> list:
+        with self.__cerrojo:
+            eventos = []
+            if self.__desborde is not None:
+                eventos = self.__desborde.consultar(id_entidad, desde, hasta)
+
+            if id_entidad is None:
+                secuencias = range(max(0, self.__total - self.__capacidad), self.__total)
+            else:
+                secuencias = self.__por_entidad.get(id_entidad, ())
+
+            for secuencia in secuencias:
+                pos = secuencia % self.__capacidad
+                marca = self.__marcas[pos]
+                if (desde is None or marca >= desde) and (hasta is None or marca <= hasta):
+                    eventos.append(self._materializar(pos))
+            return eventos
+
+    def volcar(self):
+        # Traslada todo el contenido residente al almacén de desborde
+        with self.__cerrojo:
+            if self.__desborde is None:
+                raise ValueError("El almacén no tiene un destino de desborde configurado.")
+            for secuencia in range(max(0, self.__total - self.__capacidad), self.__total):
+                pos = secuencia % self.__capacidad
+                self.__desborde.agregar(self.__entidades[pos], self._materializar(pos))
+                self.__entidades[pos] = None
+            self.__por_entidad.clear()
+            self.__total = 0
+
+
+# Registro en disco de solo anexado, dividido en segmentos. Las lecturas usan mmap.
+#
+# Formato de cada segmento:
+#     cabecera: MAGIA + campos separados por "\t" + "\n"
+#     registro: <d marca><H cantidad de textos> y por cada texto <I largo><bytes utf-8>
+#               (el primer texto es el id de la entidad, luego los campos del evento)
+class RegistroSegmentos(AlmacenEventos):
+    MAGIA = b"SEGEV1\n"
+    PREFIJO = "segmento_"
+    EXTENSION = ".log"
+
+    _CABECERA_REGISTRO = struct.Struct("<dH")
+    _LARGO = struct.Struct("<I")
+
+    def __init__(self, directorio: str, clase_evento, tamanio_segmento: int = 8 * 1024 * 1024):
+        if tamanio_segmento <= 0:
+            raise ValueError("El tamaño de segmento debe ser positivo.")
+        self.__directorio = directorio
+        self.__clase = clase_evento
+        self.__campos = campos_evento(clase_evento)
+        self.__tamanio_segmento = tamanio_segmento
+        self.__archivo = None
+        # Resumen por segmento: [ruta, marca_min, marca_max, entidades]
+        self.__segmentos: List[list] = []
+        self.__cerrojo = threading.RLock()  # Reentrante: agregar cierra el segmento lleno con cerrar()
+
+        os.makedirs(directorio, exist_ok=True)
+        for nombre in sorted(os.listdir(directorio)):
+            if nombre.startswith(self.PREFIJO) and nombre.endswith(self.EXTENSION):
+                self.__segmentos.append(self._resumir_segmento(os.path.join(directorio, nombre)))
+
+    # --- Propiedades (Getters) ---
+    @property
+    def directorio(self) -> str:
+        return self.__directorio
+
+    @property
+    def segmentos(self) -> List[str]:
+        return [resumen[0] for resumen in self.__segmentos]
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _cabecera(self) -> bytes:
+        return self.MAGIA + "\t".join(self.__campos).encode("utf-8") + b"\n"
+
+    def _recorrer(self, datos, id_entidad: Optional[str] = None):
+        # Generador de (id_entidad, marca, posición de los campos) sobre un segmento mapeado
+        cabecera = self._cabecera()
+        if datos[:len(cabecera)] != cabecera:
+            raise ValueError("El segmento no corresponde a la clase de evento configurada.")
+        pos = len(cabecera)
+        fin = len(datos)
+        objetivo = None if id_entidad is None else id_entidad.encode("utf-8")
+        while pos < fin:
+            marca, cantidad = self._CABECERA_REGISTRO.unpack_from(datos, pos)
+            pos += self._CABECERA_REGISTRO.size
+            (largo,) = self._LARGO.unpack_from(datos, pos)
+            pos += self._LARGO.size
+            entidad = datos[pos:pos + largo]
+            pos += largo
+            inicio_campos = pos
+            for _ in range(cantidad - 1):
+                (largo,) = self._LARGO.unpack_from(datos, pos)
+                pos += self._LARGO.size + largo
+            if objetivo is None or entidad == objetivo:
+                yield entidad, marca, inicio_campos, cantidad - 1
+
+    def _leer_textos(self, datos, pos: int, cantidad: int) -> List[str]:
+        textos = []
+        for _ in range(cantidad):
+            (largo,) = self._LARGO.unpack_from(datos, pos)
+            pos += self._LARGO.size
+            textos.append(datos[pos:pos + largo].decode("utf-8"))
+            pos += largo
+        return textos
+
+    def _resumir_segmento(self, ruta: str) -> list:
+        marca_min, marca_max, entidades = float("inf"), float("-inf"), set()
+        with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            for entidad, marca, _, _ in self._recorrer(datos):
+                marca_min = min(marca_min, marca)
+                marca_max = max(marca_max, marca)
+                entidades.add(entidad.decode("utf-8"))
+        return [ruta, marca_min, marca_max, entidades]
+
+    def _abrir_segmento(self):
+        ruta = os.path.join(self.__directorio,
+                            f"{self.PREFIJO}{len(self.__segmentos) + 1:06d}{self.EXTENSION}")
+        self.__archivo = open(ruta, "xb")
+        self.__archivo.write(self._cabecera())
+        self.__segmentos.append([ruta, float("inf"), float("-inf"), set()])
+
+    # --- Operaciones ---
+
+    def agregar(self, id_entidad: str, evento):
+        with self.__cerrojo:
+            if type(evento) is not self.__clase:
+                raise TypeError(f"El registro solo admite eventos de tipo {self.__clase.__name__}.")
+            if self.__archivo is None or self.__archivo.tell() >= self.__tamanio_segmento:
+                self.cerrar()
+                self._abrir_segmento()
+
+            textos = [id_entidad] + [str(getattr(evento, campo)) for campo in self.__campos]
+            partes = [self._CABECERA_REGISTRO.pack(evento.marca_tiempo, len(textos))]
+            for texto in textos:
+                codificado = texto.encode("utf-8")
+                partes.append(self._LARGO.pack(len(codificado)))
+                partes.append(codificado)
+            self.__archivo.write(b"".join(partes))
+
+            resumen = self.__segmentos[-1]
+            resumen[1] = min(resumen[1], evento.marca_tiempo)
+            resumen[2] = max(resumen[2], evento.marca_tiempo)
+            resumen[3].add(id_entidad)
+
+    def consultar(self, id_entidad: Optional[str] = None, desde: Optional[float] = None,
+                  hasta: Optional[float] = None) -> list:
+        with self.__cerrojo:
+            if self.__archivo is not None:
+                self.__archivo.flush()
+
+            eventos = []
+            for ruta, marca_min, marca_max, entidades in self.__segmentos:
+                # Se descartan segmentos completos usando el resumen
+                if id_entidad is not None and id_entidad not in entidades:
+                    continue
+                if (desde is not None and marca_max < desde) or (hasta is not None and marca_min > hasta):
+                    continue
+                with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+                    for _, marca, pos, cantidad in self._recorrer(datos, id_entidad):
+                        if (desde is None or marca >= desde) and (hasta is None or marca <= hasta):
+                            eventos.append(materializar_evento(self.__clase, self.__campos, marca,
+                                                               self._leer_textos(datos, pos, cantidad)))
+            return eventos
+
+    def cerrar(self):
+        with self.__cerrojo:
+            if self.__archivo is not None:
+                self.__archivo.close()
+                self.__archivo = None
@@ -0,0 +1,47 @@
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterable, List
+
+# Cerrojos rayados (lock striping) para el modo concurrente de las entidades.
+#
+# En lugar de un cerrojo por entidad (memoria proporcional a la flota) o uno global (todo
+# serializado), se usa un arreglo fijo de cerrojos y cada entidad usa el de su franja,
+# elegida por hash de su id. Dos entidades solo compiten si caen en la misma franja.
+#
+#     Vehiculo.cerrojos = CerrojosRayados(franjas=64)
+#
+# Los cerrojos son reentrantes para que una operación compuesta pueda tomar la franja y
+# llamar a las operaciones normales de la entidad, que vuelven a tomarla.
+class CerrojosRayados:
+    def __init__(self, franjas: int = 64):
+        if franjas < 1:
+            raise ValueError("La cantidad de franjas debe ser al menos 1.")
+        self.__cerrojos: List[threading.RLock] = [threading.RLock() for _ in range(franjas)]
+
+    # --- Propiedades (Getters) ---
+    @property
+    def franjas(self) -> int:
+        return len(self.__cerrojos)
+
+    # --- Operaciones ---
+
+    def indice(self, clave: Hashable) -> int:
+        return hash(clave) % len(self.__cerrojos)
+
+    def para(self, clave: Hashable) -> threading.RLock:
+        return self.__cerrojos[self.indice(clave)]
+
+    @contextmanager
+    def varios(self, claves: Iterable[Hashable]):
+        # Toma las franjas de todas las claves siempre en orden creciente de índice,
+        # así dos operaciones sobre conjuntos que se solapan no pueden bloquearse mutuamente
+        indices = sorted({self.indice(clave) for clave in claves})
+        tomados = []
+        try:
+            for indice in indices:
+                self.__cerrojos[indice].acquire()
+                tomados.append(indice)
+            yield
+        finally:
+            for indice in reversed(tomados):
+                self.__cerrojos[indice].release()
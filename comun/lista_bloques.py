@@ -0,0 +1,100 @@
+from bisect import bisect_left, insort
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+
+# Lista ordenada para índices que cambian seguido (catálogo, tablas de posiciones).
+#
+# Se parte en bloques de a lo sumo 2 * TAMANIO_BLOQUE elementos, con el máximo de cada bloque en
+# una lista aparte. Alta y baja buscan el bloque con bisect (O(log n)) y solo desplazan los
+# elementos de ese bloque, no los de toda la lista como un insort sobre una lista única (O(n)
+# por actualización). Partir un bloque lleno cuesta O(n / TAMANIO_BLOQUE).
+class ListaPorBloques:
+    TAMANIO_BLOQUE = 512
+
+    def __init__(self, claves: Iterable = ()):
+        self.__bloques: List[list] = []
+        self.__maximos: list = []
+        self.__largo = 0
+        self.cargar(claves)
+
+    # --- Propiedades (Getters) ---
+    def __len__(self):
+        return self.__largo
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self.__bloques)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _bloque_de(self, clave) -> int:
+        # Índice del primer bloque cuyo máximo es >= clave (len si no hay ninguno)
+        return bisect_left(self.__maximos, clave)
+
+    # --- Operaciones ---
+
+    def cargar(self, claves: Iterable):
+        # Alta masiva: une lo existente con las claves nuevas, ordena una sola vez (O(n log n))
+        # y vuelve a partir en bloques
+        nuevas = list(claves)
+        if not nuevas:
+            return
+        todas = list(self) + nuevas
+        todas.sort()
+        tamanio = self.TAMANIO_BLOQUE
+        self.__bloques = [todas[i:i + tamanio] for i in range(0, len(todas), tamanio)]
+        self.__maximos = [bloque[-1] for bloque in self.__bloques]
+        self.__largo = len(todas)
+
+    def agregar(self, clave):
+        bloques, maximos = self.__bloques, self.__maximos
+        self.__largo += 1
+        if not bloques:
+            bloques.append([clave])
+            maximos.append(clave)
+            return
+        i = min(self._bloque_de(clave), len(bloques) - 1)
+        bloque = bloques[i]
+        insort(bloque, clave)
+        maximos[i] = bloque[-1]
+        if len(bloque) > 2 * self.TAMANIO_BLOQUE:
+            mitad = self.TAMANIO_BLOQUE
+            bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+            maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+
+    def quitar(self, clave) -> bool:
+        bloques, maximos = self.__bloques, self.__maximos
+        i = self._bloque_de(clave)
+        if i == len(bloques):
+            return False
+        bloque = bloques[i]
+        pos = bisect_left(bloque, clave)
+        if pos == len(bloque) or bloque[pos] != clave:
+            return False
+        del bloque[pos]
+        self.__largo -= 1
+        if bloque:
+            maximos[i] = bloque[-1]
+        else:
+            del bloques[i]
+            del maximos[i]
+        return True
+
+    def primeros(self, k: int) -> list:
+        return list(islice(chain.from_iterable(self.__bloques), max(k, 0)))
+
+    def desde(self, clave) -> Iterator:
+        # Recorre en orden los elementos >= clave (rangos y prefijos: O(log n + k))
+        i = self._bloque_de(clave)
+        if i == len(self.__bloques):
+            return iter(())
+        bloque = self.__bloques[i]
+        return chain(islice(bloque, bisect_left(bloque, clave), None),
+                     chain.from_iterable(self.__bloques[i + 1:]))
+
+    def posicion(self, clave) -> int:
+        # Cantidad de elementos menores que clave
+        i = self._bloque_de(clave)
+        anteriores = sum(len(bloque) for bloque in self.__bloques[:i])
+        if i < len(self.__bloques):
+            anteriores += bisect_left(self.__bloques[i], clave)
+        return anteriores
@@ -0,0 +1,21 @@
+from typing import NamedTuple, Union
+
+# Códigos de estado de las operaciones
+OK = "ok"
+PARCIAL = "parcial"           # Se aplicó solo una parte de lo solicitado
+SIN_CAMBIOS = "sin_cambios"   # La operación no tenía nada que hacer (ya activa, ya vacío, 0 L...)
+RECHAZADO = "rechazado"       # Lo impide una regla de negocio (estado, umbral, capacidad...)
+INVALIDO = "invalido"         # Falló la validación de los parámetros
+
+
+# Resultado devuelto por las operaciones que modifican una entidad.
+# - cantidad: magnitud aplicada por la operación (litros, páginas, personas, nuevo valor...)
+# - saldo: valor resultante de la magnitud afectada tras la operación
+class Resultado(NamedTuple):
+    estado: str
+    cantidad: Union[int, float] = 0
+    saldo: Union[int, float] = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.estado == OK or self.estado == PARCIAL
@@ -0,0 +1,89 @@
+import logging
+from contextlib import contextmanager
+from typing import List, Optional
+
+# Política de salida para los mensajes de las operaciones de dominio.
+#
+# Los mensajes se emiten con formato diferido estilo logging ("%.2f L", litros): solo se
+# formatean si la política activa los va a mostrar o guardar. Por defecto la salida es
+# silenciosa, de modo que el camino habitual no formatea texto ni hace E/S.
+#
+#     configurar_salida(CONSOLA)            # global
+#     parcela.salida = PoliticaSalida(BUFFER)  # por instancia
+#     with salida(REGISTRO): ...            # temporal
+
+SILENCIOSO = "silencioso"
+CONSOLA = "consola"
+BUFFER = "buffer"
+REGISTRO = "logging"
+
+MODOS_SALIDA = (SILENCIOSO, CONSOLA, BUFFER, REGISTRO)
+
+
+class PoliticaSalida:
+    __slots__ = ("__modo", "__mensajes", "__logger")
+
+    def __init__(self, modo: str = SILENCIOSO, logger: Optional[logging.Logger] = None):
+        if modo not in MODOS_SALIDA:
+            raise ValueError(f"Modo de salida no válido. Use uno de: {', '.join(MODOS_SALIDA)}.")
+        self.__modo = modo
+        self.__mensajes: List[str] = []
+        self.__logger = logger if logger is not None else logging.getLogger("evaluacion_poo")
+
+    # --- Propiedades (Getters) ---
+    @property
+    def modo(self) -> str:
+        return self.__modo
+
+    @property
+    def mensajes(self) -> List[str]:
+        # Mensajes acumulados en modo BUFFER
+        return list(self.__mensajes)
+
+    # --- Operaciones ---
+
+    def emitir(self, nivel: int, mensaje: str, *args):
+        modo = self.__modo
+        if modo == SILENCIOSO:
+            return
+        if modo == REGISTRO:
+            # logging formatea solo si el nivel está habilitado
+            self.__logger.log(nivel, mensaje, *args)
+            return
+        texto = mensaje % args if args else mensaje
+        if modo == CONSOLA:
+            print(texto)
+        else:
+            self.__mensajes.append(texto)
+
+    def vaciar(self) -> List[str]:
+        # Devuelve y descarta los mensajes acumulados
+        mensajes, self.__mensajes = self.__mensajes, []
+        return mensajes
+
+
+_politica_global = PoliticaSalida(SILENCIOSO)
+
+
+def politica_actual() -> PoliticaSalida:
+    return _politica_global
+
+
+def configurar_salida(modo_o_politica, logger: Optional[logging.Logger] = None) -> PoliticaSalida:
+    # Acepta un modo (str) o una PoliticaSalida ya construida; devuelve la política anterior
+    global _politica_global
+    anterior = _politica_global
+    if isinstance(modo_o_politica, PoliticaSalida):
+        _politica_global = modo_o_politica
+    else:
+        _politica_global = PoliticaSalida(modo_o_politica, logger)
+    return anterior
+
+
+@contextmanager
+def salida(modo_o_politica, logger: Optional[logging.Logger] = None):
+    anterior = configurar_salida(modo_o_politica, logger)
+    try:
+        yield _politica_global
+    finally:
+        configurar_salida(anterior)
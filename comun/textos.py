@@ -0,0 +1,41 @@
+import sys
+from typing import Dict
+
+# Internado de los textos de los eventos.
+#
+# Los historiales repiten una y otra vez los mismos nombres de campo ("titulo", "anio", ...),
+# tipos de evento, modos y usuarios. Internándolos, cada texto distinto se guarda una sola vez y
+# todos los eventos apuntan al mismo objeto, así que la memoria crece con la cantidad de valores
+# distintos y la comparación de iguales es por identidad.
+#
+# Hay dos variantes según la cardinalidad del campo:
+# - internar: tabla propia (se puede medir y vaciar) que retiene cada texto para siempre. Solo
+#   para campos con pocos valores distintos (tipo, campo, modo, usuario, acción).
+# - internar_texto: sys.intern, que deduplica mientras el texto esté en uso y lo libera cuando
+#   ningún evento lo referencia. Para texto libre (detalles, valores anteriores/nuevos, títulos),
+#   cuya cantidad de valores distintos crece con el historial.
+
+_tabla: Dict[str, str] = {}
+
+
+def internar(texto):
+    # Devuelve la instancia compartida de 'texto'; los valores que no son str se devuelven tal cual
+    if type(texto) is not str:
+        return texto
+    return _tabla.setdefault(texto, texto)
+
+
+def internar_texto(texto):
+    # Igual que internar, pero sin retener el texto en la tabla
+    if type(texto) is not str:
+        return texto
+    return sys.intern(texto)
+
+
+def tamanio_tabla() -> int:
+    return len(_tabla)
+
+
+def vaciar_tabla():
+    # Los eventos existentes conservan sus textos; solo se pierde la deduplicación con los nuevos
+    _tabla.clear()
@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+from typing import Optional
+
+# Vista de solo lectura sobre una lista interna. No copia los datos: comparte el almacenamiento
+# con la entidad, por lo que refleja los eventos que se agreguen después de obtenerla.
+class VistaSoloLectura(Sequence):
+    __slots__ = ("__datos", "__rango")
+
+    def __init__(self, datos: list, rango: Optional[range] = None):
+        self.__datos = datos
+        self.__rango = rango  # None = la lista completa (vista viva)
+
+    def __len__(self):
+        if self.__rango is None:
+            return len(self.__datos)
+        return len(self.__rango)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            # El corte también es una vista: solo se calcula el rango de índices
+            rango = range(len(self.__datos)) if self.__rango is None else self.__rango
+            return VistaSoloLectura(self.__datos, rango[indice])
+        if self.__rango is None:
+            return self.__datos[indice]
+        return self.__datos[self.__rango[indice]]
+
+    def __iter__(self):
+        if self.__rango is None:
+            return iter(self.__datos)
+        datos = self.__datos
+        return (datos[i] for i in self.__rango)
+
+    def __reversed__(self):
+        if self.__rango is None:
+            return reversed(self.__datos)
+        datos = self.__datos
+        return (datos[i] for i in reversed(self.__rango))
+
+    def __eq__(self, otro):
+        if not isinstance(otro, Sequence) or isinstance(otro, str):
+            return NotImplemented
+        return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+
+    def __repr__(self):
+        return f"VistaSoloLectura({list(self)!r})"
@@ -1,18 +1,35 @@
+import logging
+import time
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Sequence
+
+from comun.almacen_eventos import AlmacenEventos
+from comun.resultado import Resultado, OK, PARCIAL, SIN_CAMBIOS, RECHAZADO, INVALIDO
+from comun.salida import PoliticaSalida, politica_actual
+from comun.textos import internar, internar_texto
+from comun.vistas import VistaSoloLectura
 
 # Clase auxiliar para guardar los eventos generales
 class Evento:
+    __slots__ = ("marca_tiempo", "tipo", "detalle")
+
     def __init__(self, tipo: str, detalle: str):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.tipo = tipo
-        self.detalle = detalle
+        self.marca_tiempo = time.time()  # Epoch en segundos; se formatea solo al mostrar
+        self.tipo = internar(tipo)
+        self.detalle = internar_texto(detalle)
+
+    @property
+    def fecha(self) -> str:
+        # El formateo se difiere hasta que alguien lo pide (__str__, exportación)
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
 
     def __str__(self):
         return f"[{self.fecha}] {self.tipo}: {self.detalle}"
 
 # Clase auxiliar para guardar los eventos de riego
 class EventoRiego(Evento):
+    __slots__ = ("saldo_antes", "saldo_despues", "litros_solicitados", "litros_aplicados", "modo")
+
     def __init__(self, tipo: str, detalle: str, saldo_antes: float, saldo_despues: float,
                  litros_solicitados: float, litros_aplicados: float, modo: str):
         super().__init__(tipo, detalle)
@@ -20,7 +37,7 @@ class EventoRiego(Evento):
         self.saldo_despues = saldo_despues
         self.litros_solicitados = litros_solicitados
         self.litros_aplicados = litros_aplicados
-        self.modo = modo
+        self.modo = internar(modo)
 
     def __str__(self):
         return (f"[{self.fecha}] RIEGO ({self.modo}): {self.detalle} | "
@@ -28,6 +45,11 @@ class EventoRiego(Evento):
                 f"Después: {self.saldo_despues:.2f} L")
 
 class Parcela:
+    # Almacén compartido opcional; si es None cada instancia guarda su historial en una lista
+    almacen_eventos: Optional[AlmacenEventos] = None
+    # Política de salida propia; si es None se usa la global (silenciosa por defecto)
+    salida: Optional[PoliticaSalida] = None
+
     def __init__(self, id_parcela: str, superficie_ha: float, cultivo_actual: str):
         # Atributos "privados" (encapsulados)
         self.__id_parcela = id_parcela
@@ -35,6 +57,7 @@ class Parcela:
         self.__cultivo_actual = self._validar_cultivo(cultivo_actual)
         self.__estado = "activa"  # Por defecto activa
         self.__historial_eventos: List[Evento] = []  # Solo lectura
+        self.__observadores: Optional[List[Callable]] = None  # Se crea al primer suscriptor
 
         self._registrar_evento("Creación", "Parcela inicializada.")
 
@@ -57,9 +80,11 @@ class Parcela:
         return self.__estado
     
     @property
-    def historial_eventos(self) -> List[Evento]:
-        # Retorna una copia para mantenerlo 'solo lectura'
-        return list(self.__historial_eventos)
+    def historial_eventos(self) -> Sequence[Evento]:
+        # Vista de solo lectura: no copia la lista interna
+        if self.almacen_eventos is not None:
+            return self.almacen_eventos.consultar(self.__id_parcela)
+        return VistaSoloLectura(self.__historial_eventos)
 
     # --- Métodos Auxiliares Internos ---
     def _validar_superficie(self, superficie: float) -> float:
@@ -73,64 +98,113 @@ class Parcela:
             raise ValueError("El cultivo actual no puede estar vacío.")
         return cultivo.strip()
 
+    def _emitir(self, nivel: int, mensaje: str, *args):
+        (self.salida or politica_actual()).emitir(nivel, mensaje, *args)
+
     def _registrar_evento(self, tipo: str, detalle: str, silent: bool = False):
-        self.__historial_eventos.append(Evento(tipo, detalle))
+        evento = Evento(tipo, detalle)
+        if self.almacen_eventos is not None:
+            self.almacen_eventos.agregar(self.__id_parcela, evento)
+        else:
+            self.__historial_eventos.append(evento)
         if not silent:
-            print(f"[{tipo}] -> {detalle}")
+            self._emitir(logging.INFO, "[%s] -> %s", tipo, detalle)
+
+    def _restaurar_estado(self, estado: str):
+        # Solo para reconstruir una copia de la parcela (p. ej. en otro proceso), sin eventos
+        estado_previo = self.__estado
+        self.__estado = estado
+        if estado != estado_previo:
+            self._notificar("estado", estado_previo, estado)
+
+    def _incorporar_historial(self, eventos: List[Evento]):
+        # Agrega eventos ya creados en otra copia de la parcela, conservando su fecha
+        if self.almacen_eventos is not None:
+            for evento in eventos:
+                self.almacen_eventos.agregar(self.__id_parcela, evento)
+        else:
+            self.__historial_eventos.extend(eventos)
+
+    def _notificar(self, campo: str, valor_anterior, valor_nuevo):
+        if self.__observadores:
+            for observador in self.__observadores:
+                observador(self, campo, valor_anterior, valor_nuevo)
+
+    # --- Suscripciones ---
+
+    def suscribir(self, observador: Callable):
+        # observador(parcela, campo, valor_anterior, valor_nuevo) se llama en cada cambio notificado
+        if self.__observadores is None:
+            self.__observadores = []
+        self.__observadores.append(observador)
+
+    def desuscribir(self, observador: Callable):
+        if self.__observadores and observador in self.__observadores:
+            self.__observadores.remove(observador)
             
     # --- Operaciones ---
 
-    def actualizar_cultivo(self, nuevo_cultivo: str):
+    def actualizar_cultivo(self, nuevo_cultivo: str) -> Resultado:
         # Regla de Negocio: No se permite si estado = inactiva
         if self.__estado == "inactiva":
-            print("❌ Error: No se puede actualizar el cultivo. La parcela está inactiva.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: No se puede actualizar el cultivo. La parcela está inactiva.")
+            return Resultado(RECHAZADO)
 
         try:
             nuevo_cultivo_validado = self._validar_cultivo(nuevo_cultivo)
         except ValueError as e:
-            print(f"❌ Error de validación: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación: %s", e)
+            return Resultado(INVALIDO)
 
         cultivo_previo = self.__cultivo_actual
         self.__cultivo_actual = nuevo_cultivo_validado
         self._registrar_evento("Actualización Cultivo", f"Cambio de '{cultivo_previo}' a '{self.__cultivo_actual}'.")
-        print(f"✅ Cultivo actualizado a: {self.__cultivo_actual}")
+        self._emitir(logging.INFO, "✅ Cultivo actualizado a: %s", self.__cultivo_actual)
+        return Resultado(OK)
 
-    def activar(self, motivo: str):
+    def activar(self, motivo: str) -> Resultado:
         if self.__estado == "activa":
-            print("ℹ️ La parcela ya está activa.")
-            return
+            self._emitir(logging.INFO, "ℹ️ La parcela ya está activa.")
+            return Resultado(SIN_CAMBIOS)
         
         self.__estado = "activa"
+        self._notificar("estado", "inactiva", "activa")
         self._registrar_evento("Activación", f"Parcela activada. Motivo: {motivo}")
-        print("✅ Parcela activada.")
+        self._emitir(logging.INFO, "✅ Parcela activada.")
+        return Resultado(OK)
 
-    def desactivar(self, motivo: str):
+    def desactivar(self, motivo: str) -> Resultado:
         if self.__estado == "inactiva":
-            print("ℹ️ La parcela ya está inactiva.")
-            return
+            self._emitir(logging.INFO, "ℹ️ La parcela ya está inactiva.")
+            return Resultado(SIN_CAMBIOS)
         
         self.__estado = "inactiva"
+        self._notificar("estado", "activa", "inactiva")
         self._registrar_evento("Desactivación", f"Parcela desactivada. Motivo: {motivo}")
-        print("✅ Parcela desactivada.")
+        self._emitir(logging.INFO, "✅ Parcela desactivada.")
         # NOTA: La regla de negocio de inhabilitar riego se implementa en ParcelaConRiego
+        return Resultado(OK)
         
-    def rectificar_superficie(self, nueva_superficie: float, motivo: str):
+    def rectificar_superficie(self, nueva_superficie: float, motivo: str) -> Resultado:
         try:
             superficie_validada = self._validar_superficie(nueva_superficie)
         except ValueError as e:
-            print(f"❌ Error de validación: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación: %s", e)
+            return Resultado(INVALIDO, 0, self.__superficie_ha)
             
         superficie_previa = self.__superficie_ha
         self.__superficie_ha = superficie_validada
+        if superficie_validada != superficie_previa:
+            self._notificar("superficie_ha", superficie_previa, superficie_validada)
         
         self._registrar_evento("Rectificación Superficie", 
                                f"De {superficie_previa:.2f} ha a {self.__superficie_ha:.2f} ha. Motivo: {motivo}")
-        print(f"✅ Superficie rectificada a {self.__superficie_ha:.2f} ha.")
+        self._emitir(logging.INFO, "✅ Superficie rectificada a %.2f ha.", self.__superficie_ha)
+        return Resultado(OK, self.__superficie_ha, self.__superficie_ha)
 
 class ParcelaConRiego(Parcela):
+    MODOS_RIEGO = ("estricto", "parcial")
+
     def __init__(self, id_parcela: str, superficie_ha: float, cultivo_actual: str, tasa_riego_l_ha: float = 1000.0):
         super().__init__(id_parcela, superficie_ha, cultivo_actual)
         
@@ -141,6 +215,8 @@ class ParcelaConRiego(Parcela):
         # Estado inicial de riego: habilitado si la parcela base está 'activa'
         self.__estado_riego = "habilitado" if self.estado == "activa" else "inhabilitado" 
         self.__eventos_riego: List[EventoRiego] = [] # Solo lectura
+        # Demanda cacheada (superficie * tasa); se mantiene en rectificar_superficie y configurar_tasa
+        self.__demanda_litros = self.superficie_ha * self.__tasa_riego_l_ha
 
         self._registrar_evento("Riego Inicial", "Sistema de riego incorporado.", silent=True)
 
@@ -153,18 +229,41 @@ class ParcelaConRiego(Parcela):
         return self.__litros_disponibles
     
     @property
-    def eventos_riego(self) -> List[EventoRiego]:
-        # Retorna una copia para mantenerlo 'solo lectura'
-        return list(self.__eventos_riego)
+    def tasa_riego_l_ha(self):
+        return self.__tasa_riego_l_ha
+
+    @property
+    def umbral_min_litros(self):
+        return self.__umbral_min_litros
+
+    @property
+    def estado_riego(self):
+        return self.__estado_riego
+
+    @property
+    def demanda_litros(self):
+        return self.__demanda_litros
+
+    @property
+    def eventos_riego(self) -> Sequence[EventoRiego]:
+        # Vista de solo lectura: no copia la lista interna
+        return VistaSoloLectura(self.__eventos_riego)
 
     # --- Sobreescritura de Métodos de la Clase Base ---
 
-    def desactivar(self, motivo: str):
+    def desactivar(self, motivo: str) -> Resultado:
         # 1. Ejecutar la lógica de la clase base (Parcela)
-        super().desactivar(motivo)
+        resultado = super().desactivar(motivo)
         
         # 2. Regla de Negocio: Si la parcela pasa a inactiva, el riego queda inhabilitado.
         self._inhabilitar_riego_interno("Desactivación de la parcela principal.")
+        return resultado
+
+    def rectificar_superficie(self, nueva_superficie: float, motivo: str) -> Resultado:
+        resultado = super().rectificar_superficie(nueva_superficie, motivo)
+        if resultado.ok:
+            self._actualizar_demanda()
+        return resultado
         
     # --- Métodos Auxiliares Internos ---
 
@@ -172,13 +271,27 @@ class ParcelaConRiego(Parcela):
         if tasa <= 0:
             raise ValueError("La tasa de riego debe ser mayor a 0.")
         return tasa
+
+    def _actualizar_demanda(self):
+        demanda_previa = self.__demanda_litros
+        self.__demanda_litros = self.superficie_ha * self.__tasa_riego_l_ha
+        if self.__demanda_litros != demanda_previa:
+            self._notificar("demanda_litros", demanda_previa, self.__demanda_litros)
         
-    def _inhabilitar_riego_interno(self, motivo: str):
+    def _fijar_saldo(self, saldo: float):
+        saldo_previo = self.__litros_disponibles
+        self.__litros_disponibles = saldo
+        if saldo != saldo_previo:
+            self._notificar("litros_disponibles", saldo_previo, saldo)
+
+    def _inhabilitar_riego_interno(self, motivo: str) -> Resultado:
         if self.__estado_riego == "inhabilitado":
-            return
+            return Resultado(SIN_CAMBIOS)
         self.__estado_riego = "inhabilitado"
+        self._notificar("estado_riego", "habilitado", "inhabilitado")
         self._registrar_evento("Riego ON/OFF", f"Riego inhabilitado. Motivo: {motivo}")
-        print("✅ Riego inhabilitado.")
+        self._emitir(logging.INFO, "✅ Riego inhabilitado.")
+        return Resultado(OK)
         
     def _registrar_evento_riego(self, tipo: str, detalle: str, saldo_antes: float, saldo_despues: float,
                                 litros_solicitados: float, litros_aplicados: float, modo: str):
@@ -188,70 +301,108 @@ class ParcelaConRiego(Parcela):
         # También se registra en el historial general de la Parcela (heredado)
         self._registrar_evento(f"Riego/{tipo}", detalle, silent=True) 
 
+    def _aplicar_riego_lote(self, saldo_antes: float, saldo_despues: float, demanda: float,
+                            litros_aplicados: float, modo: str, detalle: str):
+        # Usado por FlotaRiego: el cálculo ya se hizo para toda la flota, aquí solo se escribe el resultado
+        self._fijar_saldo(saldo_despues)
+        self._registrar_evento_riego("Riego OK", detalle, saldo_antes, saldo_despues,
+                                     demanda, litros_aplicados, modo)
+
+    def _restaurar_estado_riego(self, estado: str, estado_riego: str, umbral: float, saldo: float):
+        self._restaurar_estado(estado)
+        estado_riego_previo, umbral_previo = self.__estado_riego, self.__umbral_min_litros
+        self.__estado_riego = estado_riego
+        self.__umbral_min_litros = umbral
+        if estado_riego != estado_riego_previo:
+            self._notificar("estado_riego", estado_riego_previo, estado_riego)
+        if umbral != umbral_previo:
+            self._notificar("umbral_min_litros", umbral_previo, umbral)
+        self._fijar_saldo(saldo)
+
+    def _incorporar_eventos_riego(self, eventos_riego: List[EventoRiego], eventos_generales: List[Evento],
+                                  saldo: float):
+        # Usado por la ejecución en paralelo para volcar lo ocurrido en el proceso trabajador
+        self.__eventos_riego.extend(eventos_riego)
+        self._incorporar_historial(eventos_generales)
+        self._fijar_saldo(saldo)
+
     # --- Operaciones de Riego ---
 
-    def configurar_tasa(self, l_ha: float):
+    def configurar_tasa(self, l_ha: float) -> Resultado:
         try:
             nueva_tasa = self._validar_tasa(l_ha)
+            tasa_previa = self.__tasa_riego_l_ha
             self.__tasa_riego_l_ha = nueva_tasa
+            if nueva_tasa != tasa_previa:
+                self._notificar("tasa_riego_l_ha", tasa_previa, nueva_tasa)
+            self._actualizar_demanda()
             self._registrar_evento("Configuración Riego", f"Tasa establecida a {l_ha:.2f} L/ha.")
-            print(f"✅ Tasa de riego configurada a {l_ha:.2f} L/ha.")
+            self._emitir(logging.INFO, "✅ Tasa de riego configurada a %.2f L/ha.", l_ha)
+            return Resultado(OK, nueva_tasa, nueva_tasa)
         except ValueError as e:
-            print(f"❌ Error de configuración: {e}")
+            self._emitir(logging.WARNING, "❌ Error de configuración: %s", e)
+            return Resultado(INVALIDO, 0, self.__tasa_riego_l_ha)
 
-    def configurar_umbral(self, litros: float):
+    def configurar_umbral(self, litros: float) -> Resultado:
         if litros < 0:
-            print("❌ Error: El umbral mínimo no puede ser negativo.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: El umbral mínimo no puede ser negativo.")
+            return Resultado(INVALIDO, 0, self.__umbral_min_litros)
+        umbral_previo = self.__umbral_min_litros
         self.__umbral_min_litros = litros
+        if litros != umbral_previo:
+            self._notificar("umbral_min_litros", umbral_previo, litros)
         self._registrar_evento("Configuración Riego", f"Umbral mínimo establecido a {litros:.2f} L.")
-        print(f"✅ Umbral mínimo configurado a {litros:.2f} L.")
+        self._emitir(logging.INFO, "✅ Umbral mínimo configurado a %.2f L.", litros)
+        return Resultado(OK, litros, litros)
 
-    def habilitar_riego(self):
+    def habilitar_riego(self) -> Resultado:
         if self.estado == "inactiva":
-            print("❌ Error: El riego no se puede habilitar si la parcela está inactiva.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: El riego no se puede habilitar si la parcela está inactiva.")
+            return Resultado(RECHAZADO)
         if self.__estado_riego == "habilitado":
-            print("ℹ️ El riego ya está habilitado.")
-            return
+            self._emitir(logging.INFO, "ℹ️ El riego ya está habilitado.")
+            return Resultado(SIN_CAMBIOS)
             
         self.__estado_riego = "habilitado"
+        self._notificar("estado_riego", "inhabilitado", "habilitado")
         self._registrar_evento("Riego ON/OFF", "Riego habilitado manualmente.")
-        print("✅ Riego habilitado.")
+        self._emitir(logging.INFO, "✅ Riego habilitado.")
+        return Resultado(OK)
 
-    def inhabilitar_riego(self):
-        self._inhabilitar_riego_interno("Inhabilitación manual.")
+    def inhabilitar_riego(self) -> Resultado:
+        return self._inhabilitar_riego_interno("Inhabilitación manual.")
         
-    def cargar_agua(self, litros: float):
+    def cargar_agua(self, litros: float) -> Resultado:
         if litros <= 0:
-            print("❌ Error: La carga de agua debe ser positiva.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: La carga de agua debe ser positiva.")
+            return Resultado(INVALIDO, 0, self.__litros_disponibles)
 
         saldo_antes = self.__litros_disponibles
-        self.__litros_disponibles += litros
+        self._fijar_saldo(saldo_antes + litros)
         
         self._registrar_evento_riego("Carga", "Recarga de depósito", 
                                      saldo_antes, self.__litros_disponibles, 
                                      0.0, litros, "Carga")
-        print(f"✅ Agua cargada: +{litros:.2f} L. Saldo actual: {self.__litros_disponibles:.2f} L.")
+        self._emitir(logging.INFO, "✅ Agua cargada: +%.2f L. Saldo actual: %.2f L.", litros, self.__litros_disponibles)
+        return Resultado(OK, litros, self.__litros_disponibles)
 
-    def regar_automatico(self, modo: str):
+    def regar_automatico(self, modo: str) -> Resultado:
         # --- Reglas de Negocio - Prohibido regar si: ---
         if self.estado == "inactiva":
             self._registrar_evento("Riego Rechazado", "Parcela inactiva.", silent=True)
-            print("❌ RECHAZADO: La parcela está inactiva.")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: La parcela está inactiva.")
+            return Resultado(RECHAZADO, 0, self.__litros_disponibles)
         if self.__estado_riego == "inhabilitado":
             self._registrar_evento("Riego Rechazado", "Sistema de riego inhabilitado.", silent=True)
-            print("❌ RECHAZADO: El sistema de riego está inhabilitado.")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: El sistema de riego está inhabilitado.")
+            return Resultado(RECHAZADO, 0, self.__litros_disponibles)
         if self.__tasa_riego_l_ha <= 0:
             self._registrar_evento("Riego Rechazado", "Tasa de riego <= 0.", silent=True)
-            print("❌ RECHAZADO: Tasa de riego no configurada (o <= 0).")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: Tasa de riego no configurada (o <= 0).")
+            return Resultado(RECHAZADO, 0, self.__litros_disponibles)
 
         modo = modo.lower()
-        demanda = self.superficie_ha * self.__tasa_riego_l_ha
+        demanda = self.__demanda_litros
         saldo_antes = self.__litros_disponibles
         litros_a_aplicar = 0.0
         detalle = ""
@@ -268,8 +419,8 @@ class ParcelaConRiego(Parcela):
             else:
                 detalle = f"Riego ESTRICTO RECHAZADO. Saldo final ({saldo_final_previsto:.2f} L) < Umbral ({self.__umbral_min_litros:.2f} L)."
                 self._registrar_evento("Riego Rechazado", detalle)
-                print(f"❌ RECHAZADO (ESTRICTO): {detalle}")
-                return
+                self._emitir(logging.WARNING, "❌ RECHAZADO (ESTRICTO): %s", detalle)
+                return Resultado(RECHAZADO, 0, saldo_antes)
 
         elif modo == "parcial":
             # Regla: Aplicar la mayor cantidad posible manteniendo saldo_final >= umbral_min_litros
@@ -278,8 +429,8 @@ class ParcelaConRiego(Parcela):
             if max_aplicable <= 0:
                 detalle = f"Riego PARCIAL RECHAZADO. Saldo disponible ({saldo_antes:.2f} L) es insuficiente para mantener el umbral ({self.__umbral_min_litros:.2f} L)."
                 self._registrar_evento("Riego Rechazado", detalle)
-                print(f"❌ RECHAZADO (PARCIAL): {detalle}")
-                return
+                self._emitir(logging.WARNING, "❌ RECHAZADO (PARCIAL): %s", detalle)
+                return Resultado(RECHAZADO, 0, saldo_antes)
                 
             litros_a_aplicar = min(demanda, max_aplicable)
             
@@ -290,24 +441,25 @@ class ParcelaConRiego(Parcela):
                 detalle = "Riego PARCIAL. Demanda cubierta (saldo final >= umbral)."
 
         else:
-            print("❌ Error: Modo de riego no válido. Use 'estricto' o 'parcial'.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: Modo de riego no válido. Use 'estricto' o 'parcial'.")
+            return Resultado(INVALIDO, 0, saldo_antes)
 
         # Aplicar el riego (solo si litros_a_aplicar > 0)
         if litros_a_aplicar > 0:
-            self.__litros_disponibles -= litros_a_aplicar
-            saldo_despues = self.__litros_disponibles
+            saldo_despues = saldo_antes - litros_a_aplicar
             
             # Asegurar la regla: Saldo nunca puede quedar negativo
             if saldo_despues < 0: 
                 # Esto no debería ocurrir con la lógica parcial/estricta, pero es una salvaguarda.
-                self.__litros_disponibles = 0.0
                 saldo_despues = 0.0
+            self._fijar_saldo(saldo_despues)
                 
             self._registrar_evento_riego("Riego OK", detalle, saldo_antes, saldo_despues,
                                          demanda, litros_a_aplicar, modo)
-            print(f"💧 RIEGO EXITOSO ({modo.upper()}): Aplicados {litros_a_aplicar:.2f} L. Saldo restante: {saldo_despues:.2f} L.")
+            self._emitir(logging.INFO, "💧 RIEGO EXITOSO (%s): Aplicados %.2f L. Saldo restante: %.2f L.", modo.upper(), litros_a_aplicar, saldo_despues)
+            return Resultado(PARCIAL if litros_a_aplicar < demanda else OK, litros_a_aplicar, saldo_despues)
         else:
-            print("ℹ️ Riego no aplicado (0 L). Se cumplen las condiciones, pero la cantidad a aplicar es cero.")
+            self._emitir(logging.INFO, "ℹ️ Riego no aplicado (0 L). Se cumplen las condiciones, pero la cantidad a aplicar es cero.")
+            return Resultado(SIN_CAMBIOS, 0, saldo_antes)
 
     
\ No newline at end of file
@@ -0,0 +1,175 @@
+from typing import Dict, List
+
+import numpy as np
+
+from ejercicio1.desarrollo import ParcelaConRiego
+
+
+def calcular_riego(estricto: np.ndarray, parcial: np.ndarray, demanda: np.ndarray,
+                   saldo: np.ndarray, umbral: np.ndarray):
+    # Reglas de regar_automatico para muchas parcelas a la vez. 'estricto' y 'parcial' son
+    # máscaras con las parcelas que riegan en cada modo. Devuelve (litros aplicados, rechazadas).
+    cubre = saldo - demanda >= umbral
+    max_aplicable = saldo - umbral
+    con_margen = max_aplicable > 0
+
+    aplicados = np.where(estricto & cubre, demanda, 0.0)
+    aplicados = np.where(parcial & con_margen, np.minimum(demanda, max_aplicable), aplicados)
+    rechazadas = (estricto & ~cubre) | (parcial & ~con_margen)
+    return aplicados, rechazadas
+
+# Motor de riego por lotes: mantiene los datos de muchas parcelas en columnas NumPy
+# y aplica las reglas "estricto" / "parcial" a toda la flota en una sola pasada.
+# Las columnas se mantienen al día por suscripción: cada cambio de una parcela (cargar_agua,
+# desactivar, configurar_tasa, etc.) actualiza solo su celda, así que regar_lote no vuelve a
+# recorrer las parcelas. desvincular() cancela las suscripciones.
+class FlotaRiego:
+    def __init__(self, parcelas: List[ParcelaConRiego]):
+        self.__parcelas: List[ParcelaConRiego] = list(parcelas)
+        # id(parcela) -> posiciones en las columnas (una parcela puede repetirse en la lista)
+        self.__posiciones: Dict[int, List[int]] = {}
+        for i, parcela in enumerate(self.__parcelas):
+            self.__posiciones.setdefault(id(parcela), []).append(i)
+        self.sincronizar()
+        for parcela in self._parcelas_unicas():
+            parcela.suscribir(self._al_cambiar)
+
+    # --- Propiedades (Getters) ---
+    @property
+    def parcelas(self) -> List[ParcelaConRiego]:
+        return list(self.__parcelas)
+
+    @property
+    def superficie(self) -> np.ndarray:
+        return self.__superficie
+
+    @property
+    def tasa(self) -> np.ndarray:
+        return self.__tasa
+
+    @property
+    def umbral(self) -> np.ndarray:
+        return self.__umbral
+
+    @property
+    def saldo(self) -> np.ndarray:
+        return self.__saldo
+
+    def __len__(self):
+        return len(self.__parcelas)
+
+    # --- Operaciones ---
+
+    def sincronizar(self):
+        # Relee todas las columnas desde las parcelas (las suscripciones ya las mantienen al día)
+        parcelas = self.__parcelas
+        n = len(parcelas)
+        self.__superficie = np.fromiter((p.superficie_ha for p in parcelas), dtype=np.float64, count=n)
+        self.__tasa = np.fromiter((p.tasa_riego_l_ha for p in parcelas), dtype=np.float64, count=n)
+        self.__umbral = np.fromiter((p.umbral_min_litros for p in parcelas), dtype=np.float64, count=n)
+        self.__saldo = np.fromiter((p.litros_disponibles for p in parcelas), dtype=np.float64, count=n)
+        self.__activa = np.fromiter((p.estado == "activa" for p in parcelas), dtype=bool, count=n)
+        self.__riego_habilitado = np.fromiter((p.estado_riego == "habilitado" for p in parcelas),
+                                              dtype=bool, count=n)
+
+    def regar_lote(self, modo: str) -> np.ndarray:
+        # Devuelve los litros aplicados por parcela (0.0 si fue rechazada).
+        modo = modo.lower()
+        if modo not in ParcelaConRiego.MODOS_RIEGO:
+            raise ValueError("Modo de riego no válido. Use 'estricto' o 'parcial'.")
+
+        # --- Reglas de Negocio - Prohibido regar si: ---
+        inactiva = ~self.__activa
+        inhabilitada = self.__activa & ~self.__riego_habilitado
+        sin_tasa = self.__activa & self.__riego_habilitado & (self.__tasa <= 0)
+        apta = self.__activa & self.__riego_habilitado & (self.__tasa > 0)
+
+        demanda = self.__superficie * self.__tasa
+        saldo_antes = self.__saldo.copy()
+
+        ninguna = np.zeros(len(apta), dtype=bool)
+        if modo == "estricto":
+            aplicados, rechazadas = calcular_riego(apta, ninguna, demanda, saldo_antes, self.__umbral)
+        else:
+            aplicados, rechazadas = calcular_riego(ninguna, apta, demanda, saldo_antes, self.__umbral)
+
+        # Salvaguarda: el saldo nunca puede quedar negativo
+        self.__saldo = np.maximum(saldo_antes - aplicados, 0.0)
+
+        self._escribir_resultados(modo, inactiva, inhabilitada, sin_tasa, rechazadas,
+                                  aplicados, demanda, saldo_antes)
+        return aplicados
+
+    def desvincular(self):
+        # Deja de seguir los cambios de las parcelas (las columnas quedan como estaban)
+        for parcela in self._parcelas_unicas():
+            parcela.desuscribir(self._al_cambiar)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _parcelas_unicas(self) -> List[ParcelaConRiego]:
+        return [self.__parcelas[posiciones[0]] for posiciones in self.__posiciones.values()]
+
+    def _al_cambiar(self, parcela: ParcelaConRiego, campo: str, valor_anterior, valor_nuevo):
+        if campo == "litros_disponibles":
+            columna, valor = self.__saldo, valor_nuevo
+        elif campo == "estado":
+            columna, valor = self.__activa, valor_nuevo == "activa"
+        elif campo == "estado_riego":
+            columna, valor = self.__riego_habilitado, valor_nuevo == "habilitado"
+        elif campo == "umbral_min_litros":
+            columna, valor = self.__umbral, valor_nuevo
+        elif campo == "tasa_riego_l_ha":
+            columna, valor = self.__tasa, valor_nuevo
+        elif campo == "superficie_ha":
+            columna, valor = self.__superficie, valor_nuevo
+        else:
+            return
+        for i in self.__posiciones[id(parcela)]:
+            columna[i] = valor
+
+    def _escribir_resultados(self, modo: str, inactiva: np.ndarray, inhabilitada: np.ndarray,
+                             sin_tasa: np.ndarray, rechazadas: np.ndarray, aplicados: np.ndarray,
+                             demanda: np.ndarray, saldo_antes: np.ndarray):
+        # Solo se recorren las parcelas afectadas para volcar los eventos a cada objeto
+        parcelas = self.__parcelas
+
+        for i in np.flatnonzero(inactiva):
+            parcelas[i]._registrar_evento("Riego Rechazado", "Parcela inactiva.", silent=True)
+        for i in np.flatnonzero(inhabilitada):
+            parcelas[i]._registrar_evento("Riego Rechazado", "Sistema de riego inhabilitado.", silent=True)
+        for i in np.flatnonzero(sin_tasa):
+            parcelas[i]._registrar_evento("Riego Rechazado", "Tasa de riego <= 0.", silent=True)
+
+        umbral = self.__umbral
+        for i in np.flatnonzero(rechazadas):
+            if modo == "estricto":
+                detalle = (f"Riego ESTRICTO RECHAZADO. Saldo final ({saldo_antes[i] - demanda[i]:.2f} L) "
+                           f"< Umbral ({umbral[i]:.2f} L).")
+            else:
+                detalle = (f"Riego PARCIAL RECHAZADO. Saldo disponible ({saldo_antes[i]:.2f} L) es insuficiente "
+                           f"para mantener el umbral ({umbral[i]:.2f} L).")
+            parcelas[i]._registrar_evento("Riego Rechazado", detalle, silent=True)
+
+        saldo = self.__saldo
+        for i in np.flatnonzero(aplicados > 0):
+            litros = float(aplicados[i])
+            if modo == "estricto":
+                detalle = "Riego ESTRICTO: Demanda cubierta."
+            elif litros < demanda[i]:
+                detalle = (f"Riego PARCIAL. Solo se aplicaron {litros:.2f} L de una demanda de {demanda[i]:.2f} L "
+                           f"(Máx. aplicable: {saldo_antes[i] - umbral[i]:.2f} L para mantener umbral "
+                           f"de {umbral[i]:.2f} L).")
+            else:
+                detalle = "Riego PARCIAL. Demanda cubierta (saldo final >= umbral)."
+            parcelas[i]._aplicar_riego_lote(float(saldo_antes[i]), float(saldo[i]), float(demanda[i]),
+                                            litros, modo, detalle)
+
+
+def regar_lote(parcelas: List[ParcelaConRiego], modo: str) -> np.ndarray:
+    # Atajo para un único ciclo de riego sobre una lista de parcelas
+    flota = FlotaRiego(parcelas)
+    try:
+        return flota.regar_lote(modo)
+    finally:
+        flota.desvincular()
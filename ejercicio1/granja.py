@@ -0,0 +1,57 @@
+from typing import Dict, List
+
+from ejercicio1.desarrollo import ParcelaConRiego
+
+# Agrupa las parcelas de una granja y mantiene el total de demanda de agua al día.
+# Las parcelas notifican sus cambios de demanda (rectificar_superficie, configurar_tasa),
+# por lo que consultar el total es O(1) en lugar de recorrer todas las parcelas.
+class Granja:
+    def __init__(self, nombre: str):
+        if not nombre or nombre.strip() == "":
+            raise ValueError("El nombre de la granja no puede estar vacío.")
+        self.__nombre = nombre.strip()
+        self.__parcelas: Dict[str, ParcelaConRiego] = {}
+        self.__demanda_total = 0.0
+
+    # --- Propiedades (Getters) ---
+    @property
+    def nombre(self) -> str:
+        return self.__nombre
+
+    @property
+    def parcelas(self) -> List[ParcelaConRiego]:
+        return list(self.__parcelas.values())
+
+    @property
+    def demanda_total(self) -> float:
+        # Litros necesarios para un riego completo de todas las parcelas
+        return self.__demanda_total
+
+    def __len__(self):
+        return len(self.__parcelas)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _al_cambiar(self, parcela: ParcelaConRiego, campo: str, valor_anterior, valor_nuevo):
+        if campo == "demanda_litros":
+            self.__demanda_total += valor_nuevo - valor_anterior
+
+    # --- Operaciones ---
+
+    def agregar(self, parcela: ParcelaConRiego):
+        if parcela.id_parcela in self.__parcelas:
+            raise ValueError(f"La parcela '{parcela.id_parcela}' ya pertenece a la granja.")
+        self.__parcelas[parcela.id_parcela] = parcela
+        self.__demanda_total += parcela.demanda_litros
+        parcela.suscribir(self._al_cambiar)
+
+    def quitar(self, id_parcela: str) -> ParcelaConRiego:
+        parcela = self.__parcelas.pop(id_parcela)
+        parcela.desuscribir(self._al_cambiar)
+        self.__demanda_total -= parcela.demanda_litros
+        return parcela
+
+    def recalcular(self) -> float:
+        # Recalcula el total desde cero (corrige el error de redondeo acumulado)
+        self.__demanda_total = sum(p.demanda_litros for p in self.__parcelas.values())
+        return self.__demanda_total
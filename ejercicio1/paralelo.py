@@ -0,0 +1,137 @@
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from comun.almacen_eventos import campos_evento, materializar_evento
+from comun.salida import SILENCIOSO, configurar_salida, salida
+from ejercicio1.desarrollo import Evento, EventoRiego, Parcela, ParcelaConRiego
+
+# Ejecución en paralelo de secuencias de riego sobre parcelas independientes.
+#
+# Las parcelas se reparten en fragmentos, uno por proceso. Cada proceso recibe solo el estado
+# mínimo de sus parcelas (tuplas), las reconstruye, ejecuta las operaciones y devuelve los
+# eventos nuevos en columnas (array/listas), nunca como objetos Evento sueltos. El proceso
+# principal vuelca los eventos en las parcelas originales y arma la línea de tiempo unificada.
+
+OPERACIONES_PERMITIDAS = ("cargar_agua", "regar_automatico")
+
+Operacion = Tuple[str, object]  # p. ej. ("cargar_agua", 500.0) o ("regar_automatico", "parcial")
+
+_CAMPOS_RIEGO = campos_evento(EventoRiego)
+_CAMPOS_GENERALES = campos_evento(Evento)
+
+
+def _estado_compacto(parcela: ParcelaConRiego) -> tuple:
+    return (parcela.id_parcela, parcela.superficie_ha, parcela.cultivo_actual, parcela.tasa_riego_l_ha,
+            parcela.estado, parcela.estado_riego, parcela.umbral_min_litros, parcela.litros_disponibles)
+
+
+def _a_columnas(eventos_por_parcela: List[list], campos: Tuple[str, ...]) -> tuple:
+    # (índice de parcela, marcas, una columna por campo); los float van en array('d')
+    indices, marcas = array("l"), array("d")
+    columnas = [None] * len(campos)
+    for indice, eventos in enumerate(eventos_por_parcela):
+        for evento in eventos:
+            indices.append(indice)
+            marcas.append(evento.marca_tiempo)
+            for c, campo in enumerate(campos):
+                valor = getattr(evento, campo)
+                if columnas[c] is None:
+                    columnas[c] = array("d") if isinstance(valor, float) else []
+                columnas[c].append(valor)
+    return indices, marcas, [columna if columna is not None else [] for columna in columnas]
+
+
+def _desde_columnas(clase, campos: Tuple[str, ...], indices, marcas, columnas, n_parcelas: int) -> List[list]:
+    eventos_por_parcela: List[list] = [[] for _ in range(n_parcelas)]
+    for fila, (indice, marca) in enumerate(zip(indices, marcas)):
+        valores = [columna[fila] for columna in columnas]
+        eventos_por_parcela[indice].append(materializar_evento(clase, campos, marca, valores))
+    return eventos_por_parcela
+
+
+def _inicializar_trabajador():
+    # Inicializador del pool: sin salida por consola ni almacén compartido en los trabajadores
+    configurar_salida(SILENCIOSO)
+    Parcela.almacen_eventos = None
+
+
+def _procesar_en_proceso(argumentos: List[tuple]) -> List[tuple]:
+    # Mismo entorno que en un trabajador, pero la política y el almacén son los del llamador:
+    # se guardan y se restauran al terminar
+    almacen_previo = Parcela.almacen_eventos
+    Parcela.almacen_eventos = None
+    try:
+        with salida(SILENCIOSO):
+            return [_procesar_fragmento(*args) for args in argumentos]
+    finally:
+        Parcela.almacen_eventos = almacen_previo
+
+
+def _procesar_fragmento(estados: List[tuple], operaciones: Sequence[Operacion],
+                        por_parcela: Dict[str, Sequence[Operacion]]) -> tuple:
+    # Se ejecuta en el proceso trabajador (o en el propio proceso vía _procesar_en_proceso)
+    saldos = array("d")
+    riego: List[list] = []
+    generales: List[list] = []
+    for id_parcela, superficie, cultivo, tasa, estado, estado_riego, umbral, saldo in estados:
+        parcela = ParcelaConRiego(id_parcela, superficie, cultivo, tasa)
+        parcela._restaurar_estado_riego(estado, estado_riego, umbral, saldo)
+        n_previos = len(parcela.historial_eventos)
+
+        for nombre, argumento in por_parcela.get(id_parcela, operaciones):
+            getattr(parcela, nombre)(argumento)
+
+        saldos.append(parcela.litros_disponibles)
+        riego.append(list(parcela.eventos_riego))
+        generales.append(list(parcela.historial_eventos[n_previos:]))
+
+    return saldos, _a_columnas(riego, _CAMPOS_RIEGO), _a_columnas(generales, _CAMPOS_GENERALES)
+
+
+def _validar_operaciones(operaciones: Sequence[Operacion]):
+    for nombre, _ in operaciones:
+        if nombre not in OPERACIONES_PERMITIDAS:
+            raise ValueError(f"Operación no permitida en paralelo: '{nombre}'. "
+                             f"Use una de: {', '.join(OPERACIONES_PERMITIDAS)}.")
+
+
+def ejecutar_en_paralelo(parcelas: List[ParcelaConRiego], operaciones: Sequence[Operacion],
+                         por_parcela: Optional[Dict[str, Sequence[Operacion]]] = None,
+                         procesos: Optional[int] = None) -> List[Tuple[str, EventoRiego]]:
+    # Ejecuta 'operaciones' (o la secuencia propia de 'por_parcela') sobre cada parcela y
+    # actualiza las parcelas originales. Devuelve los eventos de riego nuevos de todas las
+    # parcelas, ordenados por fecha, como (id_parcela, EventoRiego).
+    por_parcela = por_parcela or {}
+    _validar_operaciones(operaciones)
+    for secuencia in por_parcela.values():
+        _validar_operaciones(secuencia)
+
+    procesos = procesos or os.cpu_count() or 1
+    tamanio = max(1, -(-len(parcelas) // procesos))
+    fragmentos = [parcelas[i:i + tamanio] for i in range(0, len(parcelas), tamanio)]
+    argumentos = [([_estado_compacto(p) for p in fragmento],
+                   operaciones,
+                   {p.id_parcela: por_parcela[p.id_parcela] for p in fragmento if p.id_parcela in por_parcela})
+                  for fragmento in fragmentos]
+
+    if procesos == 1 or len(fragmentos) <= 1:
+        salidas = _procesar_en_proceso(argumentos)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador) as pool:
+            salidas = list(pool.map(_procesar_fragmento, *zip(*argumentos)))
+
+    lineas_de_tiempo = []
+    for fragmento, (saldos, columnas_riego, columnas_generales) in zip(fragmentos, salidas):
+        riego = _desde_columnas(EventoRiego, _CAMPOS_RIEGO, *columnas_riego, len(fragmento))
+        generales = _desde_columnas(Evento, _CAMPOS_GENERALES, *columnas_generales, len(fragmento))
+        linea = []
+        for parcela, saldo, eventos_riego, eventos_generales in zip(fragmento, saldos, riego, generales):
+            parcela._incorporar_eventos_riego(eventos_riego, eventos_generales, saldo)
+            linea.extend((parcela.id_parcela, evento) for evento in eventos_riego)
+        linea.sort(key=lambda par: par[1].marca_tiempo)
+        lineas_de_tiempo.append(linea)
+
+    return list(heapq.merge(*lineas_de_tiempo, key=lambda par: par[1].marca_tiempo))
@@ -0,0 +1,79 @@
+import heapq
+import logging
+from typing import List, Tuple
+
+from comun.resultado import Resultado
+from comun.salida import politica_actual
+from ejercicio1.desarrollo import ParcelaConRiego
+
+# Planificador de riego: reparte una reserva de agua compartida entre muchas parcelas.
+# En cada ciclo las parcelas se atienden en orden de déficit (la más necesitada primero)
+# usando un heap, por lo que un ciclo cuesta O(n log n) sin reordenar listas completas.
+class PlanificadorRiego:
+    def __init__(self, parcelas: List[ParcelaConRiego], reserva_litros: float = 0.0):
+        if reserva_litros < 0:
+            raise ValueError("La reserva de agua no puede ser negativa.")
+        self.__parcelas: List[ParcelaConRiego] = list(parcelas)
+        self.__reserva_litros = reserva_litros
+
+    # --- Propiedades (Getters) ---
+    @property
+    def parcelas(self) -> List[ParcelaConRiego]:
+        return list(self.__parcelas)
+
+    @property
+    def reserva_litros(self) -> float:
+        return self.__reserva_litros
+
+    # --- Métodos Auxiliares Internos ---
+
+    @staticmethod
+    def deficit(parcela: ParcelaConRiego) -> float:
+        # Litros que faltan para cubrir la demanda manteniendo el umbral mínimo:
+        # demanda - (saldo - umbral). Si es <= 0 la parcela puede regar sin recibir agua.
+        return parcela.demanda_litros - (parcela.litros_disponibles - parcela.umbral_min_litros)
+
+    def _armar_heap(self) -> List[Tuple[float, int]]:
+        # Solo entran las parcelas que pueden regar (activas y con riego habilitado)
+        heap = [(-self.deficit(p), i) for i, p in enumerate(self.__parcelas)
+                if p.estado == "activa" and p.estado_riego == "habilitado"]
+        heapq.heapify(heap)
+        return heap
+
+    # --- Operaciones ---
+
+    def agregar_parcela(self, parcela: ParcelaConRiego):
+        self.__parcelas.append(parcela)
+
+    def recargar_reserva(self, litros: float):
+        if litros <= 0:
+            raise ValueError("La recarga de la reserva debe ser positiva.")
+        self.__reserva_litros += litros
+
+    def ejecutar_ciclo(self, modo: str) -> List[Tuple[str, Resultado]]:
+        # Atiende a las parcelas en orden de déficit: les transfiere agua de la reserva
+        # y luego ejecuta regar_automatico. Devuelve (id_parcela, Resultado) en ese orden.
+        modo = modo.lower()
+        if modo not in ParcelaConRiego.MODOS_RIEGO:
+            raise ValueError("Modo de riego no válido. Use 'estricto' o 'parcial'.")
+
+        resultados: List[Tuple[str, Resultado]] = []
+        heap = self._armar_heap()
+        while heap:
+            deficit_negativo, i = heapq.heappop(heap)
+            parcela = self.__parcelas[i]
+            deficit = -deficit_negativo
+
+            if deficit > 0 and self.__reserva_litros > 0:
+                # En modo estricto solo se transfiere si la reserva cubre todo el déficit;
+                # de lo contrario el agua quedaría en el depósito sin poder usarse.
+                if modo == "parcial" or self.__reserva_litros >= deficit:
+                    asignados = min(deficit, self.__reserva_litros)
+                    self.__reserva_litros -= asignados
+                    parcela.cargar_agua(asignados)
+
+            resultados.append((parcela.id_parcela, parcela.regar_automatico(modo)))
+
+        politica_actual().emitir(logging.INFO, "💧 Ciclo de riego (%s): %s parcelas atendidas. Reserva restante: %.2f L.",
+                                 modo, len(resultados), self.__reserva_litros)
+        return resultados
@@ -0,0 +1,111 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+from ejercicio1.desarrollo import ParcelaConRiego
+from ejercicio1.flota import calcular_riego
+
+# Códigos internos de modo por parcela
+_SIN_RIEGO, _ESTRICTO, _PARCIAL = 0, 1, 2
+_CODIGOS_MODO = {"estricto": _ESTRICTO, "parcial": _PARCIAL}
+
+
+# Programa de un día: recargas por parcela y modo de riego (general y/o por parcela).
+# Las parcelas sin modo asignado ese día no riegan. Los valores por defecto son mapeos de solo
+# lectura: todos los programas los comparten, así que no deben poder modificarse.
+class ProgramaDia(NamedTuple):
+    recargas: Mapping[str, float] = MappingProxyType({})
+    modos: Mapping[str, str] = MappingProxyType({})
+    modo_general: Optional[str] = None
+
+
+# Fila compacta equivalente a un EventoRiego, con el día simulado en lugar de la fecha
+class FilaRiego(NamedTuple):
+    dia: int
+    id_parcela: str
+    tipo: str  # "Carga", "Riego OK" o "Riego Rechazado"
+    modo: str
+    saldo_antes: float
+    litros_solicitados: float
+    litros_aplicados: float
+    saldo_despues: float
+
+
+# Simulador de uso de agua por temporada. Trabaja sobre una copia en columnas del estado de
+# las parcelas (no las modifica) y entrega los resultados como un generador, de modo que la
+# memoria depende del número de parcelas y no de la cantidad de días simulados.
+class SimuladorRiego:
+    def __init__(self, parcelas: List[ParcelaConRiego]):
+        n = len(parcelas)
+        self.__ids: List[str] = [p.id_parcela for p in parcelas]
+        self.__indices: Dict[str, int] = {id_parcela: i for i, id_parcela in enumerate(self.__ids)}
+        self.__demanda = np.fromiter((p.demanda_litros for p in parcelas), dtype=np.float64, count=n)
+        self.__umbral = np.fromiter((p.umbral_min_litros for p in parcelas), dtype=np.float64, count=n)
+        self.__saldo = np.fromiter((p.litros_disponibles for p in parcelas), dtype=np.float64, count=n)
+        self.__apta = np.fromiter((p.estado == "activa" and p.estado_riego == "habilitado"
+                                   and p.tasa_riego_l_ha > 0 for p in parcelas), dtype=bool, count=n)
+        self.__dia = 0
+
+    # --- Propiedades (Getters) ---
+    @property
+    def dia(self) -> int:
+        # Próximo día a simular
+        return self.__dia
+
+    @property
+    def saldo(self) -> np.ndarray:
+        return self.__saldo.copy()
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _codigo_modo(self, modo: str) -> int:
+        codigo = _CODIGOS_MODO.get(modo.lower())
+        if codigo is None:
+            raise ValueError(f"Modo de riego no válido: '{modo}'. Use 'estricto' o 'parcial'.")
+        return codigo
+
+    def _paso(self, programa: ProgramaDia) -> Iterator[FilaRiego]:
+        dia = self.__dia
+        ids, saldo = self.__ids, self.__saldo
+
+        for id_parcela, litros in programa.recargas.items():
+            if litros <= 0:
+                continue
+            i = self.__indices[id_parcela]
+            saldo_antes = float(saldo[i])
+            saldo[i] += litros
+            yield FilaRiego(dia, id_parcela, "Carga", "Carga", saldo_antes, 0.0, litros, float(saldo[i]))
+
+        modos = np.full(len(ids), _SIN_RIEGO, dtype=np.int8)
+        if programa.modo_general is not None:
+            modos[:] = self._codigo_modo(programa.modo_general)
+        for id_parcela, modo in programa.modos.items():
+            modos[self.__indices[id_parcela]] = self._codigo_modo(modo)
+
+        estricto = self.__apta & (modos == _ESTRICTO)
+        parcial = self.__apta & (modos == _PARCIAL)
+        if not (estricto.any() or parcial.any()):
+            return
+
+        saldo_antes = saldo.copy()
+        aplicados, rechazadas = calcular_riego(estricto, parcial, self.__demanda, saldo_antes, self.__umbral)
+        np.maximum(saldo_antes - aplicados, 0.0, out=saldo)
+
+        # Se extraen las columnas de las parcelas afectadas de una vez (tolist) en lugar
+        # de leer escalares NumPy fila por fila
+        indices = np.flatnonzero((aplicados > 0) | rechazadas)
+        columnas = zip(indices.tolist(), (modos[indices] == _ESTRICTO).tolist(), rechazadas[indices].tolist(),
+                       saldo_antes[indices].tolist(), self.__demanda[indices].tolist(),
+                       aplicados[indices].tolist(), saldo[indices].tolist())
+        for i, es_estricto, rechazada, antes, demanda, litros, despues in columnas:
+            yield FilaRiego(dia, ids[i], "Riego Rechazado" if rechazada else "Riego OK",
+                            "estricto" if es_estricto else "parcial", antes, demanda, litros, despues)
+
+    # --- Operaciones ---
+
+    def simular(self, programa: Iterable[ProgramaDia]) -> Iterator[FilaRiego]:
+        # 'programa' puede ser a su vez un generador (un ProgramaDia por día)
+        for programa_dia in programa:
+            yield from self._paso(programa_dia)
+            self.__dia += 1
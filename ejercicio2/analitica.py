@@ -0,0 +1,101 @@
+from typing import Dict, List
+
+from ejercicio2.desarrollo2 import Libro
+
+# Estadísticas de progreso de lectura del club. Los agregados se actualizan en cada
+# Libro.leer (vía suscripción), así que el resumen es O(1) y el histograma O(bandas),
+# sin llamar a consultar_progreso() libro por libro.
+class AnaliticaProgreso:
+    def __init__(self, bandas: int = 10):
+        if bandas < 1:
+            raise ValueError("La cantidad de bandas debe ser al menos 1.")
+        self.__bandas = bandas
+        self.__libros: Dict[str, Libro] = {}
+        self.__paginas_totales = 0
+        self.__paginas_leidas = 0
+        self.__completados = 0
+        self.__suma_fracciones = 0.0  # Suma de paginas_leidas / paginas_totales por libro
+        self.__histograma: List[int] = [0] * bandas
+
+    # --- Propiedades (Getters) ---
+    @property
+    def bandas(self) -> int:
+        return self.__bandas
+
+    @property
+    def total_libros(self) -> int:
+        return len(self.__libros)
+
+    @property
+    def paginas_totales(self) -> int:
+        return self.__paginas_totales
+
+    @property
+    def paginas_leidas(self) -> int:
+        return self.__paginas_leidas
+
+    @property
+    def completados(self) -> int:
+        return self.__completados
+
+    @property
+    def progreso_medio(self) -> float:
+        # Promedio de los porcentajes de cada libro
+        if not self.__libros:
+            return 0.0
+        return round(self.__suma_fracciones / len(self.__libros) * 100, 2)
+
+    @property
+    def progreso_global(self) -> float:
+        # Porcentaje de páginas leídas sobre el total de páginas del club
+        if self.__paginas_totales == 0:
+            return 0.0
+        return round(self.__paginas_leidas / self.__paginas_totales * 100, 2)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _banda(self, paginas_leidas: int, paginas_totales: int) -> int:
+        # Banda i = [i*100/bandas, (i+1)*100/bandas) %; los libros completos van en la última
+        return min(paginas_leidas * self.__bandas // paginas_totales, self.__bandas - 1)
+
+    def _sumar(self, paginas_leidas: int, paginas_totales: int, signo: int):
+        self.__paginas_leidas += signo * paginas_leidas
+        self.__suma_fracciones += signo * paginas_leidas / paginas_totales
+        self.__histograma[self._banda(paginas_leidas, paginas_totales)] += signo
+        if paginas_leidas == paginas_totales:
+            self.__completados += signo
+
+    def _al_cambiar(self, libro: Libro, campo: str, valor_anterior, valor_nuevo):
+        if campo == "paginas_leidas":
+            self._sumar(valor_anterior, libro.paginas_totales, -1)
+            self._sumar(valor_nuevo, libro.paginas_totales, +1)
+
+    # --- Operaciones ---
+
+    def agregar(self, libro: Libro):
+        if libro.id_publicacion in self.__libros:
+            raise ValueError(f"El libro '{libro.id_publicacion}' ya está registrado.")
+        self.__libros[libro.id_publicacion] = libro
+        self.__paginas_totales += libro.paginas_totales
+        self._sumar(libro.paginas_leidas, libro.paginas_totales, +1)
+        libro.suscribir(self._al_cambiar)
+
+    def quitar(self, id_publicacion: str) -> Libro:
+        libro = self.__libros.pop(id_publicacion)
+        libro.desuscribir(self._al_cambiar)
+        self.__paginas_totales -= libro.paginas_totales
+        self._sumar(libro.paginas_leidas, libro.paginas_totales, -1)
+        return libro
+
+    def histograma(self) -> List[int]:
+        return list(self.__histograma)
+
+    def resumen(self) -> Dict:
+        return {
+            "total_libros": self.total_libros,
+            "paginas_totales": self.__paginas_totales,
+            "paginas_leidas": self.__paginas_leidas,
+            "completados": self.__completados,
+            "progreso_medio": self.progreso_medio,
+            "progreso_global": self.progreso_global,
+        }
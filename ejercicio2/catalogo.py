@@ -0,0 +1,89 @@
+from itertools import takewhile
+from typing import Dict, Iterable, List, Optional
+
+from comun.lista_bloques import ListaPorBloques
+from ejercicio2.desarrollo2 import Publicacion
+
+# Catálogo del club de lectura. Es dueño de las publicaciones y mantiene tres índices:
+# - por id (dict): búsqueda O(1)
+# - por año (ListaPorBloques de (anio, id)): rangos en O(log n + k)
+# - por título (ListaPorBloques de (titulo normalizado, id)): búsqueda por prefijo en O(log n + k)
+# Los índices se actualizan solos cuando una publicación cambia de título o de año; cada cambio
+# solo desplaza un bloque del índice, no la lista completa.
+class Catalogo:
+    def __init__(self):
+        self.__por_id: Dict[str, Publicacion] = {}
+        self.__por_anio = ListaPorBloques()    # (anio, id)
+        self.__por_titulo = ListaPorBloques()  # (titulo normalizado, id)
+
+    # --- Propiedades (Getters) ---
+    def __len__(self):
+        return len(self.__por_id)
+
+    def __contains__(self, id_publicacion: str):
+        return id_publicacion in self.__por_id
+
+    # --- Métodos Auxiliares Internos ---
+
+    @staticmethod
+    def _normalizar(titulo: str) -> str:
+        return titulo.casefold()
+
+    def _al_cambiar(self, publicacion: Publicacion, campo: str, valor_anterior, valor_nuevo):
+        id_publicacion = publicacion.id_publicacion
+        if campo == "titulo":
+            self.__por_titulo.quitar((self._normalizar(valor_anterior), id_publicacion))
+            self.__por_titulo.agregar((self._normalizar(valor_nuevo), id_publicacion))
+        elif campo == "anio":
+            self.__por_anio.quitar((valor_anterior, id_publicacion))
+            self.__por_anio.agregar((valor_nuevo, id_publicacion))
+
+    # --- Operaciones ---
+
+    def agregar(self, publicacion: Publicacion):
+        id_publicacion = publicacion.id_publicacion
+        if id_publicacion in self.__por_id:
+            raise ValueError(f"La publicación '{id_publicacion}' ya está en el catálogo.")
+        self.__por_id[id_publicacion] = publicacion
+        self.__por_anio.agregar((publicacion.anio, id_publicacion))
+        self.__por_titulo.agregar((self._normalizar(publicacion.titulo), id_publicacion))
+        publicacion.suscribir(self._al_cambiar)
+
+    def cargar(self, publicaciones: Iterable[Publicacion]):
+        # Alta masiva: cada índice se ordena una sola vez (O(n log n)) en lugar de una alta por
+        # publicación. Si hay un id repetido no se agrega ninguna.
+        publicaciones = list(publicaciones)
+        nuevas: Dict[str, Publicacion] = {}
+        for publicacion in publicaciones:
+            id_publicacion = publicacion.id_publicacion
+            if id_publicacion in self.__por_id or id_publicacion in nuevas:
+                raise ValueError(f"La publicación '{id_publicacion}' ya está en el catálogo.")
+            nuevas[id_publicacion] = publicacion
+
+        self.__por_id.update(nuevas)
+        self.__por_anio.cargar((p.anio, p.id_publicacion) for p in publicaciones)
+        self.__por_titulo.cargar((self._normalizar(p.titulo), p.id_publicacion) for p in publicaciones)
+        for publicacion in publicaciones:
+            publicacion.suscribir(self._al_cambiar)
+
+    def quitar(self, id_publicacion: str) -> Publicacion:
+        publicacion = self.__por_id.pop(id_publicacion)
+        publicacion.desuscribir(self._al_cambiar)
+        self.__por_anio.quitar((publicacion.anio, id_publicacion))
+        self.__por_titulo.quitar((self._normalizar(publicacion.titulo), id_publicacion))
+        return publicacion
+
+    def buscar(self, id_publicacion: str) -> Optional[Publicacion]:
+        return self.__por_id.get(id_publicacion)
+
+    def por_rango_anio(self, desde: int, hasta: int) -> List[Publicacion]:
+        # Publicaciones con desde <= anio <= hasta, ordenadas por año
+        en_rango = takewhile(lambda clave: clave[0] <= hasta, self.__por_anio.desde((desde,)))
+        return [self.__por_id[id_publicacion] for _, id_publicacion in en_rango]
+
+    def por_prefijo_titulo(self, prefijo: str) -> List[Publicacion]:
+        # Búsqueda sin distinguir mayúsculas, ordenada alfabéticamente
+        prefijo = self._normalizar(prefijo.strip())
+        coincidencias = takewhile(lambda clave: clave[0].startswith(prefijo),
+                                  self.__por_titulo.desde((prefijo,)))
+        return [self.__por_id[id_publicacion] for _, id_publicacion in coincidencias]
@@ -1,8 +1,21 @@
+from __future__ import annotations
+
+import logging
+import time
+from array import array
 from datetime import datetime
-from typing import List
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from comun.almacen_eventos import AlmacenEventos
+from comun.resultado import Resultado, OK, PARCIAL, SIN_CAMBIOS, INVALIDO
+from comun.salida import PoliticaSalida, politica_actual
+from comun.textos import internar, internar_texto
+from comun.vistas import VistaSoloLectura
 
 class Publicacion:
     ANIO_MINIMO = 1450 # Regla de negocio: Inicio de la imprenta moderna
+    almacen_eventos: Optional[AlmacenEventos] = None
+    salida: Optional[PoliticaSalida] = None
 
     def __init__(self, id_publicacion: str, titulo: str, anio: int):
         # Atributos "privados" (encapsulados)
@@ -10,6 +23,7 @@ class Publicacion:
         self.__titulo = self._validar_titulo(titulo)
         self.__anio = self._validar_anio(anio)
         self.__historial_eventos: List[Evento] = []  # Solo lectura
+        self.__observadores: Optional[List[Callable]] = None  # Se crea al primer suscriptor
 
     # --- Propiedades (Getters) ---
     @property
@@ -25,51 +39,93 @@ class Publicacion:
         return self.__anio
     
     @property
-    def historial_eventos(self) -> List[Evento]:
-        return list(self.__historial_eventos)
+    def historial_eventos(self) -> Sequence[Evento]:
+        if self.almacen_eventos is not None:
+            return self.almacen_eventos.consultar(self.__id_publicacion)
+        return VistaSoloLectura(self.__historial_eventos)
 
     # --- Métodos Auxiliares Internos ---
     
+    def _emitir(self, nivel: int, mensaje: str, *args):
+        (self.salida or politica_actual()).emitir(nivel, mensaje, *args)
+
     def _registrar_evento(self, campo: str, valor_anterior: str, valor_nuevo: str):
-        self.__historial_eventos.append(Evento(campo, valor_anterior, valor_nuevo))
+        evento = Evento(campo, valor_anterior, valor_nuevo)
+        if self.almacen_eventos is not None:
+            self.almacen_eventos.agregar(self.__id_publicacion, evento)
+        else:
+            self.__historial_eventos.append(evento)
+
+    def _incorporar_historial(self, eventos: List[Evento]):
+        # Agrega eventos ya creados (p. ej. leídos de una instantánea), conservando su fecha
+        if self.almacen_eventos is not None:
+            for evento in eventos:
+                self.almacen_eventos.agregar(self.__id_publicacion, evento)
+        else:
+            self.__historial_eventos.extend(eventos)
+
+    def _notificar(self, campo: str, valor_anterior, valor_nuevo):
+        if self.__observadores:
+            for observador in self.__observadores:
+                observador(self, campo, valor_anterior, valor_nuevo)
             
     def _validar_titulo(self, titulo: str) -> str:
         if not titulo or titulo.strip() == "":
             raise ValueError("El título no puede estar vacío.")
-        return titulo.strip()
+        # Internado: las ediciones del mismo título y su historial comparten el texto
+        return internar_texto(titulo.strip())
 
     def _validar_anio(self, anio: int) -> int:
         if anio < self.ANIO_MINIMO:
             raise ValueError(f"El año debe ser igual o posterior a {self.ANIO_MINIMO} (Imprenta moderna).")
         return anio
 
+    # --- Suscripciones ---
+
+    def suscribir(self, observador: Callable):
+        # observador(publicacion, campo, valor_anterior, valor_nuevo)
+        if self.__observadores is None:
+            self.__observadores = []
+        self.__observadores.append(observador)
+
+    def desuscribir(self, observador: Callable):
+        if self.__observadores and observador in self.__observadores:
+            self.__observadores.remove(observador)
+
     # --- Operaciones ---
 
-    def actualizar_titulo(self, nuevo_titulo: str):
+    def actualizar_titulo(self, nuevo_titulo: str) -> Resultado:
         try:
             nuevo_titulo_validado = self._validar_titulo(nuevo_titulo)
         except ValueError as e:
-            print(f"❌ Error de validación de título: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de título: %s", e)
+            return Resultado(INVALIDO)
 
         titulo_previo = self.__titulo
         self.__titulo = nuevo_titulo_validado
         self._registrar_evento("titulo", titulo_previo, self.__titulo)
-        print(f"✅ Título actualizado a: '{self.__titulo}'")
+        self._notificar("titulo", titulo_previo, self.__titulo)
+        self._emitir(logging.INFO, "✅ Título actualizado a: '%s'", self.__titulo)
+        return Resultado(OK)
 
-    def actualizar_anio(self, nuevo_anio: int):
+    def actualizar_anio(self, nuevo_anio: int) -> Resultado:
         try:
             nuevo_anio_validado = self._validar_anio(nuevo_anio)
         except ValueError as e:
-            print(f"❌ Error de validación de año: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de año: %s", e)
+            return Resultado(INVALIDO, 0, self.__anio)
 
-        anio_previo = str(self.__anio)
+        anio_previo = self.__anio
         self.__anio = nuevo_anio_validado
-        self._registrar_evento("anio", anio_previo, str(self.__anio))
-        print(f"✅ Año actualizado a: {self.__anio}")
+        self._registrar_evento("anio", str(anio_previo), str(self.__anio))
+        self._notificar("anio", anio_previo, self.__anio)
+        self._emitir(logging.INFO, "✅ Año actualizado a: %s", self.__anio)
+        return Resultado(OK, self.__anio, self.__anio)
 
 class Libro(Publicacion):
+    # Si es True, los libros nuevos guardan eventos_lectura en arreglos tipados (LecturasCompactas)
+    lecturas_compactas: bool = False
+
     def __init__(self, id_publicacion: str, titulo: str, anio: int, paginas_totales: int):
         # Llama al constructor de la clase padre (Publicacion)
         super().__init__(id_publicacion, titulo, anio)
@@ -77,7 +133,7 @@ class Libro(Publicacion):
         # Atributos adicionales "privados"
         self.__paginas_totales = self._validar_paginas_totales(paginas_totales)
         self.__paginas_leidas = 0
-        self.__eventos_lectura: List[EventoLectura] = [] # Solo lectura
+        self.__eventos_lectura = LecturasCompactas() if self.lecturas_compactas else [] # Solo lectura
 
     # --- Propiedades (Getters) ---
     
@@ -92,8 +148,8 @@ class Libro(Publicacion):
         return self.__paginas_leidas
     
     @property
-    def eventos_lectura(self) -> List[EventoLectura]:
-        return list(self.__eventos_lectura)
+    def eventos_lectura(self) -> Sequence[EventoLectura]:
+        return VistaSoloLectura(self.__eventos_lectura)
     
     # --- Métodos Auxiliares Internos ---
     
@@ -103,28 +159,58 @@ class Libro(Publicacion):
         return paginas
 
     def _registrar_evento_lectura(self, paginas_leidas: int, acumulado: int):
-        self.__eventos_lectura.append(EventoLectura(paginas_leidas, acumulado))
+        if isinstance(self.__eventos_lectura, LecturasCompactas):
+            self.__eventos_lectura.agregar(time.time(), paginas_leidas, acumulado)
+        else:
+            self.__eventos_lectura.append(EventoLectura(paginas_leidas, acumulado))
+
+    def _aplicar_lecturas_lote(self, lecturas: List[EventoLectura]):
+        # Ingesta masiva: las lecturas ya vienen validadas y acotadas a las páginas restantes
+        if not lecturas:
+            return
+        paginas_previas = self.__paginas_leidas
+        self.__eventos_lectura.extend(lecturas)
+        self.__paginas_leidas = lecturas[-1].acumulado
+        self._notificar("paginas_leidas", paginas_previas, self.__paginas_leidas)
+
+    def _columnas_lecturas(self) -> tuple:
+        # (marcas, páginas, acumulados) de todas las lecturas, sin materializar eventos si es posible
+        lecturas = self.__eventos_lectura
+        if isinstance(lecturas, LecturasCompactas):
+            return lecturas.marcas, lecturas.paginas, lecturas.acumulados
+        return ([e.marca_tiempo for e in lecturas], [e.paginas_leidas for e in lecturas],
+                [e.acumulado for e in lecturas])
+
+    def _restaurar_lecturas(self, lecturas: Sequence[EventoLectura]):
+        # Reemplaza el registro de lecturas al reconstruir el libro, sin validar ni notificar.
+        # Acepta una lista de EventoLectura o un LecturasCompactas, que se adopta tal cual.
+        if isinstance(lecturas, LecturasCompactas) and self.lecturas_compactas:
+            self.__eventos_lectura = lecturas
+        else:
+            self.__eventos_lectura = LecturasCompactas() if self.lecturas_compactas else []
+            self.__eventos_lectura.extend(lecturas)
+        self.__paginas_leidas = lecturas[-1].acumulado if len(lecturas) else 0
 
     # --- Operaciones ---
 
-    def leer(self, paginas: int):
+    def leer(self, paginas: int) -> Resultado:
         # Regla: No se pueden leer páginas negativas
         if paginas <= 0:
-            print("❌ Error de lectura: La cantidad de páginas a leer debe ser positiva.")
-            return
+            self._emitir(logging.WARNING, "❌ Error de lectura: La cantidad de páginas a leer debe ser positiva.")
+            return Resultado(INVALIDO, 0, self.__paginas_leidas)
 
         paginas_restantes = self.__paginas_totales - self.__paginas_leidas
         
         # Regla: No se pueden leer más que las restantes
         if paginas > paginas_restantes:
-            print(f"❌ Rechazo de lectura: Solo quedan {paginas_restantes} páginas por leer (solicitadas: {paginas}).")
+            self._emitir(logging.WARNING, "❌ Rechazo de lectura: Solo quedan %s páginas por leer (solicitadas: %s).", paginas_restantes, paginas)
             
             # Se permite leer las restantes como un caso especial si la solicitud es excesiva
             paginas_a_leer = paginas_restantes
             if paginas_a_leer == 0:
-                print("ℹ️ El libro ya está completo.")
-                return
-            print(f"✅ Leyendo las {paginas_a_leer} páginas restantes para finalizar el libro.")
+                self._emitir(logging.INFO, "ℹ️ El libro ya está completo.")
+                return Resultado(SIN_CAMBIOS, 0, self.__paginas_leidas)
+            self._emitir(logging.INFO, "✅ Leyendo las %s páginas restantes para finalizar el libro.", paginas_a_leer)
         else:
             paginas_a_leer = paginas
 
@@ -133,10 +219,12 @@ class Libro(Publicacion):
         
         # Regla: Toda lectura queda registrada en eventos_lectura
         self._registrar_evento_lectura(paginas_a_leer, self.__paginas_leidas)
+        self._notificar("paginas_leidas", saldo_antes, self.__paginas_leidas)
         
         # Imprimir progreso
         progreso = self.consultar_progreso()
-        print(f"📖 Leídas {paginas_a_leer} páginas. Total leído: {self.__paginas_leidas}/{self.__paginas_totales} ({progreso:.2f}%)")
+        self._emitir(logging.INFO, "📖 Leídas %s páginas. Total leído: %s/%s (%.2f%%)", paginas_a_leer, self.__paginas_leidas, self.__paginas_totales, progreso)
+        return Resultado(PARCIAL if paginas_a_leer < paginas else OK, paginas_a_leer, self.__paginas_leidas)
 
 
     def consultar_progreso(self) -> float:
@@ -150,23 +238,112 @@ class Libro(Publicacion):
 
 # Clase auxiliar para guardar los eventos generales (historial_eventos)
 class Evento:
+    __slots__ = ("marca_tiempo", "campo", "valor_anterior", "valor_nuevo")
+
     def __init__(self, campo: str, valor_anterior: str, valor_nuevo: str):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.campo = campo
-        self.valor_anterior = valor_anterior
-        self.valor_nuevo = valor_nuevo
+        self.marca_tiempo = time.time()  # Epoch en segundos; se formatea solo al mostrar
+        self.campo = internar(campo)
+        self.valor_anterior = internar_texto(valor_anterior)
+        self.valor_nuevo = internar_texto(valor_nuevo)
+
+    @property
+    def fecha(self) -> str:
+        # El formateo se difiere hasta que alguien lo pide (__str__, exportación)
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
 
     def __str__(self):
         return f"[{self.fecha}] CAMBIO en '{self.campo}': De '{self.valor_anterior}' a '{self.valor_nuevo}'"
 
 # Clase auxiliar para guardar los eventos de lectura (eventos_lectura)
 class EventoLectura:
+    __slots__ = ("marca_tiempo", "paginas_leidas", "acumulado")
+
     def __init__(self, paginas_leidas: int, acumulado: int):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.marca_tiempo = time.time()
         self.paginas_leidas = paginas_leidas
         self.acumulado = acumulado
 
+    @property
+    def fecha(self) -> str:
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
+
     def __str__(self):
         return (f"[{self.fecha}] LECTURA: Leídas {self.paginas_leidas} páginas. "
                 f"Acumulado total: {self.acumulado}")
 
+# Almacenamiento compacto de eventos_lectura: (marca_tiempo, paginas_leidas, acumulado) en tres
+# arreglos tipados en lugar de un objeto por lectura. Los EventoLectura se materializan solo
+# cuando se accede a ellos, así que cada lectura ocupa 24 bytes en vez de un objeto completo.
+class LecturasCompactas(Sequence):
+    __slots__ = ("__marcas", "__paginas", "__acumulados")
+
+    def __init__(self):
+        self.__marcas = array("d")
+        self.__paginas = array("q")
+        self.__acumulados = array("q")
+
+    @classmethod
+    def desde_arreglos(cls, marcas: array, paginas: array, acumulados: array) -> LecturasCompactas:
+        # Adopta columnas ya armadas (p. ej. leídas de una instantánea) sin copiarlas
+        if not len(marcas) == len(paginas) == len(acumulados):
+            raise ValueError("Las columnas de lecturas deben tener el mismo largo.")
+        lecturas = cls()
+        lecturas.__marcas, lecturas.__paginas, lecturas.__acumulados = marcas, paginas, acumulados
+        return lecturas
+
+    # --- Propiedades (Getters) ---
+    @property
+    def marcas(self) -> array:
+        return self.__marcas
+
+    @property
+    def paginas(self) -> array:
+        return self.__paginas
+
+    @property
+    def acumulados(self) -> array:
+        return self.__acumulados
+
+    def __len__(self):
+        return len(self.__marcas)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._materializar(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de lectura fuera de rango.")
+        return self._materializar(indice)
+
+    def __iter__(self):
+        for marca, paginas, acumulado in zip(self.__marcas, self.__paginas, self.__acumulados):
+            yield self._crear(marca, paginas, acumulado)
+
+    # --- Métodos Auxiliares Internos ---
+
+    @staticmethod
+    def _crear(marca: float, paginas: int, acumulado: int) -> EventoLectura:
+        # Sin pasar por __init__, que tomaría la hora actual
+        evento = EventoLectura.__new__(EventoLectura)
+        evento.marca_tiempo = marca
+        evento.paginas_leidas = paginas
+        evento.acumulado = acumulado
+        return evento
+
+    def _materializar(self, indice: int) -> EventoLectura:
+        return self._crear(self.__marcas[indice], self.__paginas[indice], self.__acumulados[indice])
+
+    # --- Operaciones ---
+
+    def agregar(self, marca: float, paginas: int, acumulado: int):
+        self.__marcas.append(marca)
+        self.__paginas.append(paginas)
+        self.__acumulados.append(acumulado)
+
+    def append(self, evento: EventoLectura):
+        self.agregar(evento.marca_tiempo, evento.paginas_leidas, evento.acumulado)
+
+    def extend(self, eventos: Iterable[EventoLectura]):
+        for evento in eventos:
+            self.agregar(evento.marca_tiempo, evento.paginas_leidas, evento.acumulado)
@@ -0,0 +1,131 @@
+import csv
+import json
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Union
+
+from ejercicio2.catalogo import Catalogo
+from ejercicio2.desarrollo2 import EventoLectura, Libro
+
+# Ingesta masiva de sesiones de lectura subidas por los lectores electrónicos.
+#
+# Las sesiones se leen de a lotes desde CSV (encabezado id_publicacion,paginas[,marca_tiempo])
+# o NDJSON (un objeto JSON por línea con las mismas claves). Cada lote se agrupa por libro y
+# se aplica con una sola pasada de validación por libro, con las mismas reglas que Libro.leer:
+# se ignoran las cantidades <= 0 y lo que excede las páginas restantes se recorta.
+#
+# Una fila mal formada (sin id o páginas, valores no numéricos, JSON inválido) no corta la
+# ingesta: el lector entrega None en su lugar y aplicar_sesiones la cuenta como rechazada.
+
+FORMATOS = ("csv", "ndjson")
+
+
+class SesionLectura(NamedTuple):
+    id_publicacion: str
+    paginas: int
+    marca_tiempo: Optional[float] = None  # Epoch del dispositivo; si falta se usa la hora de ingesta
+
+
+class ResumenIngesta(NamedTuple):
+    sesiones: int
+    aplicadas: int
+    descartadas: int       # Libro desconocido, páginas <= 0 o libro ya completo
+    paginas_aplicadas: int
+    rechazadas: int = 0    # Filas mal formadas (no cuentan en 'sesiones')
+
+
+# --- Lectura de las fuentes ---
+
+def _sesion(registro: Dict) -> Optional[SesionLectura]:
+    # None si la fila está mal formada
+    try:
+        marca = registro.get("marca_tiempo")
+        id_publicacion = registro["id_publicacion"]
+        if id_publicacion is None:
+            return None
+        return SesionLectura(str(id_publicacion).strip(), int(registro["paginas"]),
+                             float(marca) if marca not in (None, "") else None)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def leer_csv(archivo: TextIO) -> Iterator[Optional[SesionLectura]]:
+    for registro in csv.DictReader(archivo):
+        yield _sesion(registro)
+
+
+def leer_ndjson(archivo: TextIO) -> Iterator[Optional[SesionLectura]]:
+    for linea in archivo:
+        if linea.strip():
+            try:
+                registro = json.loads(linea)
+            except ValueError:
+                yield None
+                continue
+            yield _sesion(registro)
+
+
+# --- Aplicación por lotes ---
+
+def _aplicar_libro(libro: Libro, sesiones: List[SesionLectura]) -> int:
+    # Misma lógica que Libro.leer, pero sin salida y creando los eventos de una vez
+    leidas = libro.paginas_leidas
+    totales = libro.paginas_totales
+    lecturas: List[EventoLectura] = []
+    for sesion in sesiones:
+        paginas = min(sesion.paginas, totales - leidas)
+        if paginas <= 0:
+            continue
+        leidas += paginas
+        evento = EventoLectura(paginas, leidas)
+        if sesion.marca_tiempo is not None:
+            evento.marca_tiempo = sesion.marca_tiempo
+        lecturas.append(evento)
+    libro._aplicar_lecturas_lote(lecturas)
+    return len(lecturas)
+
+
+def aplicar_sesiones(libros: Union[Catalogo, Dict[str, Libro]], sesiones: Iterable[Optional[SesionLectura]],
+                     tamanio_lote: int = 10_000) -> ResumenIngesta:
+    # Las entradas None (filas mal formadas) se cuentan como rechazadas y se saltean
+    if tamanio_lote < 1:
+        raise ValueError("El tamaño de lote debe ser al menos 1.")
+    buscar: Callable = libros.buscar if isinstance(libros, Catalogo) else libros.get
+
+    total = aplicadas = paginas_aplicadas = rechazadas = 0
+    sesiones = iter(sesiones)
+    while True:
+        leidas = list(islice(sesiones, tamanio_lote))
+        if not leidas:
+            break
+        lote = [sesion for sesion in leidas if sesion is not None]
+        rechazadas += len(leidas) - len(lote)
+        total += len(lote)
+
+        # Agrupar conservando el orden de llegada dentro de cada libro
+        por_libro: Dict[str, List[SesionLectura]] = {}
+        for sesion in lote:
+            por_libro.setdefault(sesion.id_publicacion, []).append(sesion)
+
+        for id_publicacion, sesiones_libro in por_libro.items():
+            libro = buscar(id_publicacion)
+            if not isinstance(libro, Libro):
+                continue
+            paginas_previas = libro.paginas_leidas
+            aplicadas += _aplicar_libro(libro, sesiones_libro)
+            paginas_aplicadas += libro.paginas_leidas - paginas_previas
+
+    return ResumenIngesta(total, aplicadas, total - aplicadas, paginas_aplicadas, rechazadas)
+
+
+def ingerir_archivo(libros: Union[Catalogo, Dict[str, Libro]], ruta: str, formato: Optional[str] = None,
+                    tamanio_lote: int = 10_000) -> ResumenIngesta:
+    # El formato se deduce de la extensión si no se indica
+    formato = (formato or ruta.rsplit(".", 1)[-1]).lower()
+    if formato == "jsonl":
+        formato = "ndjson"
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: '{formato}'. Use uno de: {', '.join(FORMATOS)}.")
+
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        sesiones = leer_csv(archivo) if formato == "csv" else leer_ndjson(archivo)
+        return aplicar_sesiones(libros, sesiones, tamanio_lote)
@@ -0,0 +1,152 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List
+
+from comun.almacen_eventos import materializar_evento
+from ejercicio2.desarrollo2 import Evento, EventoLectura, LecturasCompactas, Libro, Publicacion
+
+# Instantáneas binarias del estado de publicaciones y libros.
+#
+# Permiten reconstruir el catálogo al arrancar sin repetir cada operación: el estado privado
+# (título, año, páginas leídas, historial y lecturas) se guarda tal cual y se vuelve a cargar
+# con lecturas sobre mmap. El archivo se escribe en una sola pasada y todos los textos van a
+# una tabla al final, así cada texto distinto (campos, títulos) se guarda una sola vez.
+#
+# Formato (versión 1, little-endian):
+#     cabecera: MAGIA <H versión><I cantidad de publicaciones><Q desplazamiento de la tabla>
+#     publicación: <B tipo><I id><I título><i año>    (id y título son índices de la tabla)
+#         libro:   <q páginas totales><I cantidad de lecturas>
+#                  + marcas (n x d) + páginas (n x q) + acumulados (n x q)
+#         <I cantidad de eventos> + por evento <d marca><I campo><I valor anterior><I valor nuevo>
+#     tabla de textos: <I cantidad> + por texto <I largo><bytes utf-8>
+
+MAGIA = b"INSTPUB\n"
+VERSION = 1
+
+_TIPO_PUBLICACION = 0
+_TIPO_LIBRO = 1
+
+_CABECERA = struct.Struct("<HIQ")
+_PUBLICACION = struct.Struct("<BIIi")
+_LIBRO = struct.Struct("<qI")
+_EVENTO = struct.Struct("<dIII")
+_CANTIDAD = struct.Struct("<I")
+
+
+def _columna(tipo: str, valores) -> bytes:
+    columna = array(tipo, valores)
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna.tobytes()
+
+
+def _leer_columna(tipo: str, datos, inicio: int, cantidad: int):
+    columna = array(tipo)
+    fin = inicio + cantidad * columna.itemsize
+    columna.frombytes(datos[inicio:fin])
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna, fin
+
+
+def guardar_instantanea(publicaciones: Iterable[Publicacion], ruta: str) -> int:
+    # Devuelve la cantidad de publicaciones guardadas
+    textos: Dict[str, int] = {}
+
+    def indice(texto: str) -> int:
+        return textos.setdefault(texto, len(textos))
+
+    cantidad = 0
+    with open(ruta, "wb") as archivo:
+        archivo.write(MAGIA + _CABECERA.pack(VERSION, 0, 0))
+        for publicacion in publicaciones:
+            if type(publicacion) not in (Publicacion, Libro):
+                raise TypeError(f"No se puede guardar una instancia de {type(publicacion).__name__}.")
+            es_libro = type(publicacion) is Libro
+            archivo.write(_PUBLICACION.pack(_TIPO_LIBRO if es_libro else _TIPO_PUBLICACION,
+                                            indice(publicacion.id_publicacion),
+                                            indice(publicacion.titulo), publicacion.anio))
+            if es_libro:
+                marcas, paginas, acumulados = publicacion._columnas_lecturas()
+                archivo.write(_LIBRO.pack(publicacion.paginas_totales, len(marcas)))
+                archivo.write(_columna("d", marcas) + _columna("q", paginas) + _columna("q", acumulados))
+
+            historial = publicacion.historial_eventos
+            partes = [_CANTIDAD.pack(len(historial))]
+            for evento in historial:
+                partes.append(_EVENTO.pack(evento.marca_tiempo, indice(evento.campo),
+                                           indice(evento.valor_anterior), indice(evento.valor_nuevo)))
+            archivo.write(b"".join(partes))
+            cantidad += 1
+
+        desplazamiento = archivo.tell()
+        partes = [_CANTIDAD.pack(len(textos))]
+        for texto in textos:
+            codificado = texto.encode("utf-8")
+            partes.append(_CANTIDAD.pack(len(codificado)))
+            partes.append(codificado)
+        archivo.write(b"".join(partes))
+
+        archivo.seek(len(MAGIA))
+        archivo.write(_CABECERA.pack(VERSION, cantidad, desplazamiento))
+    return cantidad
+
+
+def _leer_textos(datos, pos: int) -> List[str]:
+    (cantidad,) = _CANTIDAD.unpack_from(datos, pos)
+    pos += _CANTIDAD.size
+    textos = []
+    for _ in range(cantidad):
+        (largo,) = _CANTIDAD.unpack_from(datos, pos)
+        pos += _CANTIDAD.size
+        textos.append(str(datos[pos:pos + largo], "utf-8"))
+        pos += largo
+    return textos
+
+
+def cargar_instantanea(ruta: str) -> List[Publicacion]:
+    # Reconstruye las publicaciones en el orden en que se guardaron
+    campos_evento = ("campo", "valor_anterior", "valor_nuevo")
+    publicaciones: List[Publicacion] = []
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        if datos[:len(MAGIA)] != MAGIA:
+            raise ValueError(f"'{ruta}' no es una instantánea de publicaciones.")
+        version, cantidad, desplazamiento = _CABECERA.unpack_from(datos, len(MAGIA))
+        if version != VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version} (se esperaba {VERSION}).")
+        textos = _leer_textos(datos, desplazamiento)
+
+        pos = len(MAGIA) + _CABECERA.size
+        for _ in range(cantidad):
+            tipo, id_texto, titulo_texto, anio = _PUBLICACION.unpack_from(datos, pos)
+            pos += _PUBLICACION.size
+            if tipo == _TIPO_LIBRO:
+                paginas_totales, n_lecturas = _LIBRO.unpack_from(datos, pos)
+                pos += _LIBRO.size
+                marcas, pos = _leer_columna("d", datos, pos, n_lecturas)
+                paginas, pos = _leer_columna("q", datos, pos, n_lecturas)
+                acumulados, pos = _leer_columna("q", datos, pos, n_lecturas)
+                publicacion = Libro(textos[id_texto], textos[titulo_texto], anio, paginas_totales)
+                if Libro.lecturas_compactas:
+                    lecturas = LecturasCompactas.desde_arreglos(marcas, paginas, acumulados)
+                else:
+                    lecturas = [materializar_evento(EventoLectura, ("paginas_leidas", "acumulado"), *fila)
+                                for fila in zip(marcas, zip(paginas, acumulados))]
+                publicacion._restaurar_lecturas(lecturas)
+            elif tipo == _TIPO_PUBLICACION:
+                publicacion = Publicacion(textos[id_texto], textos[titulo_texto], anio)
+            else:
+                raise ValueError(f"Tipo de publicación desconocido en la instantánea: {tipo}.")
+
+            (n_eventos,) = _CANTIDAD.unpack_from(datos, pos)
+            pos += _CANTIDAD.size
+            eventos = []
+            for marca, campo, anterior, nuevo in _EVENTO.iter_unpack(datos[pos:pos + n_eventos * _EVENTO.size]):
+                eventos.append(materializar_evento(Evento, campos_evento, marca,
+                                                   (textos[campo], textos[anterior], textos[nuevo])))
+            pos += n_eventos * _EVENTO.size
+            publicacion._incorporar_historial(eventos)
+            publicaciones.append(publicacion)
+    return publicaciones
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence
+
+from ejercicio2.desarrollo2 import EventoLectura, Libro
+
+# Pronóstico de ritmo de lectura por libro a partir de eventos_lectura.
+#
+# El ritmo es un promedio móvil exponencial (EWMA) de páginas por día:
+#     ritmo = alfa * muestra + (1 - alfa) * ritmo
+# donde cada muestra son las páginas de una lectura divididas por los días transcurridos desde
+# la lectura anterior. El motor incremental se actualiza en O(1) por cada lectura nueva; una
+# ingesta masiva (que notifica una sola vez) se procesa lectura por lectura, igual que el modo
+# por lotes, así ambos modos dan el mismo resultado.
+
+SEGUNDOS_POR_DIA = 86400
+INTERVALO_MINIMO = 60.0  # Segundos; evita ritmos desmedidos entre lecturas casi simultáneas
+
+
+class Pronostico(NamedTuple):
+    paginas_por_dia: Optional[float]       # None hasta tener dos lecturas
+    fecha_estimada_fin: Optional[datetime]
+
+
+class _EstadoRitmo:
+    __slots__ = ("ultima_marca", "ritmo", "lecturas")
+
+    def __init__(self):
+        self.ultima_marca: Optional[float] = None
+        self.ritmo: Optional[float] = None
+        self.lecturas = 0  # Lecturas de eventos_lectura ya incorporadas
+
+    def actualizar(self, paginas: int, marca: float, alfa: float):
+        self.lecturas += 1
+        if self.ultima_marca is not None:
+            dias = max(marca - self.ultima_marca, INTERVALO_MINIMO) / SEGUNDOS_POR_DIA
+            muestra = paginas / dias
+            self.ritmo = muestra if self.ritmo is None else alfa * muestra + (1 - alfa) * self.ritmo
+        self.ultima_marca = marca
+
+
+def _validar_alfa(alfa: float) -> float:
+    if not 0 < alfa <= 1:
+        raise ValueError("El factor de suavizado alfa debe estar en (0, 1].")
+    return alfa
+
+
+def _pronostico(libro: Libro, estado: _EstadoRitmo) -> Pronostico:
+    restantes = libro.paginas_totales - libro.paginas_leidas
+    if restantes == 0 and estado.ultima_marca is not None:
+        return Pronostico(estado.ritmo, datetime.fromtimestamp(estado.ultima_marca))
+    if not estado.ritmo:
+        return Pronostico(estado.ritmo, None)
+    dias = restantes / estado.ritmo
+    return Pronostico(estado.ritmo, datetime.fromtimestamp(estado.ultima_marca + dias * SEGUNDOS_POR_DIA))
+
+
+def _incorporar(estado: _EstadoRitmo, eventos: Sequence[EventoLectura], alfa: float) -> _EstadoRitmo:
+    for evento in eventos:
+        estado.actualizar(evento.paginas_leidas, evento.marca_tiempo, alfa)
+    return estado
+
+
+def _estado_desde_historial(eventos: Sequence[EventoLectura], alfa: float) -> _EstadoRitmo:
+    return _incorporar(_EstadoRitmo(), eventos, alfa)
+
+
+# Motor incremental: se suscribe a los libros y mantiene su ritmo al día
+class PronosticoLectura:
+    def __init__(self, alfa: float = 0.3):
+        self.__alfa = _validar_alfa(alfa)
+        self.__libros: Dict[str, Libro] = {}
+        self.__estados: Dict[str, _EstadoRitmo] = {}
+
+    # --- Propiedades (Getters) ---
+    @property
+    def alfa(self) -> float:
+        return self.__alfa
+
+    def __len__(self):
+        return len(self.__libros)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _al_cambiar(self, libro: Libro, campo: str, valor_anterior, valor_nuevo):
+        if campo == "paginas_leidas":
+            # Una ingesta masiva notifica una sola vez para varias lecturas: se incorporan
+            # todas las que aún no se vieron, cada una como una muestra
+            estado = self.__estados[libro.id_publicacion]
+            _incorporar(estado, libro.eventos_lectura[estado.lecturas:], self.__alfa)
+
+    # --- Operaciones ---
+
+    def agregar(self, libro: Libro):
+        if libro.id_publicacion in self.__libros:
+            raise ValueError(f"El libro '{libro.id_publicacion}' ya está registrado.")
+        self.__libros[libro.id_publicacion] = libro
+        self.__estados[libro.id_publicacion] = _estado_desde_historial(libro.eventos_lectura, self.__alfa)
+        libro.suscribir(self._al_cambiar)
+
+    def quitar(self, id_publicacion: str) -> Libro:
+        libro = self.__libros.pop(id_publicacion)
+        del self.__estados[id_publicacion]
+        libro.desuscribir(self._al_cambiar)
+        return libro
+
+    def pronostico(self, id_publicacion: str) -> Pronostico:
+        return _pronostico(self.__libros[id_publicacion], self.__estados[id_publicacion])
+
+    def pronosticos(self) -> Dict[str, Pronostico]:
+        return {id_publicacion: _pronostico(libro, self.__estados[id_publicacion])
+                for id_publicacion, libro in self.__libros.items()}
+
+
+def pronosticar_catalogo(libros: Iterable[Libro], alfa: float = 0.3) -> Dict[str, Pronostico]:
+    # Modo por lotes: calcula el pronóstico de cada libro recorriendo su historial una sola vez
+    alfa = _validar_alfa(alfa)
+    return {libro.id_publicacion: _pronostico(libro, _estado_desde_historial(libro.eventos_lectura, alfa))
+            for libro in libros}
@@ -0,0 +1,77 @@
+from typing import Dict, List, Optional, Tuple
+
+from comun.lista_bloques import ListaPorBloques
+from ejercicio3.desarrollo3 import Carrera
+
+
+# Tablas de posiciones de carreras: las más rápidas (menor ritmo) y las más largas.
+#
+# Cada tabla es una ListaPorBloques de (clave, id), igual que los índices del catálogo. Al
+# cambiar la distancia o la duración de una carrera (vía suscripción) solo se reubica esa
+# carrera, sin reordenar todo ni desplazar la tabla completa; el top-K se lee en O(K).
+# Las carreras sin distancia registrada no tienen ritmo y quedan fuera de ambas tablas.
+class Clasificacion:
+    def __init__(self):
+        self.__por_id: Dict[str, Carrera] = {}
+        self.__por_ritmo = ListaPorBloques()      # (ritmo, id)
+        self.__por_distancia = ListaPorBloques()  # (-distancia, id): la más larga primero
+        self.__claves: Dict[str, Tuple[float, float]] = {}  # id -> (ritmo, -distancia) indexados
+
+    # --- Propiedades (Getters) ---
+    def __len__(self):
+        return len(self.__por_id)
+
+    def __contains__(self, id_actividad: str):
+        return id_actividad in self.__por_id
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _indexar(self, carrera: Carrera):
+        if carrera.distancia_km <= 0:
+            return
+        id_actividad = carrera.id_actividad
+        claves = (carrera.calcular_ritmo(), -carrera.distancia_km)
+        self.__por_ritmo.agregar((claves[0], id_actividad))
+        self.__por_distancia.agregar((claves[1], id_actividad))
+        self.__claves[id_actividad] = claves
+
+    def _desindexar(self, id_actividad: str):
+        claves = self.__claves.pop(id_actividad, None)
+        if claves is not None:
+            self.__por_ritmo.quitar((claves[0], id_actividad))
+            self.__por_distancia.quitar((claves[1], id_actividad))
+
+    def _al_cambiar(self, carrera: Carrera, campo: str, valor_anterior, valor_nuevo):
+        if campo in ("distancia_km", "duracion_min"):
+            self._desindexar(carrera.id_actividad)
+            self._indexar(carrera)
+
+    # --- Operaciones ---
+
+    def agregar(self, carrera: Carrera):
+        id_actividad = carrera.id_actividad
+        if id_actividad in self.__por_id:
+            raise ValueError(f"La carrera '{id_actividad}' ya está en la clasificación.")
+        self.__por_id[id_actividad] = carrera
+        self._indexar(carrera)
+        carrera.suscribir(self._al_cambiar)
+
+    def quitar(self, id_actividad: str) -> Carrera:
+        carrera = self.__por_id.pop(id_actividad)
+        carrera.desuscribir(self._al_cambiar)
+        self._desindexar(id_actividad)
+        return carrera
+
+    def mas_rapidas(self, k: int = 10) -> List[Carrera]:
+        # Empates de ritmo: por id, para que el orden sea estable
+        return [self.__por_id[id_actividad] for _, id_actividad in self.__por_ritmo.primeros(k)]
+
+    def mas_largas(self, k: int = 10) -> List[Carrera]:
+        return [self.__por_id[id_actividad] for _, id_actividad in self.__por_distancia.primeros(k)]
+
+    def posicion_ritmo(self, id_actividad: str) -> Optional[int]:
+        # Puesto (1 = la más rápida) o None si la carrera no tiene ritmo
+        claves = self.__claves.get(id_actividad)
+        if claves is None:
+            return None
+        return self.__por_ritmo.posicion((claves[0], id_actividad)) + 1
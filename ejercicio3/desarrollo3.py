@@ -1,8 +1,20 @@
+from __future__ import annotations
+
+import logging
+import time
 from datetime import datetime
-from typing import List, Union
+from typing import Callable, List, Union, Optional, Sequence
+
+from comun.almacen_eventos import AlmacenEventos
+from comun.resultado import Resultado, OK, INVALIDO
+from comun.salida import PoliticaSalida, politica_actual
+from comun.textos import internar, internar_texto
+from comun.vistas import VistaSoloLectura
 
 class Actividad:
     DURACION_MINIMA = 1 # Regla de negocio: La duración mínima aceptada es 1 minuto.
+    almacen_eventos: Optional[AlmacenEventos] = None
+    salida: Optional[PoliticaSalida] = None
 
     def __init__(self, id_actividad: str, nombre: str, duracion_min: int):
         # Atributos "privados" (encapsulados)
@@ -10,6 +22,7 @@ class Actividad:
         self.__nombre = self._validar_nombre(nombre)
         self.__duracion_min = self._validar_duracion(duracion_min)
         self.__historial_eventos: List[Evento] = []  # Solo lectura
+        self.__observadores: Optional[List[Callable]] = None  # Se crea al primer suscriptor
 
     # --- Propiedades (Getters) ---
     @property
@@ -26,13 +39,27 @@ class Actividad:
         return self.__duracion_min
     
     @property
-    def historial_eventos(self) -> List[Evento]:
-        return list(self.__historial_eventos)
+    def historial_eventos(self) -> Sequence[Evento]:
+        if self.almacen_eventos is not None:
+            return self.almacen_eventos.consultar(self.__id_actividad)
+        return VistaSoloLectura(self.__historial_eventos)
 
     # --- Métodos Auxiliares Internos ---
     
+    def _emitir(self, nivel: int, mensaje: str, *args):
+        (self.salida or politica_actual()).emitir(nivel, mensaje, *args)
+
     def _registrar_evento(self, campo: str, valor_anterior: Union[str, int], valor_nuevo: Union[str, int]):
-        self.__historial_eventos.append(Evento(campo, str(valor_anterior), str(valor_nuevo)))
+        evento = Evento(campo, str(valor_anterior), str(valor_nuevo))
+        if self.almacen_eventos is not None:
+            self.almacen_eventos.agregar(self.__id_actividad, evento)
+        else:
+            self.__historial_eventos.append(evento)
+
+    def _notificar(self, campo: str, valor_anterior, valor_nuevo):
+        if self.__observadores:
+            for observador in self.__observadores:
+                observador(self, campo, valor_anterior, valor_nuevo)
             
     def _validar_nombre(self, nombre: str) -> str:
         if not nombre or nombre.strip() == "":
@@ -44,31 +71,47 @@ class Actividad:
             raise ValueError(f"La duración debe ser al menos {self.DURACION_MINIMA} minuto(s).")
         return duracion
 
+    # --- Suscripciones ---
+
+    def suscribir(self, observador: Callable):
+        # observador(actividad, campo, valor_anterior, valor_nuevo)
+        if self.__observadores is None:
+            self.__observadores = []
+        self.__observadores.append(observador)
+
+    def desuscribir(self, observador: Callable):
+        if self.__observadores and observador in self.__observadores:
+            self.__observadores.remove(observador)
+
     # --- Operaciones ---
 
-    def actualizar_nombre(self, nuevo_nombre: str):
+    def actualizar_nombre(self, nuevo_nombre: str) -> Resultado:
         try:
             nuevo_nombre_validado = self._validar_nombre(nuevo_nombre)
         except ValueError as e:
-            print(f" Error de validación de nombre: {e}")
-            return
+            self._emitir(logging.WARNING, " Error de validación de nombre: %s", e)
+            return Resultado(INVALIDO)
 
         nombre_previo = self.__nombre
         self.__nombre = nuevo_nombre_validado
         self._registrar_evento("nombre", nombre_previo, self.__nombre)
-        print(f" Nombre actualizado a: '{self.__nombre}'")
+        self._notificar("nombre", nombre_previo, self.__nombre)
+        self._emitir(logging.INFO, " Nombre actualizado a: '%s'", self.__nombre)
+        return Resultado(OK)
 
-    def actualizar_duracion(self, nueva_duracion: int):
+    def actualizar_duracion(self, nueva_duracion: int) -> Resultado:
         try:
             nueva_duracion_validada = self._validar_duracion(nueva_duracion)
         except ValueError as e:
-            print(f" Error de validación de duración: {e}")
-            return
+            self._emitir(logging.WARNING, " Error de validación de duración: %s", e)
+            return Resultado(INVALIDO, 0, self.__duracion_min)
 
         duracion_previa = self.__duracion_min
         self.__duracion_min = nueva_duracion_validada
         self._registrar_evento("duracion_min", duracion_previa, self.__duracion_min)
-        print(f" Duración actualizada a: {self.__duracion_min} min.")
+        self._notificar("duracion_min", duracion_previa, self.__duracion_min)
+        self._emitir(logging.INFO, " Duración actualizada a: %s min.", self.__duracion_min)
+        return Resultado(OK, self.__duracion_min, self.__duracion_min)
 
 class Carrera(Actividad):
     def __init__(self, id_actividad: str, nombre: str, duracion_min: int, distancia_km: float = 0.0):
@@ -91,8 +134,8 @@ class Carrera(Actividad):
         return self.__distancia_km
     
     @property
-    def eventos_registro(self) -> List[EventoRegistro]:
-        return list(self.__eventos_registro)
+    def eventos_registro(self) -> Sequence[EventoRegistro]:
+        return VistaSoloLectura(self.__eventos_registro)
     
     # --- Métodos Auxiliares Internos ---
     
@@ -108,20 +151,21 @@ class Carrera(Actividad):
 
     # --- Operaciones ---
 
-    def registrar_distancia(self, nueva_distancia: float):
+    def registrar_distancia(self, nueva_distancia: float) -> Resultado:
         try:
             nueva_distancia_validada = self._validar_distancia(nueva_distancia)
         except ValueError as e:
-            print(f" Error de registro de distancia: {e}")
-            return
+            self._emitir(logging.WARNING, " Error de registro de distancia: %s", e)
+            return Resultado(INVALIDO, 0, self.__distancia_km)
 
-        
-        
+        distancia_previa = self.__distancia_km
         self.__distancia_km = nueva_distancia_validada
         
         # Regla: Cada registro de distancia queda en eventos_registro
         self._registrar_evento_registro(self.__distancia_km, self.duracion_min)
-        print(f" Distancia registrada: {self.__distancia_km:.2f} km.")
+        self._notificar("distancia_km", distancia_previa, self.__distancia_km)
+        self._emitir(logging.INFO, " Distancia registrada: %.2f km.", self.__distancia_km)
+        return Resultado(OK, self.__distancia_km, self.__distancia_km)
 
     def calcular_ritmo(self) -> Union[float, str]:
         # Regla: Ritmo solo puede calcularse si existe una distancia registrada válida.
@@ -135,22 +179,35 @@ class Carrera(Actividad):
 
 # Clase auxiliar para guardar los eventos generales (historial_eventos)
 class Evento:
+    __slots__ = ("marca_tiempo", "campo", "valor_anterior", "valor_nuevo")
+
     def __init__(self, campo: str, valor_anterior: str, valor_nuevo: str):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.campo = campo
-        self.valor_anterior = valor_anterior
-        self.valor_nuevo = valor_nuevo
+        self.marca_tiempo = time.time()  # Epoch en segundos; se formatea solo al mostrar
+        self.campo = internar(campo)
+        self.valor_anterior = internar_texto(valor_anterior)
+        self.valor_nuevo = internar_texto(valor_nuevo)
+
+    @property
+    def fecha(self) -> str:
+        # El formateo se difiere hasta que alguien lo pide (__str__, exportación)
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
 
     def __str__(self):
         return f"[{self.fecha}] CAMBIO en '{self.campo}': De '{self.valor_anterior}' a '{self.valor_nuevo}'"
 
 # Clase auxiliar para guardar los eventos de registro (eventos_registro)
 class EventoRegistro:
+    __slots__ = ("marca_tiempo", "distancia_registrada", "duracion_acumulada")
+
     def __init__(self, distancia_registrada: float, duracion_acumulada: int):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.marca_tiempo = time.time()
         self.distancia_registrada = distancia_registrada
         self.duracion_acumulada = duracion_acumulada
 
+    @property
+    def fecha(self) -> str:
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
+
     def __str__(self):
         return (f"[{self.fecha}] REGISTRO: Distancia: {self.distancia_registrada:.2f} km. "
                 f"Duración acumulada: {self.duracion_acumulada} min.")
\ No newline at end of file
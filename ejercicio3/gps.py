@@ -0,0 +1,222 @@
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+import numpy as np
+
+from ejercicio3.desarrollo3 import Carrera
+
+# Ingesta de tracks GPS (lat, lon, marca_tiempo) por bloques.
+#
+# Los puntos se procesan de a bloques de tamaño fijo: distancia haversine entre puntos
+# consecutivos y parciales por kilómetro, todo vectorizado con NumPy. Entre bloques solo se
+# guarda el último punto y los acumulados, así que la memoria no depende del largo del track.
+# Después de cada bloque se actualiza la carrera con registrar_distancia. Solo se actualiza la
+# distancia: la duración de la carrera (duracion_min) no se toca, aunque el track la informe en
+# el resumen (duracion_s).
+#
+# Fuentes soportadas:
+#     csv: una fila "lat,lon,marca_tiempo" por punto (encabezado opcional)
+#     bin: triples float64 little-endian (lat, lon, marca_tiempo) consecutivos
+#
+# Un punto mal formado (fila CSV sin tres números, bytes sobrantes al final del binario, o
+# cualquier coordenada no finita) no corta la ingesta: los lectores lo entregan como una fila
+# de NaN y procesar_bloque la descarta y la cuenta como rechazada, igual que la ingesta de
+# sesiones de lectura.
+
+RADIO_TIERRA_KM = 6371.0088
+FORMATOS = ("csv", "bin")
+TAMANIO_BLOQUE = 65_536
+
+_DTYPE_BINARIO = np.dtype("<f8")
+
+Punto = Tuple[float, float, float]
+
+
+class ResumenTrack(NamedTuple):
+    puntos: int
+    distancia_km: float
+    duracion_s: float
+    parciales: List[float]  # Ritmo de cada kilómetro completo, en min/km
+    rechazados: int = 0     # Puntos mal formados que se descartaron
+
+
+def haversine_km(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    lat1, lon1, lat2, lon2 = (np.radians(x) for x in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(a))
+
+
+# --- Lectura de las fuentes ---
+
+def bloques(puntos: Iterable[Punto], tamanio_bloque: int = TAMANIO_BLOQUE) -> Iterator[np.ndarray]:
+    # Agrupa un iterador de puntos en arreglos (n, 3)
+    puntos = iter(puntos)
+    while True:
+        bloque = list(islice(puntos, tamanio_bloque))
+        if not bloque:
+            return
+        yield np.array(bloque, dtype=np.float64).reshape(-1, 3)
+
+
+_PUNTO_INVALIDO = (np.nan, np.nan, np.nan)
+
+
+def _punto_csv(linea: str) -> Punto:
+    campos = linea.split(",")
+    if len(campos) != 3:
+        return _PUNTO_INVALIDO
+    try:
+        return float(campos[0]), float(campos[1]), float(campos[2])
+    except ValueError:
+        return _PUNTO_INVALIDO
+
+
+def _bloque_csv(lineas: List[str]) -> np.ndarray:
+    # Camino rápido: si todas las filas tienen tres campos se parsea el bloque entero de una vez.
+    # Si alguna está mal formada, se parsea fila por fila para descartar solo esas.
+    if all(linea.count(",") == 2 for linea in lineas):
+        try:
+            valores = np.fromstring(",".join(lineas), dtype=np.float64, sep=",")
+            if len(valores) == 3 * len(lineas):
+                return valores.reshape(-1, 3)
+        except ValueError:
+            pass
+    return np.array([_punto_csv(linea) for linea in lineas], dtype=np.float64).reshape(-1, 3)
+
+
+def leer_bloques_csv(archivo: TextIO, tamanio_bloque: int = TAMANIO_BLOQUE) -> Iterator[np.ndarray]:
+    primera = True
+    while True:
+        lineas = list(islice(archivo, tamanio_bloque))
+        if not lineas:
+            return
+        if primera:
+            primera = False
+            if lineas[0].strip() and lineas[0].lstrip()[0] not in "+-.0123456789":
+                lineas = lineas[1:]  # Encabezado
+        lineas = [linea.strip() for linea in lineas if linea.strip()]
+        if lineas:
+            yield _bloque_csv(lineas)
+
+
+def leer_bloques_binario(archivo: BinaryIO, tamanio_bloque: int = TAMANIO_BLOQUE) -> Iterator[np.ndarray]:
+    while True:
+        datos = archivo.read(tamanio_bloque * 3 * _DTYPE_BINARIO.itemsize)
+        if not datos:
+            return
+        sobrante = len(datos) % (3 * _DTYPE_BINARIO.itemsize)
+        completos = np.frombuffer(datos, dtype=_DTYPE_BINARIO, count=(len(datos) - sobrante) // 8)
+        puntos = completos.astype(np.float64, copy=False).reshape(-1, 3)
+        if sobrante:
+            # Punto incompleto al final del archivo
+            puntos = np.vstack((puntos, _PUNTO_INVALIDO))
+        yield puntos
+
+
+# --- Procesamiento ---
+
+class SeguimientoGPS:
+    def __init__(self, carrera: Carrera):
+        self.__carrera = carrera
+        self.__puntos = 0
+        self.__rechazados = 0
+        self.__distancia_km = 0.0
+        self.__inicio: Optional[float] = None
+        self.__ultimo: Optional[np.ndarray] = None     # Último punto del bloque anterior
+        self.__marca_ultimo_km: Optional[float] = None
+        self.__parciales: List[float] = []
+
+    # --- Propiedades (Getters) ---
+    @property
+    def carrera(self) -> Carrera:
+        return self.__carrera
+
+    @property
+    def distancia_km(self) -> float:
+        return self.__distancia_km
+
+    @property
+    def rechazados(self) -> int:
+        return self.__rechazados
+
+    @property
+    def duracion_s(self) -> float:
+        if self.__ultimo is None:
+            return 0.0
+        return float(self.__ultimo[2] - self.__inicio)
+
+    @property
+    def parciales(self) -> List[float]:
+        return list(self.__parciales)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _parciales_bloque(self, acumulado: np.ndarray, marcas: np.ndarray):
+        # Instante en que se cruza cada kilómetro completo (interpolando entre puntos)
+        desde, hasta = int(acumulado[0]), int(acumulado[-1])
+        if hasta <= desde:
+            return
+        kilometros = np.arange(desde + 1, hasta + 1, dtype=np.float64)
+        cruces = np.interp(kilometros, acumulado, marcas)
+        previos = np.concatenate(([self.__marca_ultimo_km], cruces[:-1]))
+        self.__parciales.extend(np.round((cruces - previos) / 60, 2).tolist())
+        self.__marca_ultimo_km = float(cruces[-1])
+
+    # --- Operaciones ---
+
+    def procesar_bloque(self, puntos: np.ndarray):
+        puntos = np.asarray(puntos, dtype=np.float64)
+        if puntos.ndim != 2 or puntos.shape[1] != 3:
+            raise ValueError("Cada bloque debe tener forma (n, 3): lat, lon, marca_tiempo.")
+        validos = np.isfinite(puntos).all(axis=1)
+        if not validos.all():
+            self.__rechazados += int(len(puntos) - validos.sum())
+            puntos = puntos[validos]
+        if len(puntos) == 0:
+            return
+        if self.__ultimo is None:
+            self.__inicio = self.__marca_ultimo_km = float(puntos[0, 2])
+        else:
+            puntos = np.vstack((self.__ultimo, puntos))
+
+        tramos = haversine_km(puntos[:-1, 0], puntos[:-1, 1], puntos[1:, 0], puntos[1:, 1])
+        acumulado = np.empty(len(puntos))
+        acumulado[0] = self.__distancia_km
+        np.cumsum(tramos, out=acumulado[1:])
+        acumulado[1:] += self.__distancia_km
+
+        self._parciales_bloque(acumulado, puntos[:, 2])
+        self.__puntos += len(puntos) - (self.__ultimo is not None)
+        self.__distancia_km = float(acumulado[-1])
+        self.__ultimo = puntos[-1].copy()
+
+        if round(self.__distancia_km, 2) > 0:
+            self.__carrera.registrar_distancia(self.__distancia_km)
+
+    def procesar(self, bloques_puntos: Iterable[np.ndarray]) -> ResumenTrack:
+        for bloque in bloques_puntos:
+            self.procesar_bloque(bloque)
+        return self.resumen()
+
+    def resumen(self) -> ResumenTrack:
+        return ResumenTrack(self.__puntos, round(self.__distancia_km, 2), self.duracion_s, self.parciales,
+                            self.__rechazados)
+
+
+def ingerir_track(carrera: Carrera, fuente: Union[str, Iterable[Punto]], formato: Optional[str] = None,
+                  tamanio_bloque: int = TAMANIO_BLOQUE) -> ResumenTrack:
+    # 'fuente' es una ruta (el formato se deduce de la extensión si no se indica) o un iterador de puntos
+    if tamanio_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1.")
+    seguimiento = SeguimientoGPS(carrera)
+    if not isinstance(fuente, str):
+        return seguimiento.procesar(bloques(fuente, tamanio_bloque))
+
+    formato = (formato or fuente.rsplit(".", 1)[-1]).lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: '{formato}'. Use uno de: {', '.join(FORMATOS)}.")
+    if formato == "csv":
+        with open(fuente, encoding="utf-8") as archivo:
+            return seguimiento.procesar(leer_bloques_csv(archivo, tamanio_bloque))
+    with open(fuente, "rb") as archivo:
+        return seguimiento.procesar(leer_bloques_binario(archivo, tamanio_bloque))
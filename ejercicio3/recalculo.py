@@ -0,0 +1,102 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ejercicio3.desarrollo3 import Carrera
+from ejercicio3.ritmos import calcular_ritmos
+
+# Recálculo masivo de la serie de ritmos de cada carrera a partir de sus eventos_registro,
+# por ejemplo al cambiar la regla de redondeo.
+#
+# Las columnas numéricas (distancia registrada, duración acumulada) de todos los eventos se
+# copian una sola vez a memoria compartida. Cada proceso recibe solo el nombre del bloque y el
+# rango [inicio, fin) de eventos que le toca, calcula esos ritmos con NumPy y los escribe en
+# una columna de salida también compartida: no se serializa ningún evento ni arreglo.
+
+TAMANIO_FRAGMENTO = 250_000
+
+
+class ReporteRendimiento(NamedTuple):
+    carreras: int
+    eventos: int
+    procesos: int
+    fragmentos: int
+    segundos: float
+    eventos_por_segundo: float
+
+
+class ResultadoRecalculo(NamedTuple):
+    series: Dict[str, np.ndarray]  # id_actividad -> ritmo de cada registro (NaN si no hay distancia)
+    reporte: ReporteRendimiento
+
+
+def _recalcular_fragmento(nombre_entrada: str, nombre_salida: str, total: int, inicio: int, fin: int,
+                          decimales: int) -> int:
+    # Se ejecuta en el proceso trabajador: solo adjunta los bloques compartidos
+    entrada = SharedMemory(name=nombre_entrada)
+    salida = SharedMemory(name=nombre_salida)
+    try:
+        columnas = np.ndarray((2, total), dtype=np.float64, buffer=entrada.buf)
+        ritmos = np.ndarray((total,), dtype=np.float64, buffer=salida.buf)
+        ritmos[inicio:fin] = calcular_ritmos(columnas[1, inicio:fin], columnas[0, inicio:fin], decimales)
+        del columnas, ritmos  # Liberar las vistas antes de cerrar
+    finally:
+        entrada.close()
+        salida.close()
+    return fin - inicio
+
+
+def _columnas(carreras: Sequence[Carrera]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (distancias, duraciones, desplazamiento de inicio de cada carrera) de todos los eventos
+    largos = np.fromiter((len(c.eventos_registro) for c in carreras), dtype=np.int64, count=len(carreras))
+    desplazamientos = np.zeros(len(carreras) + 1, dtype=np.int64)
+    np.cumsum(largos, out=desplazamientos[1:])
+    total = int(desplazamientos[-1])
+    eventos = list(chain.from_iterable(c.eventos_registro for c in carreras))
+    distancias = np.fromiter((e.distancia_registrada for e in eventos), dtype=np.float64, count=total)
+    duraciones = np.fromiter((e.duracion_acumulada for e in eventos), dtype=np.float64, count=total)
+    return distancias, duraciones, desplazamientos
+
+
+def recalcular_ritmos(carreras: Sequence[Carrera], decimales: int = 2, procesos: Optional[int] = None,
+                      tamanio_fragmento: int = TAMANIO_FRAGMENTO) -> ResultadoRecalculo:
+    if tamanio_fragmento < 1:
+        raise ValueError("El tamaño de fragmento debe ser al menos 1.")
+    inicio_reloj = time.perf_counter()
+    carreras = list(carreras)
+    distancias, duraciones, desplazamientos = _columnas(carreras)
+    total = len(distancias)
+
+    procesos = procesos or os.cpu_count() or 1
+    limites = [(i, min(i + tamanio_fragmento, total)) for i in range(0, total, tamanio_fragmento)]
+
+    if procesos == 1 or len(limites) <= 1:
+        ritmos = calcular_ritmos(duraciones, distancias, decimales)
+    else:
+        entrada = SharedMemory(create=True, size=2 * total * 8)
+        salida = SharedMemory(create=True, size=total * 8)
+        try:
+            columnas = np.ndarray((2, total), dtype=np.float64, buffer=entrada.buf)
+            columnas[0] = distancias
+            columnas[1] = duraciones
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                list(pool.map(_recalcular_fragmento, *zip(*((entrada.name, salida.name, total, i, f, decimales)
+                                                             for i, f in limites))))
+            ritmos = np.ndarray((total,), dtype=np.float64, buffer=salida.buf).copy()
+            del columnas
+        finally:
+            for bloque in (entrada, salida):
+                bloque.close()
+                bloque.unlink()
+
+    series = {carrera.id_actividad: ritmos[desplazamientos[i]:desplazamientos[i + 1]]
+              for i, carrera in enumerate(carreras)}
+    segundos = time.perf_counter() - inicio_reloj
+    reporte = ReporteRendimiento(len(carreras), total, procesos, len(limites), round(segundos, 4),
+                                 round(total / segundos, 1) if segundos > 0 else float("inf"))
+    return ResultadoRecalculo(series, reporte)
@@ -0,0 +1,155 @@
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ejercicio3.desarrollo3 import Actividad, Carrera
+
+# Registro de actividades de un atleta o de un gimnasio.
+#
+# Indexa las actividades por id y por período (día, semana ISO y mes) y mantiene sumas
+# acumuladas de distancia, duración y ritmo por período y en total. Las sumas se actualizan
+# en cada registrar_distancia / actualizar_duracion (vía suscripción), así que los resúmenes
+# por período son O(1) y nunca recorren todas las actividades.
+
+GRANULARIDADES = ("dia", "semana", "mes")
+
+
+class ResumenPeriodo(NamedTuple):
+    actividades: int
+    distancia_km: float
+    duracion_min: int
+    ritmo_medio: Optional[float]  # min/km de las carreras con distancia; None si no hay ninguna
+
+
+class _Totales:
+    __slots__ = ("actividades", "distancia_km", "duracion_min", "duracion_con_distancia")
+
+    def __init__(self):
+        self.actividades = 0
+        self.distancia_km = 0.0
+        self.duracion_min = 0
+        self.duracion_con_distancia = 0  # Minutos de las carreras que ya tienen distancia (para el ritmo)
+
+    def sumar(self, aporte: Tuple[float, int, int], signo: int):
+        distancia, duracion, duracion_con_distancia = aporte
+        self.actividades += signo
+        self.distancia_km += signo * distancia
+        self.duracion_min += signo * duracion
+        self.duracion_con_distancia += signo * duracion_con_distancia
+
+    def resumen(self) -> ResumenPeriodo:
+        distancia = round(self.distancia_km, 2)  # Absorbe el error de sumar y restar flotantes
+        ritmo = round(self.duracion_con_distancia / distancia, 2) if distancia > 0 else None
+        return ResumenPeriodo(self.actividades, distancia, self.duracion_min, ritmo)
+
+
+def clave_periodo(marca_tiempo: float, granularidad: str) -> str:
+    fecha = datetime.fromtimestamp(marca_tiempo)
+    if granularidad == "dia":
+        return fecha.strftime("%Y-%m-%d")
+    if granularidad == "semana":
+        anio, semana, _ = fecha.isocalendar()
+        return f"{anio}-W{semana:02d}"
+    if granularidad == "mes":
+        return fecha.strftime("%Y-%m")
+    raise ValueError(f"Granularidad no soportada: '{granularidad}'. Use una de: {', '.join(GRANULARIDADES)}.")
+
+
+class RegistroActividades:
+    def __init__(self):
+        self.__por_id: Dict[str, Actividad] = {}
+        self.__marcas: Dict[str, float] = {}
+        self.__claves: Dict[str, Tuple[str, ...]] = {}  # Clave de período por granularidad
+        self.__aportes: Dict[str, Tuple[float, int, int]] = {}
+        self.__total = _Totales()
+        self.__periodos: Dict[str, Dict[str, _Totales]] = {g: {} for g in GRANULARIDADES}
+        self.__ids_por_periodo: Dict[str, Dict[str, List[str]]] = {g: {} for g in GRANULARIDADES}
+
+    # --- Propiedades (Getters) ---
+    def __len__(self):
+        return len(self.__por_id)
+
+    def __contains__(self, id_actividad: str):
+        return id_actividad in self.__por_id
+
+    # --- Métodos Auxiliares Internos ---
+
+    @staticmethod
+    def _aporte(actividad: Actividad) -> Tuple[float, int, int]:
+        distancia = actividad.distancia_km if isinstance(actividad, Carrera) else 0.0
+        return distancia, actividad.duracion_min, actividad.duracion_min if distancia > 0 else 0
+
+    def _aplicar(self, id_actividad: str, aporte: Tuple[float, int, int], signo: int):
+        self.__total.sumar(aporte, signo)
+        for granularidad, clave in zip(GRANULARIDADES, self.__claves[id_actividad]):
+            periodos = self.__periodos[granularidad]
+            totales = periodos.get(clave)
+            if totales is None:
+                totales = periodos[clave] = _Totales()
+            totales.sumar(aporte, signo)
+            if totales.actividades == 0:
+                del periodos[clave]
+
+    def _validar_granularidad(self, granularidad: str) -> str:
+        if granularidad not in GRANULARIDADES:
+            raise ValueError(f"Granularidad no soportada: '{granularidad}'. Use una de: {', '.join(GRANULARIDADES)}.")
+        return granularidad
+
+    def _al_cambiar(self, actividad: Actividad, campo: str, valor_anterior, valor_nuevo):
+        if campo in ("distancia_km", "duracion_min"):
+            id_actividad = actividad.id_actividad
+            self._aplicar(id_actividad, self.__aportes[id_actividad], -1)
+            self.__aportes[id_actividad] = self._aporte(actividad)
+            self._aplicar(id_actividad, self.__aportes[id_actividad], +1)
+
+    # --- Operaciones ---
+
+    def agregar(self, actividad: Actividad, marca_tiempo: Optional[float] = None):
+        # marca_tiempo: cuándo se realizó la actividad (epoch); por defecto, ahora
+        id_actividad = actividad.id_actividad
+        if id_actividad in self.__por_id:
+            raise ValueError(f"La actividad '{id_actividad}' ya está registrada.")
+        marca = time.time() if marca_tiempo is None else marca_tiempo
+        self.__por_id[id_actividad] = actividad
+        self.__marcas[id_actividad] = marca
+        self.__claves[id_actividad] = tuple(clave_periodo(marca, g) for g in GRANULARIDADES)
+        self.__aportes[id_actividad] = self._aporte(actividad)
+        self._aplicar(id_actividad, self.__aportes[id_actividad], +1)
+        for granularidad, clave in zip(GRANULARIDADES, self.__claves[id_actividad]):
+            self.__ids_por_periodo[granularidad].setdefault(clave, []).append(id_actividad)
+        actividad.suscribir(self._al_cambiar)
+
+    def quitar(self, id_actividad: str) -> Actividad:
+        actividad = self.__por_id.pop(id_actividad)
+        actividad.desuscribir(self._al_cambiar)
+        self._aplicar(id_actividad, self.__aportes.pop(id_actividad), -1)
+        del self.__marcas[id_actividad]
+        for granularidad, clave in zip(GRANULARIDADES, self.__claves.pop(id_actividad)):
+            indice = self.__ids_por_periodo[granularidad]
+            indice[clave].remove(id_actividad)
+            if not indice[clave]:
+                del indice[clave]
+        return actividad
+
+    def buscar(self, id_actividad: str) -> Optional[Actividad]:
+        return self.__por_id.get(id_actividad)
+
+    def marca_de(self, id_actividad: str) -> float:
+        return self.__marcas[id_actividad]
+
+    def periodos(self, granularidad: str) -> List[str]:
+        # Claves de los períodos con actividades, en orden cronológico
+        self._validar_granularidad(granularidad)
+        return sorted(self.__periodos[granularidad])
+
+    def actividades_en(self, granularidad: str, clave: str) -> List[Actividad]:
+        self._validar_granularidad(granularidad)
+        return [self.__por_id[i] for i in self.__ids_por_periodo[granularidad].get(clave, ())]
+
+    def resumen_periodo(self, granularidad: str, clave: str) -> ResumenPeriodo:
+        self._validar_granularidad(granularidad)
+        totales = self.__periodos[granularidad].get(clave)
+        return totales.resumen() if totales is not None else ResumenPeriodo(0, 0.0, 0, None)
+
+    def resumen_total(self) -> ResumenPeriodo:
+        return self.__total.resumen()
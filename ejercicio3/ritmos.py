@@ -0,0 +1,85 @@
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ejercicio3.desarrollo3 import Carrera
+
+# Cálculo de ritmos por lotes. Mismas reglas que Carrera.calcular_ritmo (min/km redondeado a
+# dos decimales), pero sobre columnas NumPy: las carreras sin distancia dan NaN en lugar del
+# mensaje de error, así que no hace falta revisar el tipo del resultado carrera por carrera.
+#
+# El redondeo coincide con el round de Python: np.round escala, redondea y desescala, y cuando
+# el valor escalado queda casi en la mitad entre dos enteros el error del escalado puede
+# inclinarlo al lado contrario (p. ej. 108.6 / 8.0 da 13.58 en lugar de 13.57). Esos casos
+# dudosos, muy pocos, se recalculan con round.
+
+
+def columnas(carreras: Iterable[Carrera]) -> Tuple[np.ndarray, np.ndarray]:
+    # (duración en minutos, distancia en km) de cada carrera, en el mismo orden
+    carreras = carreras if isinstance(carreras, Sequence) else list(carreras)
+    n = len(carreras)
+    duracion = np.fromiter((c.duracion_min for c in carreras), dtype=np.float64, count=n)
+    distancia = np.fromiter((c.distancia_km for c in carreras), dtype=np.float64, count=n)
+    return duracion, distancia
+
+
+def _redondear(valores: np.ndarray, decimales: int) -> np.ndarray:
+    forma = np.shape(valores)
+    valores = np.ravel(valores)
+    resultado = np.round(valores, decimales)
+    escalados = valores * 10.0 ** decimales
+    with np.errstate(invalid="ignore"):
+        dudosos = (np.abs(escalados - np.floor(escalados) - 0.5)
+                   <= 1e-9 * np.maximum(np.abs(escalados), 1.0))
+    if dudosos.any():
+        resultado[dudosos] = [round(valor, decimales) for valor in valores[dudosos].tolist()]
+    return resultado.reshape(forma)[()]  # [()]: un escalar vuelve como escalar, igual que np.round
+
+
+def calcular_ritmos(duracion: np.ndarray, distancia: np.ndarray, decimales: int = 2) -> np.ndarray:
+    # 'decimales' es la regla de redondeo (la de Carrera.calcular_ritmo es 2)
+    duracion = np.asarray(duracion, dtype=np.float64)
+    distancia = np.asarray(distancia, dtype=np.float64)
+    validas = distancia > 0
+    ritmos = np.full(np.broadcast(duracion, distancia).shape, np.nan)
+    np.divide(duracion, distancia, out=ritmos, where=validas)
+    return _redondear(ritmos, decimales)
+
+
+def ritmos_carreras(carreras: Iterable[Carrera]) -> np.ndarray:
+    return calcular_ritmos(*columnas(carreras))
+
+
+def mascara_validos(ritmos: np.ndarray) -> np.ndarray:
+    return ~np.isnan(ritmos)
+
+
+def percentiles(ritmos: np.ndarray, q: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+    # Percentiles (0-100) de los ritmos válidos; NaN si no hay ninguno
+    validos = ritmos[mascara_validos(ritmos)]
+    if validos.size == 0:
+        return np.full(np.shape(q), np.nan) if np.ndim(q) else float("nan")
+    return np.percentile(validos, q)
+
+
+def ranking(ritmos: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    # Índices de las carreras del ritmo más rápido (menor) al más lento, sin las inválidas.
+    # Con k solo se ordenan las k mejores (argpartition, O(n + k log k)).
+    indices = np.flatnonzero(mascara_validos(ritmos))
+    valores = ritmos[indices]
+    if k is not None and k < valores.size:
+        if k <= 0:
+            return indices[:0]
+        mejores = np.argpartition(valores, k - 1)[:k]
+        return indices[mejores[np.argsort(valores[mejores], kind="stable")]]
+    return indices[np.argsort(valores, kind="stable")]
+
+
+def posiciones(ritmos: np.ndarray) -> np.ndarray:
+    # Puesto de cada carrera (1 = la más rápida); los empates comparten el puesto
+    # y las carreras inválidas quedan con 0
+    puestos = np.zeros(ritmos.shape, dtype=np.int64)
+    validos = mascara_validos(ritmos)
+    valores = ritmos[validos]
+    puestos[validos] = np.searchsorted(np.sort(valores), valores, side="left") + 1
+    return puestos
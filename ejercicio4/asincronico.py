@@ -0,0 +1,207 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from comun.resultado import Resultado
+from comun.salida import SILENCIOSO, PoliticaSalida
+from ejercicio4.desarrollo4 import Auto, Vehiculo
+
+# Fachada asyncio sobre la flota de vehículos.
+#
+# Las operaciones de Vehiculo/Auto son síncronas y cortas, así que se ejecutan directamente en
+# el bucle de eventos (entre dos await ninguna otra tarea puede intercalarse). Los vehículos sin
+# política de salida propia usan la de la fachada, silenciosa por defecto; la política global
+# no se toca. Los eventos nuevos (Evento y EventoOcupacion) llegan por suscripción y no se
+# escriben uno por uno: se acumulan y una tarea de fondo los entrega por lotes al sumidero cada
+# 'intervalo' segundos, o antes si se junta un lote completo. El formateo y la E/S quedan en el
+# sumidero, fuera del camino de cada pedido.
+#
+# Si el sumidero falla, el lote vuelve a la cola (delante de lo que llegó mientras tanto) y se
+# reintenta en el próximo vaciado; la tarea de fondo registra el error y sigue funcionando.
+
+EventoPendiente = Tuple[str, object]  # (id_vehiculo, Evento | EventoOcupacion)
+
+_registro = logging.getLogger("evaluacion_poo")
+
+
+# --- Sumideros ---
+
+# Interfaz común de los destinos de los lotes de eventos
+class SumideroEventos:
+    async def escribir(self, lote: List[EventoPendiente]):
+        raise NotImplementedError
+
+
+# Guarda los lotes en memoria (pruebas, o para consumirlos desde otra tarea)
+class SumideroMemoria(SumideroEventos):
+    def __init__(self):
+        self.__lotes: List[List[EventoPendiente]] = []
+
+    @property
+    def lotes(self) -> List[List[EventoPendiente]]:
+        return list(self.__lotes)
+
+    @property
+    def eventos(self) -> List[EventoPendiente]:
+        return [evento for lote in self.__lotes for evento in lote]
+
+    async def escribir(self, lote: List[EventoPendiente]):
+        self.__lotes.append(lote)
+
+
+# Anexa cada lote a un archivo de texto, una línea "id_vehiculo<TAB>evento" por evento.
+# El formateo y la escritura se hacen en un hilo para no bloquear el bucle de eventos.
+class SumideroArchivo(SumideroEventos):
+    def __init__(self, ruta: str):
+        self.__ruta = ruta
+
+    @property
+    def ruta(self) -> str:
+        return self.__ruta
+
+    def _escribir(self, lote: List[EventoPendiente]):
+        with open(self.__ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("".join(f"{id_vehiculo}\t{evento}\n" for id_vehiculo, evento in lote))
+
+    async def escribir(self, lote: List[EventoPendiente]):
+        await asyncio.to_thread(self._escribir, lote)
+
+
+# --- Fachada ---
+
+class FlotaAsincronica:
+    def __init__(self, sumidero: SumideroEventos, intervalo: float = 0.05, tamanio_lote: int = 5_000,
+                 politica: Optional[PoliticaSalida] = None):
+        if intervalo <= 0:
+            raise ValueError("El intervalo de vaciado debe ser positivo.")
+        if tamanio_lote < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1.")
+        self.__sumidero = sumidero
+        self.__intervalo = intervalo
+        self.__tamanio_lote = tamanio_lote
+        self.__politica = politica or PoliticaSalida(SILENCIOSO)
+        self.__vehiculos: Dict[str, Vehiculo] = {}
+        self.__pendientes: List[EventoPendiente] = []
+        self.__lote_lleno: Optional[asyncio.Event] = None
+        self.__tarea: Optional[asyncio.Task] = None
+        self.__cerrando = False
+
+    # --- Propiedades (Getters) ---
+    @property
+    def sumidero(self) -> SumideroEventos:
+        return self.__sumidero
+
+    @property
+    def pendientes(self) -> int:
+        return len(self.__pendientes)
+
+    def __len__(self):
+        return len(self.__vehiculos)
+
+    # --- Métodos Auxiliares Internos ---
+
+    def _al_cambiar(self, vehiculo: Vehiculo, campo: str, valor_anterior, valor_nuevo):
+        if campo == "evento":
+            self.__pendientes.append((vehiculo.id_vehiculo, valor_nuevo))
+            if len(self.__pendientes) >= self.__tamanio_lote and self.__lote_lleno is not None:
+                self.__lote_lleno.set()
+
+    def _auto(self, id_vehiculo: str) -> Auto:
+        vehiculo = self.__vehiculos[id_vehiculo]
+        if not isinstance(vehiculo, Auto):
+            raise TypeError(f"El vehículo '{id_vehiculo}' no es un Auto.")
+        return vehiculo
+
+    async def _vaciar_periodicamente(self):
+        # Termina (después de completar el vaciado en curso) cuando cerrar() marca __cerrando
+        while not self.__cerrando:
+            try:
+                await asyncio.wait_for(self.__lote_lleno.wait(), self.__intervalo)
+            except asyncio.TimeoutError:
+                pass
+            self.__lote_lleno.clear()
+            if self.__cerrando:
+                break
+            try:
+                await self.vaciar()
+            except Exception:
+                _registro.exception("Error al entregar %s eventos al sumidero; se reintentará.",
+                                    len(self.__pendientes))
+
+    def _al_terminar_escritura(self, escritura: asyncio.Future, lote: List[EventoPendiente]):
+        # Escritura que siguió en curso tras cancelar a quien la esperaba: si falló, el lote vuelve
+        if not escritura.cancelled() and escritura.exception() is not None:
+            _registro.error("Error al entregar %s eventos al sumidero; se reintentará.", len(lote),
+                            exc_info=escritura.exception())
+            self.__pendientes[:0] = lote
+
+    # --- Ciclo de vida ---
+
+    async def iniciar(self):
+        if self.__tarea is None:
+            self.__cerrando = False
+            self.__lote_lleno = asyncio.Event()
+            self.__tarea = asyncio.create_task(self._vaciar_periodicamente())
+
+    async def cerrar(self):
+        # Detiene la tarea de fondo y entrega lo que quede pendiente. La tarea no se cancela: se
+        # le pide que termine y se espera su último vaciado, para no escribir dos veces un lote
+        # que el sumidero todavía estaba entregando
+        if self.__tarea is not None:
+            self.__cerrando = True
+            self.__lote_lleno.set()
+            await self.__tarea
+            self.__tarea = None
+        await self.vaciar()
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *excepcion):
+        await self.cerrar()
+
+    # --- Operaciones ---
+
+    def agregar(self, vehiculo: Vehiculo):
+        if vehiculo.id_vehiculo in self.__vehiculos:
+            raise ValueError(f"El vehículo '{vehiculo.id_vehiculo}' ya está en la flota.")
+        self.__vehiculos[vehiculo.id_vehiculo] = vehiculo
+        if vehiculo.salida is None:
+            vehiculo.salida = self.__politica
+        vehiculo.suscribir(self._al_cambiar)
+
+    def buscar(self, id_vehiculo: str) -> Optional[Vehiculo]:
+        return self.__vehiculos.get(id_vehiculo)
+
+    async def vaciar(self):
+        # Entrega los eventos pendientes como un único lote. Si el sumidero falla, el lote se
+        # devuelve a la cola antes de propagar el error. La escritura está protegida con shield:
+        # si se cancela a quien espera, el sumidero termina igual y el lote solo vuelve a la cola
+        # si esa escritura falla.
+        if self.__pendientes:
+            lote, self.__pendientes = self.__pendientes, []
+            escritura = asyncio.ensure_future(self.__sumidero.escribir(lote))
+            try:
+                await asyncio.shield(escritura)
+            except asyncio.CancelledError:
+                escritura.add_done_callback(lambda tarea: self._al_terminar_escritura(tarea, lote))
+                raise
+            except Exception:
+                self.__pendientes[:0] = lote
+                raise
+
+    async def subir_personas(self, id_vehiculo: str, n: int, usuario: str = "Sistema") -> Resultado:
+        return self._auto(id_vehiculo).subir_personas(n, usuario)
+
+    async def bajar_personas(self, id_vehiculo: str, n: int, usuario: str = "Sistema") -> Resultado:
+        return self._auto(id_vehiculo).bajar_personas(n, usuario)
+
+    async def actualizar_peso(self, id_vehiculo: str, nuevo_peso_kg: float, usuario: str = "Sistema") -> Resultado:
+        return self.__vehiculos[id_vehiculo].actualizar_peso(nuevo_peso_kg, usuario)
+
+    async def habilitar(self, id_vehiculo: str, motivo: str, usuario: str = "Sistema") -> Resultado:
+        return self.__vehiculos[id_vehiculo].habilitar(motivo, usuario)
+
+    async def inhabilitar(self, id_vehiculo: str, motivo: str, usuario: str = "Sistema") -> Resultado:
+        return self.__vehiculos[id_vehiculo].inhabilitar(motivo, usuario)
@@ -1,8 +1,36 @@
+from __future__ import annotations
+
+import logging
+import time
 from datetime import datetime
-from typing import List, Union, Dict
+from functools import wraps
+from typing import Callable, List, Union, Dict, Optional, Sequence
+
+from comun.almacen_eventos import AlmacenEventos
+from comun.cerrojos import CerrojosRayados
+from comun.resultado import Resultado, OK, SIN_CAMBIOS, RECHAZADO, INVALIDO
+from comun.salida import PoliticaSalida, politica_actual
+from comun.textos import internar, internar_texto
+from comun.vistas import VistaSoloLectura
+
+def _sincronizado(metodo):
+    # Modo concurrente: si la clase tiene cerrojos configurados, la operación completa
+    # (validación, cambio, eventos y notificaciones) se ejecuta con la franja del vehículo tomada
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        cerrojos = self.cerrojos
+        if cerrojos is None:
+            return metodo(self, *args, **kwargs)
+        with cerrojos.para(self.id_vehiculo):
+            return metodo(self, *args, **kwargs)
+    return envoltura
 
 class Vehiculo:
     PESO_MINIMO = 0.001 
+    almacen_eventos: Optional[AlmacenEventos] = None
+    salida: Optional[PoliticaSalida] = None
+    # Cerrojos para usar los vehículos desde varios hilos; configurar antes de lanzarlos
+    cerrojos: Optional[CerrojosRayados] = None
 
     def __init__(self, id_vehiculo: str, patente: str, peso_kg: float):
         # Atributos encapsulados
@@ -14,32 +42,52 @@ class Vehiculo:
         # Historial y contadores derivados
         self.__historial_eventos: List[Evento] = []
         self.__conteo_estado = 0
-        self.__fecha_ultima_actualizacion = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.__marca_ultima_actualizacion = time.time()
+        self.__observadores: Optional[List[Callable]] = None  # Se crea al primer suscriptor
         
         self._registrar_evento("Inicialización", "N/A", f"Patente: {self.__patente}, Peso: {self.__peso_kg} kg", usuario="Admin")
 
     # --- Propiedades (Getters) ---
     @property
+    def id_vehiculo(self): return self.__id_vehiculo
+    @property
     def patente(self): return self.__patente
     @property
     def peso_kg(self): return self.__peso_kg
     @property
     def estado(self): return self.__estado
     @property
-    def historial_eventos(self) -> List[Evento]: return list(self.__historial_eventos)
+    def historial_eventos(self) -> Sequence[Evento]:
+        if self.almacen_eventos is not None:
+            return self.almacen_eventos.consultar(self.__id_vehiculo)
+        return VistaSoloLectura(self.__historial_eventos)
     @property
     def conteo_cambios_estado(self) -> int: return self.__conteo_estado
     @property
-    def fecha_ultima_actualizacion(self) -> str: return self.__fecha_ultima_actualizacion
+    def fecha_ultima_actualizacion(self) -> str:
+        return datetime.fromtimestamp(self.__marca_ultima_actualizacion).strftime("%Y-%m-%d %H:%M:%S")
     
     # --- Métodos Auxiliares Internos ---
     
+    def _emitir(self, nivel: int, mensaje: str, *args):
+        (self.salida or politica_actual()).emitir(nivel, mensaje, *args)
+
     def _registrar_evento(self, campo: str, valor_anterior: Union[str, float, int], 
                           valor_nuevo: Union[str, float, int], usuario: str = "Sistema", silent: bool = False):
-        self.__historial_eventos.append(Evento(campo, str(valor_anterior), str(valor_nuevo), usuario))
-        self.__fecha_ultima_actualizacion = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        evento = Evento(campo, str(valor_anterior), str(valor_nuevo), usuario)
+        if self.almacen_eventos is not None:
+            self.almacen_eventos.agregar(self.__id_vehiculo, evento)
+        else:
+            self.__historial_eventos.append(evento)
+        self.__marca_ultima_actualizacion = time.time()
+        self._notificar("evento", None, evento)
         if not silent:
-            print(f"[AUDIT] -> {campo} registrado.")
+            self._emitir(logging.INFO, "[AUDIT] -> %s registrado.", campo)
+
+    def _notificar(self, campo: str, valor_anterior, valor_nuevo):
+        if self.__observadores:
+            for observador in self.__observadores:
+                observador(self, campo, valor_anterior, valor_nuevo)
 
     def _validar_patente(self, patente: str) -> str:
         if not patente or patente.strip() == "":
@@ -50,45 +98,67 @@ class Vehiculo:
         if peso <= self.PESO_MINIMO:
             raise ValueError(f"El peso debe ser positivo (mayor a {self.PESO_MINIMO} kg).")
         return round(peso, 2)
+
+    # --- Suscripciones ---
+
+    def suscribir(self, observador: Callable):
+        # observador(vehiculo, campo, valor_anterior, valor_nuevo). Cada evento nuevo (Evento o
+        # EventoOcupacion) también se notifica, con campo "evento" y el evento como valor_nuevo
+        if self.__observadores is None:
+            self.__observadores = []
+        self.__observadores.append(observador)
+
+    def desuscribir(self, observador: Callable):
+        if self.__observadores and observador in self.__observadores:
+            self.__observadores.remove(observador)
     
     # --- Operaciones ---
 
-    def actualizar_peso(self, nuevo_peso_kg: float, usuario: str = "Sistema"):
+    @_sincronizado
+    def actualizar_peso(self, nuevo_peso_kg: float, usuario: str = "Sistema") -> Resultado:
         # Regla: No se permiten operaciones sobre vehículos inhabilitados salvo habilitar.
         if self.__estado == "inhabilitado":
-            print(f"❌ RECHAZADO: El vehículo está inhabilitado. Operación de peso no permitida.")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: El vehículo está inhabilitado. Operación de peso no permitida.")
+            return Resultado(RECHAZADO, 0, self.__peso_kg)
 
         try:
             nuevo_peso_validado = self._validar_peso(nuevo_peso_kg)
         except ValueError as e:
-            print(f"❌ Error de validación de peso: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de peso: %s", e)
+            return Resultado(INVALIDO, 0, self.__peso_kg)
 
         peso_previo = self.__peso_kg
         self.__peso_kg = nuevo_peso_validado
         self._registrar_evento("Actualización Peso", peso_previo, self.__peso_kg, usuario)
-        print(f"✅ Peso actualizado a: {self.__peso_kg:.2f} kg.")
+        self._notificar("peso_kg", peso_previo, self.__peso_kg)
+        self._emitir(logging.INFO, "✅ Peso actualizado a: %.2f kg.", self.__peso_kg)
+        return Resultado(OK, self.__peso_kg, self.__peso_kg)
 
-    def habilitar(self, motivo: str, usuario: str = "Sistema"):
+    @_sincronizado
+    def habilitar(self, motivo: str, usuario: str = "Sistema") -> Resultado:
         if self.__estado == "habilitado":
-            print("ℹ️ El vehículo ya está habilitado.")
-            return
+            self._emitir(logging.INFO, "ℹ️ El vehículo ya está habilitado.")
+            return Resultado(SIN_CAMBIOS)
         
         self._registrar_evento("Cambio Estado", self.__estado, "habilitado", usuario)
         self.__estado = "habilitado"
         self.__conteo_estado += 1
-        print(f"✅ Vehículo **habilitado**. Motivo: {motivo}")
+        self._notificar("estado", "inhabilitado", "habilitado")
+        self._emitir(logging.INFO, "✅ Vehículo **habilitado**. Motivo: %s", motivo)
+        return Resultado(OK)
 
-    def inhabilitar(self, motivo: str, usuario: str = "Sistema"):
+    @_sincronizado
+    def inhabilitar(self, motivo: str, usuario: str = "Sistema") -> Resultado:
         if self.__estado == "inhabilitado":
-            print("ℹ️ El vehículo ya está inhabilitado.")
-            return
+            self._emitir(logging.INFO, "ℹ️ El vehículo ya está inhabilitado.")
+            return Resultado(SIN_CAMBIOS)
         
         self._registrar_evento("Cambio Estado", self.__estado, "inhabilitado", usuario)
         self.__estado = "inhabilitado"
         self.__conteo_estado += 1
-        print(f"✅ Vehículo **inhabilitado**. Motivo: {motivo}")
+        self._notificar("estado", "habilitado", "inhabilitado")
+        self._emitir(logging.INFO, "✅ Vehículo **inhabilitado**. Motivo: %s", motivo)
+        return Resultado(OK)
         
     def consultar_ficha(self) -> Dict:
         # Devuelve datos actuales y últimas marcas de auditoría.
@@ -114,6 +184,9 @@ class Auto(Vehiculo):
         self.__eventos_ocupacion: List[EventoOcupacion] = [] # Solo lectura
         
     # --- Propiedades (Getters y Derivados) ---
+    @property
+    def asientos_totales(self) -> int: return self.__asientos_totales
+
     @property
     def ocupantes_actuales(self) -> int: return self.__ocupantes_actuales
     
@@ -127,7 +200,8 @@ class Auto(Vehiculo):
         return round((self.__ocupantes_actuales / self.__asientos_totales) * 100, 2)
 
     @property
-    def eventos_ocupacion(self) -> List[EventoOcupacion]: return list(self.__eventos_ocupacion)
+    def eventos_ocupacion(self) -> Sequence[EventoOcupacion]:
+        return VistaSoloLectura(self.__eventos_ocupacion)
     
     # --- Métodos Auxiliares Internos ---
         
@@ -139,85 +213,99 @@ class Auto(Vehiculo):
     def _check_estado(self, operacion: str) -> bool:
         # Regla: No se puede subir_personas ni bajar_personas si el vehículo está inhabilitado.
         if self.estado == "inhabilitado":
-            print(f"❌ RECHAZADO: El auto está inhabilitado. Operación '{operacion}' no permitida.")
+            self._emitir(logging.WARNING, "❌ RECHAZADO: El auto está inhabilitado. Operación '%s' no permitida.", operacion)
             # Registro en el historial general (heredado)
             self._registrar_evento("Rechazo Operación", operacion, self.estado, silent=True)
             return False
         return True
 
     def _registrar_evento_ocupacion(self, accion: str, cantidad: int, antes: int, despues: int, usuario: str = "Sistema"):
-        self.__eventos_ocupacion.append(EventoOcupacion(accion, cantidad, antes, despues, usuario))
+        evento = EventoOcupacion(accion, cantidad, antes, despues, usuario)
+        self.__eventos_ocupacion.append(evento)
+        self._notificar("evento", None, evento)
         
     # --- Operaciones de Ocupación ---
 
-    def subir_personas(self, n: int, usuario: str = "Sistema"):
-        if not self._check_estado("Subir Personas"): return
+    @_sincronizado
+    def subir_personas(self, n: int, usuario: str = "Sistema") -> Resultado:
+        if not self._check_estado("Subir Personas"): return Resultado(RECHAZADO, 0, self.__ocupantes_actuales)
         
         # Regla: n ≥ 1
         if n < 1:
-            print("❌ Error: La cantidad de personas a subir debe ser al menos 1.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: La cantidad de personas a subir debe ser al menos 1.")
+            return Resultado(INVALIDO, 0, self.__ocupantes_actuales)
 
         asientos_libres = self.asientos_libres
         
         # Regla: ocupantes_actuales + n ≤ asientos_totales
         if n > asientos_libres:
-            print(f"❌ RECHAZADO: Excede el límite. Solo quedan {asientos_libres} asientos libres (solicitados: {n}).")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: Excede el límite. Solo quedan %s asientos libres (solicitados: %s).", asientos_libres, n)
+            return Resultado(RECHAZADO, 0, self.__ocupantes_actuales)
             
         ocupantes_previos = self.__ocupantes_actuales
         self.__ocupantes_actuales += n
         
         self._registrar_evento_ocupacion("Subida", n, ocupantes_previos, self.__ocupantes_actuales, usuario)
-        print(f"✅ Subieron {n} personas. Ocupantes: {self.__ocupantes_actuales}.")
+        self._notificar("ocupantes_actuales", ocupantes_previos, self.__ocupantes_actuales)
+        self._emitir(logging.INFO, "✅ Subieron %s personas. Ocupantes: %s.", n, self.__ocupantes_actuales)
+        return Resultado(OK, n, self.__ocupantes_actuales)
 
-    def bajar_personas(self, n: int, usuario: str = "Sistema"):
-        if not self._check_estado("Bajar Personas"): return
+    @_sincronizado
+    def bajar_personas(self, n: int, usuario: str = "Sistema") -> Resultado:
+        if not self._check_estado("Bajar Personas"): return Resultado(RECHAZADO, 0, self.__ocupantes_actuales)
 
         # Regla: n ≥ 1
         if n < 1:
-            print("❌ Error: La cantidad de personas a bajar debe ser al menos 1.")
-            return
+            self._emitir(logging.WARNING, "❌ Error: La cantidad de personas a bajar debe ser al menos 1.")
+            return Resultado(INVALIDO, 0, self.__ocupantes_actuales)
             
         # Regla: ocupantes_actuales - n ≥ 0
         if self.__ocupantes_actuales - n < 0:
-            print(f"❌ RECHAZADO: No puede bajar {n} personas. Solo hay {self.__ocupantes_actuales} ocupantes.")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: No puede bajar %s personas. Solo hay %s ocupantes.", n, self.__ocupantes_actuales)
+            return Resultado(RECHAZADO, 0, self.__ocupantes_actuales)
 
         ocupantes_previos = self.__ocupantes_actuales
         self.__ocupantes_actuales -= n
         
         self._registrar_evento_ocupacion("Bajada", n, ocupantes_previos, self.__ocupantes_actuales, usuario)
-        print(f"✅ Bajaron {n} personas. Ocupantes: {self.__ocupantes_actuales}.")
+        self._notificar("ocupantes_actuales", ocupantes_previos, self.__ocupantes_actuales)
+        self._emitir(logging.INFO, "✅ Bajaron %s personas. Ocupantes: %s.", n, self.__ocupantes_actuales)
+        return Resultado(OK, n, self.__ocupantes_actuales)
 
-    def reconfigurar_asientos(self, nuevo_total: int, motivo: str, usuario: str = "Sistema"):
+    @_sincronizado
+    def reconfigurar_asientos(self, nuevo_total: int, motivo: str, usuario: str = "Sistema") -> Resultado:
         try:
             nuevo_total_validado = self._validar_asientos(nuevo_total)
         except ValueError as e:
-            print(f"❌ Error de validación de asientos: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de asientos: %s", e)
+            return Resultado(INVALIDO, 0, self.__asientos_totales)
             
         # Regla: Si reconfigurar_asientos reduce asientos por debajo de la ocupación actual, debe rechazarse.
         if self.__ocupantes_actuales > nuevo_total_validado:
-            print(f"❌ RECHAZADO: Ocupación actual ({self.__ocupantes_actuales}) excede el nuevo total ({nuevo_total_validado}).")
-            return
+            self._emitir(logging.WARNING, "❌ RECHAZADO: Ocupación actual (%s) excede el nuevo total (%s).", self.__ocupantes_actuales, nuevo_total_validado)
+            return Resultado(RECHAZADO, 0, self.__asientos_totales)
             
         asientos_previos = self.__asientos_totales
         self.__asientos_totales = nuevo_total_validado
         
         self._registrar_evento("Reconfiguración Asientos", asientos_previos, self.__asientos_totales, usuario)
-        print(f"✅ Asientos reconfigurados a {self.__asientos_totales}. Motivo: {motivo}")
+        self._notificar("asientos_totales", asientos_previos, self.__asientos_totales)
+        self._emitir(logging.INFO, "✅ Asientos reconfigurados a %s. Motivo: %s", self.__asientos_totales, motivo)
+        return Resultado(OK, self.__asientos_totales, self.__asientos_totales)
 
-    def vaciar_auto(self, motivo: str, usuario: str = "Sistema"):
+    @_sincronizado
+    def vaciar_auto(self, motivo: str, usuario: str = "Sistema") -> Resultado:
         if self.__ocupantes_actuales == 0:
-            print("ℹ️ El auto ya está vacío.")
-            return
+            self._emitir(logging.INFO, "ℹ️ El auto ya está vacío.")
+            return Resultado(SIN_CAMBIOS)
             
         ocupantes_previos = self.__ocupantes_actuales
         self.__ocupantes_actuales = 0
         
         self._registrar_evento_ocupacion("Vaciar Auto", ocupantes_previos, ocupantes_previos, 0, usuario)
-        print(f"✅ Auto vaciado (Bajaron {ocupantes_previos} personas). Motivo: {motivo}")
+        self._notificar("ocupantes_actuales", ocupantes_previos, 0)
+        self._emitir(logging.INFO, "✅ Auto vaciado (Bajaron %s personas). Motivo: %s", ocupantes_previos, motivo)
+        return Resultado(OK, ocupantes_previos, 0)
 
     def consultar_ocupacion(self) -> Dict:
         # Devuelve ocupantes actuales, asientos libres y tasa de ocupación.
@@ -229,12 +317,19 @@ class Auto(Vehiculo):
 
 # Clase auxiliar para el historial_eventos (Modelo A)
 class Evento:
+    __slots__ = ("marca_tiempo", "usuario", "tipo_evento", "detalle_anterior", "detalle_nuevo")
+
     def __init__(self, campo: str, detalle_anterior: str, detalle_nuevo: str, usuario: str = "Sistema"):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.usuario = usuario
-        self.tipo_evento = campo 
-        self.detalle_anterior = detalle_anterior
-        self.detalle_nuevo = detalle_nuevo
+        self.marca_tiempo = time.time()  # Epoch en segundos; se formatea solo al mostrar
+        self.usuario = internar(usuario)
+        self.tipo_evento = internar(campo)
+        self.detalle_anterior = internar_texto(detalle_anterior)
+        self.detalle_nuevo = internar_texto(detalle_nuevo)
+
+    @property
+    def fecha(self) -> str:
+        # El formateo se difiere hasta que alguien lo pide (__str__, exportación)
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
 
     def __str__(self):
         return (f"[{self.fecha} - {self.usuario}] {self.tipo_evento}: "
@@ -242,14 +337,20 @@ class Evento:
 
 # Clase auxiliar para los eventos_ocupacion (Modelo B)
 class EventoOcupacion:
+    __slots__ = ("marca_tiempo", "usuario", "accion", "cantidad", "ocupantes_antes", "ocupantes_despues")
+
     def __init__(self, accion: str, cantidad: int, ocupantes_antes: int, ocupantes_despues: int, usuario: str = "Sistema"):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.usuario = usuario
-        self.accion = accion
+        self.marca_tiempo = time.time()
+        self.usuario = internar(usuario)
+        self.accion = internar(accion)
         self.cantidad = cantidad
         self.ocupantes_antes = ocupantes_antes
         self.ocupantes_despues = ocupantes_despues
 
+    @property
+    def fecha(self) -> str:
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
+
     def __str__(self):
         return (f"[{self.fecha} - {self.usuario}] OCUPACIÓN ({self.accion}): Cantidad: {self.cantidad} p. "
                 f"Ocupantes: {self.ocupantes_antes} -> {self.ocupantes_despues}")
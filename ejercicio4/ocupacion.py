@@ -0,0 +1,140 @@
+import threading
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from comun.resultado import Resultado, OK, RECHAZADO, INVALIDO
+from ejercicio4.desarrollo4 import Auto
+
+# Ocupación de una flota de autos para el despacho de viajes compartidos.
+#
+# Los autos se agrupan en baldes por (estado, asientos_libres). Cada balde es un dict
+# id -> Auto (altas y bajas O(1), orden de llegada). Los baldes se actualizan solos en cada
+# subir_personas, bajar_personas, vaciar_auto, reconfigurar_asientos, habilitar e inhabilitar
+# (vía suscripción), así que buscar un auto con al menos N asientos libres solo revisa los
+# baldes entre N y el máximo de asientos de la flota, sin recorrer los autos.
+#
+# Los índices tienen su propio cerrojo, así que la flota se puede usar desde varios hilos junto
+# con Vehiculo.cerrojos. Orden de los cerrojos: primero la franja del auto y después el de la flota.
+
+Clave = Tuple[str, int]  # (estado, asientos_libres)
+
+
+class OcupacionFlota:
+    def __init__(self):
+        self.__por_id: Dict[str, Auto] = {}
+        self.__baldes: Dict[Clave, Dict[str, Auto]] = {}
+        self.__claves: Dict[str, Clave] = {}
+        self.__max_libres = 0  # Cota superior de asientos_libres en la flota (no baja al quitar autos)
+        self.__cerrojo = threading.Lock()
+
+    # --- Propiedades (Getters) ---
+    def __len__(self):
+        return len(self.__por_id)
+
+    def __contains__(self, id_vehiculo: str):
+        return id_vehiculo in self.__por_id
+
+    # --- Métodos Auxiliares Internos ---
+
+    @staticmethod
+    def _cerrojo_auto(auto: Auto):
+        return auto.cerrojos.para(auto.id_vehiculo) if auto.cerrojos is not None else nullcontext()
+
+    @staticmethod
+    def _clave(auto: Auto) -> Clave:
+        return auto.estado, auto.asientos_libres
+
+    def _ubicar(self, auto: Auto):
+        clave = self._clave(auto)
+        self.__baldes.setdefault(clave, {})[auto.id_vehiculo] = auto
+        self.__claves[auto.id_vehiculo] = clave
+        self.__max_libres = max(self.__max_libres, clave[1])
+
+    def _retirar(self, id_vehiculo: str):
+        clave = self.__claves.pop(id_vehiculo)
+        balde = self.__baldes[clave]
+        del balde[id_vehiculo]
+        if not balde:
+            del self.__baldes[clave]
+
+    def _al_cambiar(self, auto: Auto, campo: str, valor_anterior, valor_nuevo):
+        if campo in ("estado", "ocupantes_actuales", "asientos_totales"):
+            with self.__cerrojo:
+                self._retirar(auto.id_vehiculo)
+                self._ubicar(auto)
+
+    # --- Operaciones ---
+
+    def agregar(self, auto: Auto):
+        with self._cerrojo_auto(auto), self.__cerrojo:
+            if auto.id_vehiculo in self.__por_id:
+                raise ValueError(f"El auto '{auto.id_vehiculo}' ya está en la flota.")
+            self.__por_id[auto.id_vehiculo] = auto
+            self._ubicar(auto)
+            auto.suscribir(self._al_cambiar)
+
+    def quitar(self, id_vehiculo: str) -> Auto:
+        auto = self.__por_id[id_vehiculo]
+        with self._cerrojo_auto(auto), self.__cerrojo:
+            del self.__por_id[id_vehiculo]
+            auto.desuscribir(self._al_cambiar)
+            self._retirar(id_vehiculo)
+        return auto
+
+    def buscar(self, id_vehiculo: str) -> Optional[Auto]:
+        return self.__por_id.get(id_vehiculo)
+
+    def buscar_auto(self, n: int) -> Optional[Auto]:
+        # Auto habilitado con al menos n asientos libres. Se elige el de menos asientos libres
+        # que alcance (el más ajustado), para dejar libres los autos más vacíos.
+        with self.__cerrojo:
+            for libres in range(max(n, 1), self.__max_libres + 1):
+                balde = self.__baldes.get(("habilitado", libres))
+                if balde:
+                    return next(iter(balde.values()))
+        return None
+
+    def asignar(self, n: int, usuario: str = "Sistema") -> Tuple[Optional[Auto], Optional[Resultado]]:
+        # Busca un auto para n pasajeros y los sube. Devuelve (auto, resultado) o (None, None).
+        # Con varios hilos el auto elegido puede llenarse antes de subir: se vuelve a buscar.
+        if n < 1:
+            return None, Resultado(INVALIDO)
+        while True:
+            auto = self.buscar_auto(n)
+            if auto is None:
+                return None, None
+            resultado = auto.subir_personas(n, usuario)
+            if resultado.ok:
+                return auto, resultado
+
+    def autos_en(self, estado: str, asientos_libres: int) -> List[Auto]:
+        with self.__cerrojo:
+            return list(self.__baldes.get((estado, asientos_libres), {}).values())
+
+    def contar(self, estado: str, asientos_libres: int) -> int:
+        with self.__cerrojo:
+            return len(self.__baldes.get((estado, asientos_libres), ()))
+
+    def distribucion(self) -> Dict[Clave, int]:
+        # Cantidad de autos por (estado, asientos_libres)
+        with self.__cerrojo:
+            return {clave: len(balde) for clave, balde in sorted(self.__baldes.items())}
+
+
+def subir_en_varios(asignaciones: Sequence[Tuple[Auto, int]], usuario: str = "Sistema") -> Resultado:
+    # Sube n personas a cada auto de forma atómica: o suben todas o no sube ninguna.
+    # Resultado(OK, personas subidas, autos usados); RECHAZADO si algún auto está inhabilitado
+    # o no tiene lugar, INVALIDO si alguna cantidad es menor a 1.
+    por_auto: Dict[str, List] = {}
+    for auto, n in asignaciones:
+        if n < 1:
+            return Resultado(INVALIDO)
+        por_auto.setdefault(auto.id_vehiculo, [auto, 0])[1] += n
+
+    cerrojos = Auto.cerrojos
+    with cerrojos.varios(por_auto) if cerrojos is not None else nullcontext():
+        if any(auto.estado == "inhabilitado" or n > auto.asientos_libres for auto, n in por_auto.values()):
+            return Resultado(RECHAZADO)
+        for auto, n in por_auto.values():
+            auto.subir_personas(n, usuario)
+    return Resultado(OK, sum(n for _, n in por_auto.values()), len(por_auto))
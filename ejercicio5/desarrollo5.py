@@ -1,9 +1,21 @@
+from __future__ import annotations
+
 import math
+import logging
+import time
 from datetime import datetime
-from typing import List, Union, Dict
+from typing import List, Union, Dict, Optional, Sequence
+
+from comun.almacen_eventos import AlmacenEventos
+from comun.resultado import Resultado, OK, INVALIDO
+from comun.salida import PoliticaSalida, politica_actual
+from comun.textos import internar, internar_texto
+from comun.vistas import VistaSoloLectura
 
 class CuerpoCeleste:
     MASA_MINIMA = 1e-10 # Establecer un valor cercano a cero para validación
+    almacen_eventos: Optional[AlmacenEventos] = None
+    salida: Optional[PoliticaSalida] = None
 
     def __init__(self, id_celeste: str, nombre: str, masa_kg: float):
         # Atributos encapsulados
@@ -13,7 +25,7 @@ class CuerpoCeleste:
         
         # Auditoría
         self.__historial_eventos: List[Evento] = []
-        self.__fecha_ultima_actualizacion = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.__marca_ultima_actualizacion = time.time()
         self.__num_modificaciones = 0
         
         self._registrar_evento("Inicialización", "N/A", f"Masa: {self.__masa_kg} kg", silent=True)
@@ -26,21 +38,32 @@ class CuerpoCeleste:
     @property
     def masa_kg(self): return self.__masa_kg
     @property
-    def historial_eventos(self) -> List[Evento]: return list(self.__historial_eventos)
+    def historial_eventos(self) -> Sequence[Evento]:
+        if self.almacen_eventos is not None:
+            return self.almacen_eventos.consultar(self.__id_celeste)
+        return VistaSoloLectura(self.__historial_eventos)
     @property
-    def fecha_ultima_actualizacion(self) -> str: return self.__fecha_ultima_actualizacion
+    def fecha_ultima_actualizacion(self) -> str:
+        return datetime.fromtimestamp(self.__marca_ultima_actualizacion).strftime("%Y-%m-%d %H:%M:%S")
     @property
     def num_modificaciones(self) -> int: return self.__num_modificaciones
     
     # --- Métodos Auxiliares Internos ---
     
+    def _emitir(self, nivel: int, mensaje: str, *args):
+        (self.salida or politica_actual()).emitir(nivel, mensaje, *args)
+
     def _registrar_evento(self, campo: str, valor_anterior: Union[str, float, int], 
                           valor_nuevo: Union[str, float, int], silent: bool = False):
-        self.__historial_eventos.append(Evento(campo, valor_anterior, valor_nuevo))
-        self.__fecha_ultima_actualizacion = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        evento = Evento(campo, valor_anterior, valor_nuevo)
+        if self.almacen_eventos is not None:
+            self.almacen_eventos.agregar(self.__id_celeste, evento)
+        else:
+            self.__historial_eventos.append(evento)
+        self.__marca_ultima_actualizacion = time.time()
         self.__num_modificaciones += 1
         if not silent:
-            print(f"[AUDIT] -> {campo} registrado.")
+            self._emitir(logging.INFO, "[AUDIT] -> %s registrado.", campo)
             
     def _validar_nombre(self, nombre: str) -> str:
         if not nombre or nombre.strip() == "":
@@ -55,29 +78,31 @@ class CuerpoCeleste:
         
     # --- Operaciones ---
 
-    def actualizar_nombre(self, nuevo_nombre: str):
+    def actualizar_nombre(self, nuevo_nombre: str) -> Resultado:
         try:
             nuevo_nombre_validado = self._validar_nombre(nuevo_nombre)
         except ValueError as e:
-            print(f"❌ Error de validación de nombre: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de nombre: %s", e)
+            return Resultado(INVALIDO)
             
         nombre_previo = self.__nombre
         self.__nombre = nuevo_nombre_validado
         self._registrar_evento("nombre", nombre_previo, self.__nombre)
-        print(f"✅ Nombre actualizado a: '{self.__nombre}'")
+        self._emitir(logging.INFO, "✅ Nombre actualizado a: '%s'", self.__nombre)
+        return Resultado(OK)
 
-    def actualizar_masa(self, nueva_masa: float):
+    def actualizar_masa(self, nueva_masa: float) -> Resultado:
         try:
             nueva_masa_validada = self._validar_masa(nueva_masa)
         except ValueError as e:
-            print(f"❌ Error de validación de masa: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación de masa: %s", e)
+            return Resultado(INVALIDO, 0, self.__masa_kg)
 
         masa_previa = self.__masa_kg
         self.__masa_kg = nueva_masa_validada
         self._registrar_evento("masa_kg", masa_previa, self.__masa_kg)
-        print(f"✅ Masa actualizada a: {self.__masa_kg:.2e} kg.")
+        self._emitir(logging.INFO, "✅ Masa actualizada a: %.2e kg.", self.__masa_kg)
+        return Resultado(OK, self.__masa_kg, self.__masa_kg)
 
     def consultar_ficha(self) -> Dict:
         # Devuelve datos actuales más últimos eventos.
@@ -113,29 +138,31 @@ class Planeta(CuerpoCeleste):
 
     # --- Operaciones ---
 
-    def actualizar_radio(self, nuevo_radio: float):
+    def actualizar_radio(self, nuevo_radio: float) -> Resultado:
         try:
             nuevo_radio_validado = self._validar_parametro(nuevo_radio, "radio_km")
         except ValueError as e:
-            print(f"❌ Error de validación: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación: %s", e)
+            return Resultado(INVALIDO, 0, self.__radio_km)
 
         radio_previo = self.__radio_km
         self.__radio_km = nuevo_radio_validado
         self._registrar_evento("radio_km", radio_previo, self.__radio_km)
-        print(f"✅ Radio actualizado a: {self.__radio_km:.2e} km.")
+        self._emitir(logging.INFO, "✅ Radio actualizado a: %.2e km.", self.__radio_km)
+        return Resultado(OK, self.__radio_km, self.__radio_km)
 
-    def actualizar_distancia_sol(self, nueva_distancia: float):
+    def actualizar_distancia_sol(self, nueva_distancia: float) -> Resultado:
         try:
             nueva_distancia_validada = self._validar_parametro(nueva_distancia, "distancia_sol_km")
         except ValueError as e:
-            print(f"❌ Error de validación: {e}")
-            return
+            self._emitir(logging.WARNING, "❌ Error de validación: %s", e)
+            return Resultado(INVALIDO, 0, self.__distancia_sol_km)
 
         distancia_previa = self.__distancia_sol_km
         self.__distancia_sol_km = nueva_distancia_validada
         self._registrar_evento("distancia_sol_km", distancia_previa, self.__distancia_sol_km)
-        print(f"✅ Distancia al Sol actualizada a: {self.__distancia_sol_km:.2e} km.")
+        self._emitir(logging.INFO, "✅ Distancia al Sol actualizada a: %.2e km.", self.__distancia_sol_km)
+        return Resultado(OK, self.__distancia_sol_km, self.__distancia_sol_km)
 
     def calcular_densidad(self) -> Union[float, str]:
         # Volumen aproximado de una esfera: V = 4/3 * π * radio³
@@ -166,11 +193,18 @@ class Planeta(CuerpoCeleste):
 
 # Clase auxiliar para el historial_eventos
 class Evento:
+    __slots__ = ("marca_tiempo", "campo", "valor_anterior", "valor_nuevo")
+
     def __init__(self, campo: str, valor_anterior: Union[str, float, int], valor_nuevo: Union[str, float, int]):
-        self.fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.campo = campo
-        self.valor_anterior = str(valor_anterior)
-        self.valor_nuevo = str(valor_nuevo)
+        self.marca_tiempo = time.time()  # Epoch en segundos; se formatea solo al mostrar
+        self.campo = internar(campo)
+        self.valor_anterior = internar_texto(str(valor_anterior))
+        self.valor_nuevo = internar_texto(str(valor_nuevo))
+
+    @property
+    def fecha(self) -> str:
+        # El formateo se difiere hasta que alguien lo pide (__str__, exportación)
+        return datetime.fromtimestamp(self.marca_tiempo).strftime("%Y-%m-%d %H:%M:%S")
 
     def __str__(self):
         return (f"[{self.fecha}] CAMBIO en '{self.campo}': De '{self.valor_anterior}' a '{self.valor_nuevo}'")
\ No newline at end of file
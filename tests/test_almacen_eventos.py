@@ -0,0 +1,72 @@
+import pytest
+
+from comun.almacen_eventos import AlmacenMemoria, RegistroSegmentos
+from ejercicio1.desarrollo import Evento
+from ejercicio2.desarrollo2 import Evento as EventoPublicacion
+
+
+def _evento(i: int) -> Evento:
+    evento = Evento("Prueba", f"Evento {i}")
+    evento.marca_tiempo = float(i)
+    return evento
+
+
+def _detalles(eventos) -> list:
+    return [evento.detalle for evento in eventos]
+
+
+def test_buffer_circular_descarta_los_mas_antiguos_al_llenarse():
+    almacen = AlmacenMemoria(capacidad=3)
+    for i in range(5):
+        almacen.agregar("P1" if i % 2 == 0 else "P2", _evento(i))
+
+    assert len(almacen) == 3
+    assert almacen.total_registrados == 5
+    assert _detalles(almacen.consultar()) == ["Evento 2", "Evento 3", "Evento 4"]
+    assert _detalles(almacen.consultar("P1")) == ["Evento 2", "Evento 4"]
+    assert _detalles(almacen.consultar(desde=3.0)) == ["Evento 3", "Evento 4"]
+
+
+def test_desborde_a_registro_de_segmentos(tmp_path):
+    registro = RegistroSegmentos(str(tmp_path), Evento, tamanio_segmento=64)
+    almacen = AlmacenMemoria(capacidad=2, desborde=registro)
+    for i in range(6):
+        almacen.agregar("P1" if i < 3 else "P2", _evento(i))
+
+    # Los cuatro más antiguos pasaron al registro, en más de un segmento por el tamaño chico
+    assert len(registro.consultar()) == 4
+    assert len(registro.segmentos) > 1
+    assert _detalles(almacen.consultar()) == [f"Evento {i}" for i in range(6)]
+    assert _detalles(almacen.consultar("P1")) == ["Evento 0", "Evento 1", "Evento 2"]
+    assert _detalles(almacen.consultar(desde=1.0, hasta=4.0)) == [f"Evento {i}" for i in range(1, 5)]
+
+    almacen.volcar()
+    assert len(almacen) == 0
+    assert _detalles(registro.consultar("P2")) == ["Evento 3", "Evento 4", "Evento 5"]
+    registro.cerrar()
+
+
+def test_reabrir_segmentos_existentes(tmp_path):
+    registro = RegistroSegmentos(str(tmp_path), Evento, tamanio_segmento=64)
+    for i in range(4):
+        registro.agregar("P1", _evento(i))
+    registro.cerrar()
+
+    reabierto = RegistroSegmentos(str(tmp_path), Evento, tamanio_segmento=64)
+    assert reabierto.segmentos == registro.segmentos
+    eventos = reabierto.consultar("P1", desde=1.0)
+    assert _detalles(eventos) == ["Evento 1", "Evento 2", "Evento 3"]
+    assert [evento.marca_tiempo for evento in eventos] == [1.0, 2.0, 3.0]
+
+    # Lo nuevo se anexa en un segmento aparte, sin pisar los existentes
+    reabierto.agregar("P2", _evento(9))
+    assert _detalles(reabierto.consultar()) == [f"Evento {i}" for i in (0, 1, 2, 3, 9)]
+    reabierto.cerrar()
+
+
+def test_registro_rechaza_segmentos_de_otra_clase(tmp_path):
+    registro = RegistroSegmentos(str(tmp_path), Evento)
+    registro.agregar("P1", _evento(0))
+    registro.cerrar()
+    with pytest.raises(ValueError):
+        RegistroSegmentos(str(tmp_path), EventoPublicacion)
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from comun.almacen_eventos import AlmacenMemoria
+from comun.salida import BUFFER, configurar_salida, politica_actual
+from ejercicio4.asincronico import FlotaAsincronica, SumideroArchivo, SumideroMemoria
+from ejercicio4.desarrollo4 import Auto, Vehiculo
+
+
+class SumideroInestable(SumideroMemoria):
+    # Falla las primeras 'fallas' escrituras
+    def __init__(self, fallas: int):
+        super().__init__()
+        self.fallas = fallas
+
+    async def escribir(self, lote):
+        if self.fallas > 0:
+            self.fallas -= 1
+            raise OSError("disk")
+        await super().escribir(lote)
+
+
+def test_sumidero_que_falla_no_pierde_eventos_y_la_tarea_sigue_viva():
+    async def escenario():
+        sumidero = SumideroInestable(fallas=2)
+        async with FlotaAsincronica(sumidero, intervalo=0.01) as flota:
+            flota.agregar(Auto("A1", "AB123CD", 1200, 4))
+            await flota.subir_personas("A1", 2)
+            await asyncio.sleep(0.1)  # Dos vaciados fallidos y uno exitoso
+            await flota.bajar_personas("A1", 1)
+        return sumidero, flota
+
+    sumidero, flota = asyncio.run(escenario())
+    assert sumidero.fallas == 0
+    assert flota.pendientes == 0
+    assert [evento.accion for _, evento in sumidero.eventos if hasattr(evento, "accion")] == ["Subida", "Bajada"]
+
+
+def test_vaciar_devuelve_el_lote_si_el_sumidero_falla():
+    async def escenario():
+        flota = FlotaAsincronica(SumideroInestable(fallas=1))
+        flota.agregar(Auto("A1", "AB123CD", 1200, 4))
+        await flota.subir_personas("A1", 1)
+        pendientes = flota.pendientes
+        with pytest.raises(OSError):
+            await flota.vaciar()
+        assert flota.pendientes == pendientes
+        await flota.vaciar()
+        return flota
+
+    assert asyncio.run(escenario()).pendientes == 0
+
+
+def test_captura_eventos_sin_tocar_la_politica_global_ni_depender_del_historial():
+    auto = Auto("A1", "AB123CD", 1200, 4)
+
+    async def escenario():
+        sumidero = SumideroMemoria()
+        async with FlotaAsincronica(sumidero) as flota:
+            flota.agregar(auto)
+            for _ in range(3):
+                await flota.subir_personas("A1", 1)
+                await flota.actualizar_peso("A1", 1300)
+        return sumidero
+
+    politica_previa = configurar_salida(BUFFER)
+    politica = politica_actual()
+    almacen_previo, Vehiculo.almacen_eventos = Vehiculo.almacen_eventos, AlmacenMemoria(capacidad=2)
+    try:
+        sumidero = asyncio.run(escenario())
+        assert politica_actual() is politica
+        assert politica.mensajes == []
+    finally:
+        Vehiculo.almacen_eventos = almacen_previo
+        configurar_salida(politica_previa)
+
+    # Inicialización (antes de agregar) no se captura; el almacén desalojó eventos y no importa
+    tipos = [getattr(evento, "accion", None) or evento.tipo_evento for _, evento in sumidero.eventos]
+    assert tipos == ["Subida", "Actualización Peso"] * 3
+
+
+class SumideroArchivoLento(SumideroArchivo):
+    def _escribir(self, lote):
+        time.sleep(0.2)
+        super()._escribir(lote)
+
+
+def test_cerrar_durante_un_vaciado_lento_no_duplica_eventos(tmp_path):
+    ruta = tmp_path / "eventos.log"
+
+    async def escenario():
+        flota = FlotaAsincronica(SumideroArchivoLento(str(ruta)), intervalo=0.01)
+        await flota.iniciar()
+        flota.agregar(Auto("A1", "AB123CD", 1200, 4))
+        await flota.subir_personas("A1", 2)
+        await asyncio.sleep(0.05)  # La tarea de fondo ya está escribiendo el lote
+        await flota.bajar_personas("A1", 1)
+        await flota.cerrar()
+
+    asyncio.run(escenario())
+    lineas = ruta.read_text(encoding="utf-8").splitlines()
+    assert sum("Subida" in linea for linea in lineas) == 1
+    assert sum("Bajada" in linea for linea in lineas) == 1
+
+
+def test_vaciar_cancelado_no_duplica_ni_pierde_el_lote(tmp_path):
+    ruta = tmp_path / "eventos.log"
+
+    async def escenario():
+        flota = FlotaAsincronica(SumideroArchivoLento(str(ruta)))
+        flota.agregar(Auto("A1", "AB123CD", 1200, 4))
+        await flota.subir_personas("A1", 2)
+        vaciado = asyncio.create_task(flota.vaciar())
+        await asyncio.sleep(0.05)
+        vaciado.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await vaciado
+        await asyncio.sleep(0.3)  # La escritura protegida termina igual
+        assert flota.pendientes == 0
+        await flota.cerrar()
+
+    asyncio.run(escenario())
+    lineas = ruta.read_text(encoding="utf-8").splitlines()
+    assert sum("Subida" in linea for linea in lineas) == 1
@@ -0,0 +1,65 @@
+import pytest
+
+from comun.lista_bloques import ListaPorBloques
+from ejercicio2.catalogo import Catalogo
+from ejercicio2.desarrollo2 import Libro
+
+
+def _libros(n: int, inicio: int = 0):
+    return [Libro(f"L{i}", f"Título {(i * 7) % n:05d}", 1900 + (i * 37) % 120, 100) for i in range(inicio, inicio + n)]
+
+
+def test_cargar_equivale_a_agregar_uno_por_uno():
+    libros = _libros(200)
+    masivo, individual = Catalogo(), Catalogo()
+    masivo.cargar(libros[:150])
+    masivo.agregar(libros[150])
+    masivo.cargar(libros[151:])
+    for libro in _libros(200):
+        individual.agregar(libro)
+
+    assert len(masivo) == 200
+    ids = lambda publicaciones: [p.id_publicacion for p in publicaciones]
+    assert ids(masivo.por_rango_anio(1950, 1980)) == ids(individual.por_rango_anio(1950, 1980))
+    assert ids(masivo.por_prefijo_titulo("título 001")) == ids(individual.por_prefijo_titulo("título 001"))
+
+
+def test_cargar_sigue_los_cambios_y_rechaza_duplicados():
+    catalogo = Catalogo()
+    libros = _libros(10)
+    catalogo.cargar(libros)
+    libros[0].actualizar_anio(2030)
+    assert catalogo.por_rango_anio(2030, 2030) == [libros[0]]
+
+    with pytest.raises(ValueError):
+        catalogo.cargar(_libros(2, inicio=9))
+    assert len(catalogo) == 10
+
+
+def test_indices_por_bloques_tras_muchas_actualizaciones(monkeypatch):
+    monkeypatch.setattr(ListaPorBloques, "TAMANIO_BLOQUE", 4)
+    catalogo = Catalogo()
+    libros = _libros(60)
+    catalogo.cargar(libros[:30])
+    for libro in libros[30:]:
+        catalogo.agregar(libro)
+    for i, libro in enumerate(libros[::3]):
+        libro.actualizar_anio(1950 + i % 5)
+        libro.actualizar_titulo(f"Nuevo {i:03d}")
+
+    esperados = sorted((l for l in libros if 1950 <= l.anio <= 1952), key=lambda l: (l.anio, l.id_publicacion))
+    assert catalogo.por_rango_anio(1950, 1952) == esperados
+    assert [l.titulo for l in catalogo.por_prefijo_titulo("nuevo 01")] == [f"Nuevo 01{d}" for d in range(10)]
+    assert catalogo.por_rango_anio(3000, 3100) == []
+    assert catalogo.por_prefijo_titulo("zzz") == []
+
+
+def test_lista_por_bloques_carga_masiva_y_recorrido(monkeypatch):
+    monkeypatch.setattr(ListaPorBloques, "TAMANIO_BLOQUE", 3)
+    lista = ListaPorBloques([5, 1, 9])
+    lista.cargar([4, 8, 2, 7])
+    lista.agregar(6)
+    assert list(lista) == [1, 2, 4, 5, 6, 7, 8, 9] and len(lista) == 8
+    assert list(lista.desde(5)) == [5, 6, 7, 8, 9]
+    assert list(lista.desde(3)) == [4, 5, 6, 7, 8, 9]
+    assert list(lista.desde(10)) == []
@@ -0,0 +1,45 @@
+import random
+from bisect import bisect_left
+
+from comun.lista_bloques import ListaPorBloques
+from ejercicio3.clasificacion import Clasificacion
+from ejercicio3.desarrollo3 import Carrera
+
+
+def test_lista_por_bloques_coincide_con_una_lista_ordenada(monkeypatch):
+    monkeypatch.setattr(ListaPorBloques, "TAMANIO_BLOQUE", 4)
+    azar = random.Random(7)
+    lista, referencia = ListaPorBloques(), []
+    for _ in range(2000):
+        clave = (azar.randint(0, 300), f"C{azar.randint(0, 9)}")
+        if referencia and azar.random() < 0.4:
+            quitada = azar.choice(referencia)
+            assert lista.quitar(quitada)
+            referencia.remove(quitada)
+        else:
+            lista.agregar(clave)
+            referencia.append(clave)
+            referencia.sort()
+        assert len(lista) == len(referencia)
+    assert lista.primeros(len(referencia) + 5) == referencia
+    assert not lista.quitar((999, "X"))
+    for clave in referencia[::37]:
+        assert lista.posicion(clave) == bisect_left(referencia, clave)
+
+
+def test_clasificacion_reubica_al_cambiar(monkeypatch):
+    monkeypatch.setattr(ListaPorBloques, "TAMANIO_BLOQUE", 2)
+    clasificacion = Clasificacion()
+    carreras = [Carrera(f"C{i}", f"Carrera {i}", 30 + i, 5.0 + i) for i in range(10)]
+    for carrera in carreras:
+        clasificacion.agregar(carrera)
+
+    assert clasificacion.mas_largas(1) == [carreras[9]]
+    carreras[0].registrar_distancia(50.0)
+    assert clasificacion.mas_largas(1) == [carreras[0]]
+    assert clasificacion.mas_rapidas(1) == [carreras[0]]
+    assert clasificacion.posicion_ritmo("C0") == 1
+
+    clasificacion.quitar("C0")
+    ritmos = [c.calcular_ritmo() for c in clasificacion.mas_rapidas(20)]
+    assert ritmos == sorted(ritmos) and len(ritmos) == 9
@@ -0,0 +1,84 @@
+import sys
+import threading
+
+import pytest
+
+from comun.almacen_eventos import AlmacenMemoria
+from comun.cerrojos import CerrojosRayados
+from ejercicio4.desarrollo4 import Auto, Vehiculo
+
+
+# Auto que retiene a cada hilo entre el chequeo de asientos libres y la escritura hasta que el
+# otro hilo llega al mismo punto: abre a propósito la ventana de la carrera check-then-act.
+# Con cerrojos el segundo hilo no puede entrar, la barrera vence y el primero sigue solo.
+class AutoConVentana(Auto):
+    barrera = None
+
+    @property
+    def asientos_libres(self) -> int:
+        libres = super().asientos_libres
+        try:
+            self.barrera.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return libres
+
+
+def _subir_en_paralelo(cerrojos):
+    Vehiculo.cerrojos = cerrojos
+    try:
+        auto = AutoConVentana("A1", "P1", 1200, 4)
+        auto.barrera = threading.Barrier(2, timeout=0.5)
+        resultados = []
+        hilos = [threading.Thread(target=lambda: resultados.append(auto.subir_personas(3))) for _ in range(2)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        return auto, resultados
+    finally:
+        Vehiculo.cerrojos = None
+
+
+def test_sin_cerrojos_la_carrera_sobrevende_asientos():
+    auto, resultados = _subir_en_paralelo(None)
+    assert all(resultado.ok for resultado in resultados)
+    assert auto.ocupantes_actuales == 6 > auto.asientos_totales
+
+
+@pytest.mark.parametrize("franjas", [1, 64])
+def test_con_cerrojos_se_respeta_la_capacidad(franjas):
+    auto, resultados = _subir_en_paralelo(CerrojosRayados(franjas))
+    assert sorted(resultado.ok for resultado in resultados) == [False, True]
+    assert auto.ocupantes_actuales == 3
+
+
+def test_almacen_de_clase_compartido_entre_franjas():
+    # Autos en franjas distintas escriben a la vez en el mismo almacén de clase
+    cerrojos = CerrojosRayados(64)
+    almacen_previo, Vehiculo.almacen_eventos = Vehiculo.almacen_eventos, AlmacenMemoria(capacidad=100_000)
+    Vehiculo.cerrojos = cerrojos
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        autos = [Auto(f"A{i}", f"P{i}", 1200, 4) for i in range(32)]
+
+        def trabajar(desde: int):
+            for i in range(300):
+                autos[(desde + i) % len(autos)].actualizar_peso(1000 + i)
+
+        hilos = [threading.Thread(target=trabajar, args=(h,)) for h in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        almacen = Vehiculo.almacen_eventos
+        assert almacen.total_registrados == len(autos) + 8 * 300
+        historial = [evento for auto in autos for evento in auto.historial_eventos]
+        assert len(historial) == almacen.total_registrados
+        assert all(evento.tipo_evento is not None for evento in historial)
+    finally:
+        sys.setswitchinterval(intervalo)
+        Vehiculo.cerrojos = None
+        Vehiculo.almacen_eventos = almacen_previo
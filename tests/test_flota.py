@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from ejercicio1.desarrollo import ParcelaConRiego
+from ejercicio1.flota import FlotaRiego
+
+
+def _parcela(id_parcela: str) -> ParcelaConRiego:
+    parcela = ParcelaConRiego(id_parcela, 1.0, "Maíz", tasa_riego_l_ha=3000.0)
+    parcela.habilitar_riego()
+    parcela.cargar_agua(10000)
+    return parcela
+
+
+def test_carga_entre_lotes_no_se_pierde():
+    parcela = _parcela("P1")
+    flota = FlotaRiego([parcela])
+
+    flota.regar_lote("estricto")
+    assert parcela.litros_disponibles == 7000.0
+
+    parcela.cargar_agua(10000)
+    flota.regar_lote("estricto")
+    assert parcela.litros_disponibles == 14000.0
+    assert flota.saldo[0] == 14000.0
+
+
+def test_parcela_desactivada_despues_de_crear_la_flota_no_se_riega():
+    regada, desactivada = _parcela("P1"), _parcela("P2")
+    flota = FlotaRiego([regada, desactivada])
+
+    desactivada.desactivar("Fuera de temporada")
+    aplicados = flota.regar_lote("estricto")
+
+    np.testing.assert_array_equal(aplicados, [3000.0, 0.0])
+    assert desactivada.litros_disponibles == 10000.0
+    assert desactivada.historial_eventos[-1].tipo == "Riego Rechazado"
+
+
+def test_las_columnas_se_actualizan_por_suscripcion_sin_releer_la_flota(monkeypatch):
+    parcela = _parcela("P1")
+    flota = FlotaRiego([parcela])
+    monkeypatch.setattr(FlotaRiego, "sincronizar", lambda self: pytest.fail("No debe releer la flota"))
+
+    parcela.configurar_tasa(1000.0)
+    parcela.rectificar_superficie(2.0, "Mensura")
+    parcela.configurar_umbral(8500.0)
+    assert flota.regar_lote("estricto").tolist() == [0.0]  # 10000 - 2000 < 8500
+
+    parcela.configurar_umbral(0.0)
+    parcela.inhabilitar_riego()
+    assert flota.regar_lote("estricto").tolist() == [0.0]
+    parcela.habilitar_riego()
+    assert flota.regar_lote("estricto").tolist() == [2000.0]
+    assert parcela.litros_disponibles == flota.saldo[0] == 8000.0
+
+
+def test_desvincular_deja_de_seguir_los_cambios():
+    parcela = _parcela("P1")
+    flota = FlotaRiego([parcela])
+    flota.desvincular()
+    parcela.cargar_agua(500)
+    assert flota.saldo[0] == 10000.0
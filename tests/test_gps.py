@@ -0,0 +1,63 @@
+import io
+
+import numpy as np
+import pytest
+
+from ejercicio3.desarrollo3 import Carrera
+from ejercicio3.gps import SeguimientoGPS, ingerir_track, leer_bloques_binario, leer_bloques_csv
+
+
+def _puntos(n: int = 40):
+    # Hacia el norte sobre el meridiano 0, un punto cada 30 s (~0.5 km entre puntos)
+    return [(0.0045 * i, 0.0, 1_000_000.0 + 30 * i) for i in range(n)]
+
+
+def _csv(puntos, encabezado: bool = True) -> str:
+    filas = [f"{lat!r},{lon!r},{marca!r}" for lat, lon, marca in puntos]
+    return "\n".join((["lat,lon,marca_tiempo"] if encabezado else []) + filas) + "\n"
+
+
+def _procesar(bloques_puntos):
+    carrera = Carrera("C1", "Fondo", 20)
+    return carrera, SeguimientoGPS(carrera).procesar(bloques_puntos)
+
+
+def test_csv_binario_e_iterador_dan_el_mismo_resumen(tmp_path):
+    puntos = _puntos()
+    _, desde_csv = _procesar(leer_bloques_csv(io.StringIO(_csv(puntos)), tamanio_bloque=7))
+    binario = io.BytesIO(np.array(puntos, dtype="<f8").tobytes())
+    _, desde_binario = _procesar(leer_bloques_binario(binario, tamanio_bloque=7))
+    carrera = Carrera("C2", "Fondo", 20)
+    desde_iterador = ingerir_track(carrera, iter(puntos), tamanio_bloque=5)
+
+    assert desde_csv == desde_binario == desde_iterador
+    assert desde_csv.puntos == 40 and desde_csv.rechazados == 0
+    assert desde_csv.distancia_km == pytest.approx(19.5, abs=0.1)
+    assert len(desde_csv.parciales) == 19
+    assert carrera.distancia_km == desde_iterador.distancia_km
+    assert carrera.duracion_min == 20  # Solo se actualiza la distancia
+
+
+def test_filas_mal_formadas_se_descartan_sin_cortar_la_ingesta():
+    puntos = _puntos()
+    texto = _csv(puntos[:25]) + "1.0,2.0\nnorte,0,5\n0.1,0.2,0.3,0.4\n" + _csv(puntos[25:], encabezado=False)
+    carrera, resumen = _procesar(leer_bloques_csv(io.StringIO(texto), tamanio_bloque=8))
+    _, limpio = _procesar(leer_bloques_csv(io.StringIO(_csv(puntos)), tamanio_bloque=8))
+
+    assert resumen.rechazados == 3
+    assert resumen._replace(rechazados=0) == limpio
+    assert carrera.distancia_km == limpio.distancia_km
+
+
+def test_binario_con_punto_incompleto_al_final():
+    datos = np.array(_puntos(10), dtype="<f8").tobytes() + b"\x00" * 12
+    _, resumen = _procesar(leer_bloques_binario(io.BytesIO(datos), tamanio_bloque=4))
+    assert (resumen.puntos, resumen.rechazados) == (10, 1)
+
+
+def test_bloque_con_forma_invalida_no_modifica_la_carrera():
+    carrera = Carrera("C1", "Fondo", 20)
+    seguimiento = SeguimientoGPS(carrera)
+    with pytest.raises(ValueError):
+        seguimiento.procesar_bloque(np.zeros((4, 2)))
+    assert carrera.distancia_km == 0.0
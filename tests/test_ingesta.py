@@ -0,0 +1,37 @@
+import io
+
+from ejercicio2.desarrollo2 import Libro
+from ejercicio2.ingesta import aplicar_sesiones, leer_csv, leer_ndjson
+
+
+def _libros():
+    return {"L1": Libro("L1", "Rayuela", 1963, 600), "L2": Libro("L2", "Ficciones", 1944, 200)}
+
+
+def test_fila_csv_mal_formada_se_rechaza_y_la_ingesta_continua():
+    libros = _libros()
+    archivo = io.StringIO("id_publicacion,paginas,marca_tiempo\n"
+                          "L1,10,1000\n"
+                          "L1,diez,1001\n"
+                          "L2,5\n"
+                          ",\n"
+                          "L1,20,1002\n")
+    resumen = aplicar_sesiones(libros, leer_csv(archivo), tamanio_lote=2)
+
+    assert resumen.rechazadas == 2
+    assert (resumen.sesiones, resumen.aplicadas) == (3, 3)
+    assert libros["L1"].paginas_leidas == 30
+    assert libros["L2"].paginas_leidas == 5
+
+
+def test_linea_ndjson_invalida_se_rechaza():
+    libros = _libros()
+    archivo = io.StringIO('{"id_publicacion": "L1", "paginas": 10}\n'
+                          '{"id_publicacion": "L1", "paginas": \n'
+                          '{"paginas": 3}\n'
+                          '[1, 2]\n'
+                          '{"id_publicacion": "L2", "paginas": 7}\n')
+    resumen = aplicar_sesiones(libros, leer_ndjson(archivo))
+
+    assert resumen.rechazadas == 3
+    assert (resumen.sesiones, resumen.aplicadas, resumen.paginas_aplicadas) == (2, 2, 17)
@@ -0,0 +1,93 @@
+import struct
+
+import pytest
+
+from comun.textos import internar, tamanio_tabla, vaciar_tabla
+from ejercicio2.desarrollo2 import LecturasCompactas, Libro, Publicacion
+from ejercicio2.instantanea import MAGIA, VERSION, cargar_instantanea, guardar_instantanea
+
+
+@pytest.fixture
+def compactas():
+    previo = Libro.lecturas_compactas
+
+    def fijar(valor: bool):
+        Libro.lecturas_compactas = valor
+
+    yield fijar
+    Libro.lecturas_compactas = previo
+
+
+def _publicaciones():
+    revista = Publicacion("P1", "Revista", 2001)
+    revista.actualizar_titulo("Revista Ñandú")
+    revista.actualizar_anio(2003)
+    libro = Libro("L1", "Rayuela", 1963, 600)
+    for paginas in (120, 35, 200):
+        libro.leer(paginas)
+    libro.actualizar_titulo("Rayuela (edición anotada)")
+    vacio = Libro("L2", "Sin leer", 2020, 90)
+    return [revista, libro, vacio]
+
+
+def _estado(publicacion):
+    estado = (type(publicacion), publicacion.id_publicacion, publicacion.titulo, publicacion.anio,
+              [(e.marca_tiempo, e.campo, e.valor_anterior, e.valor_nuevo)
+               for e in publicacion.historial_eventos])
+    if isinstance(publicacion, Libro):
+        estado += (publicacion.paginas_totales, publicacion.paginas_leidas,
+                   [(e.marca_tiempo, e.paginas_leidas, e.acumulado) for e in publicacion.eventos_lectura])
+    return estado
+
+
+@pytest.mark.parametrize("al_guardar, al_cargar", [(False, False), (True, True), (True, False), (False, True)],
+                         ids=["lista", "compactas", "compactas_a_lista", "lista_a_compactas"])
+def test_ida_y_vuelta(tmp_path, compactas, al_guardar, al_cargar):
+    ruta = str(tmp_path / "catalogo.inst")
+    compactas(al_guardar)
+    originales = _publicaciones()
+    assert guardar_instantanea(originales, ruta) == 3
+
+    compactas(al_cargar)
+    cargadas = cargar_instantanea(ruta)
+    assert [_estado(p) for p in cargadas] == [_estado(p) for p in originales]
+    tipo_lecturas = LecturasCompactas if al_cargar else list
+    assert isinstance(cargadas[1]._Libro__eventos_lectura, tipo_lecturas)
+
+    # El libro restaurado sigue operando a partir del estado cargado
+    assert cargadas[1].leer(10).ok and cargadas[1].paginas_leidas == 365
+
+
+def test_los_campos_de_evento_vuelven_internados(tmp_path):
+    ruta = str(tmp_path / "catalogo.inst")
+    guardar_instantanea(_publicaciones(), ruta)
+    vaciar_tabla()
+    revista = cargar_instantanea(ruta)[0]
+    # Solo los nombres de campo ("titulo", "anio") vuelven a la tabla; los valores son texto libre
+    assert tamanio_tabla() == 2
+    assert revista.historial_eventos[0].campo is internar("titulo")
+
+
+def test_rechaza_magia_incorrecta(tmp_path):
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"NOESESTO" + bytes(32))
+    with pytest.raises(ValueError, match="no es una instantánea"):
+        cargar_instantanea(str(ruta))
+
+
+def test_rechaza_version_desconocida(tmp_path):
+    ruta = tmp_path / "catalogo.inst"
+    guardar_instantanea(_publicaciones(), str(ruta))
+    datos = bytearray(ruta.read_bytes())
+    struct.pack_into("<H", datos, len(MAGIA), VERSION + 1)
+    ruta.write_bytes(bytes(datos))
+    with pytest.raises(ValueError, match="Versión de instantánea no soportada"):
+        cargar_instantanea(str(ruta))
+
+
+def test_rechaza_tipos_que_no_sabe_guardar(tmp_path):
+    class Revista(Publicacion):
+        pass
+
+    with pytest.raises(TypeError):
+        guardar_instantanea([Revista("R1", "Otra", 1999)], str(tmp_path / "x.inst"))
@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+
+from comun.cerrojos import CerrojosRayados
+from comun.resultado import INVALIDO, RECHAZADO, Resultado
+from ejercicio4.desarrollo4 import Auto, Vehiculo
+from ejercicio4.ocupacion import OcupacionFlota, subir_en_varios
+
+
+def _flota(*asientos):
+    flota = OcupacionFlota()
+    autos = [Auto(f"A{i}", f"P{i}", 1200, n) for i, n in enumerate(asientos)]
+    for auto in autos:
+        flota.agregar(auto)
+    return flota, autos
+
+
+def test_los_baldes_siguen_a_subir_bajar_e_inhabilitar():
+    flota, (auto,) = _flota(4)
+    assert flota.distribucion() == {("habilitado", 4): 1}
+
+    auto.subir_personas(3)
+    assert flota.autos_en("habilitado", 1) == [auto]
+    assert flota.contar("habilitado", 4) == 0
+
+    auto.bajar_personas(2)
+    assert flota.distribucion() == {("habilitado", 3): 1}
+
+    auto.inhabilitar("Service")
+    assert flota.distribucion() == {("inhabilitado", 3): 1}
+    assert flota.buscar_auto(1) is None
+
+    auto.habilitar("Listo")
+    auto.vaciar_auto("Fin de viaje")
+    assert flota.distribucion() == {("habilitado", 4): 1}
+
+    flota.quitar("A0")
+    auto.subir_personas(1)
+    assert flota.distribucion() == {} and len(flota) == 0
+
+
+def test_buscar_auto_elige_el_mas_ajustado():
+    flota, (grande, chico) = _flota(7, 4)
+    assert flota.buscar_auto(3) is chico
+    assert flota.buscar_auto(5) is grande
+    assert flota.buscar_auto(8) is None
+
+
+def test_asignar_sin_capacidad():
+    flota, (auto,) = _flota(4)
+    assert flota.asignar(3)[0] is auto
+    assert flota.asignar(2) == (None, None)
+    assert auto.ocupantes_actuales == 3
+    assert flota.asignar(0) == (None, Resultado(INVALIDO))
+
+
+class AutoQueFallaUnaVez(Auto):
+    # Simula que otro hilo lo llenó entre buscar_auto y subir_personas
+    fallas = 1
+
+    def subir_personas(self, n, usuario="Sistema"):
+        if self.fallas:
+            self.fallas -= 1
+            return Resultado(RECHAZADO)
+        return super().subir_personas(n, usuario)
+
+
+def test_asignar_reintenta_si_el_auto_elegido_rechaza():
+    flota = OcupacionFlota()
+    auto = AutoQueFallaUnaVez("A0", "P0", 1200, 4)
+    flota.agregar(auto)
+    elegido, resultado = flota.asignar(2)
+    assert elegido is auto and resultado.ok
+    assert auto.fallas == 0 and auto.ocupantes_actuales == 2
+
+
+def test_asignar_desde_varios_hilos_no_sobrevende():
+    Vehiculo.cerrojos = CerrojosRayados(8)
+    try:
+        flota, autos = _flota(*([4] * 10))
+        asignados = []
+
+        def trabajar():
+            for _ in range(20):
+                auto, _ = flota.asignar(1)
+                if auto is not None:
+                    asignados.append(auto)
+
+        hilos = [threading.Thread(target=trabajar) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    finally:
+        Vehiculo.cerrojos = None
+
+    assert len(asignados) == 40
+    assert all(auto.ocupantes_actuales == 4 for auto in autos)
+    assert flota.distribucion() == {("habilitado", 0): 10}
+
+
+@pytest.fixture(params=[None, 4], ids=["sin_cerrojos", "rayado"])
+def cerrojos(request):
+    Vehiculo.cerrojos = CerrojosRayados(request.param) if request.param else None
+    yield Vehiculo.cerrojos
+    Vehiculo.cerrojos = None
+
+
+def test_subir_en_varios_es_todo_o_nada(cerrojos):
+    _, (libre, lleno) = _flota(4, 2)
+    lleno.subir_personas(2)
+
+    resultado = subir_en_varios([(libre, 2), (lleno, 1)])
+    assert resultado.estado == RECHAZADO
+    assert (libre.ocupantes_actuales, lleno.ocupantes_actuales) == (0, 2)
+    assert len(libre.eventos_ocupacion) == 0
+
+    lleno.bajar_personas(1)
+    resultado = subir_en_varios([(libre, 2), (lleno, 1), (libre, 1)])
+    assert resultado.ok and (resultado.cantidad, resultado.saldo) == (4, 2)
+    assert (libre.ocupantes_actuales, lleno.ocupantes_actuales) == (3, 2)
+
+
+def test_subir_en_varios_rechaza_autos_inhabilitados_y_cantidades_invalidas():
+    _, (a, b) = _flota(4, 4)
+    b.inhabilitar("Service")
+    assert not subir_en_varios([(a, 1), (b, 1)]).ok
+    assert not subir_en_varios([(a, 0)]).ok
+    assert a.ocupantes_actuales == 0
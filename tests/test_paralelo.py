@@ -0,0 +1,26 @@
+from comun.almacen_eventos import AlmacenMemoria
+from comun.salida import BUFFER, configurar_salida, politica_actual
+from ejercicio1.desarrollo import Parcela, ParcelaConRiego
+from ejercicio1.paralelo import ejecutar_en_paralelo
+
+
+def test_en_proceso_no_altera_la_politica_ni_el_almacen_del_llamador():
+    parcelas = [ParcelaConRiego(f"P{i}", 1.0, "Trigo", 1000.0) for i in range(3)]
+    for parcela in parcelas:
+        parcela.habilitar_riego()
+
+    almacen = AlmacenMemoria(capacidad=100)
+    politica_previa = configurar_salida(BUFFER)
+    politica = politica_actual()
+    almacen_previo, Parcela.almacen_eventos = Parcela.almacen_eventos, almacen
+    try:
+        eventos = ejecutar_en_paralelo(parcelas, [("cargar_agua", 5000.0), ("regar_automatico", "estricto")],
+                                       procesos=1)
+        assert politica_actual() is politica
+        assert Parcela.almacen_eventos is almacen
+    finally:
+        Parcela.almacen_eventos = almacen_previo
+        configurar_salida(politica_previa)
+
+    assert len(eventos) == 6
+    assert [p.litros_disponibles for p in parcelas] == [4000.0] * 3
@@ -0,0 +1,21 @@
+from ejercicio2.desarrollo2 import Libro
+from ejercicio2.ingesta import SesionLectura, aplicar_sesiones
+from ejercicio2.pronostico import PronosticoLectura, pronosticar_catalogo
+
+
+def test_incremental_coincide_con_lotes_tras_una_ingesta():
+    libros = {"L1": Libro("L1", "Rayuela", 1963, 600), "L2": Libro("L2", "Ficciones", 1944, 200)}
+    motor = PronosticoLectura(alfa=0.5)
+    for libro in libros.values():
+        motor.agregar(libro)
+
+    dia = 86400.0
+    sesiones = [SesionLectura("L1", 10, 1_000_000.0), SesionLectura("L1", 20, 1_000_000.0 + dia),
+                SesionLectura("L1", 30, 1_000_000.0 + 3 * dia), SesionLectura("L2", 50, 1_000_000.0)]
+    aplicar_sesiones(libros, sesiones)
+    libros["L2"].leer(25)
+
+    incremental = motor.pronosticos()
+    assert incremental == pronosticar_catalogo(libros.values(), alfa=0.5)
+    # L1: muestras de 20 y 15 páginas/día con alfa 0.5
+    assert incremental["L1"].paginas_por_dia == 17.5
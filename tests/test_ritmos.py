@@ -0,0 +1,24 @@
+import random
+
+import numpy as np
+
+from ejercicio3.desarrollo3 import Carrera
+from ejercicio3.ritmos import calcular_ritmos, ritmos_carreras
+
+
+def test_redondeo_coincide_con_calcular_ritmo():
+    azar = random.Random(3)
+    carreras = [Carrera(f"C{i}", "Carrera", azar.randint(1, 600), round(azar.uniform(0.5, 60), 2))
+                for i in range(20_000)]
+    carreras.append(Carrera("SIN", "Sin distancia", 30))
+
+    ritmos = ritmos_carreras(carreras)
+    esperados = [c.calcular_ritmo() for c in carreras[:-1]]
+    assert ritmos[:-1].tolist() == esperados
+    assert np.isnan(ritmos[-1])
+
+
+def test_caso_limite_de_medio_centesimo():
+    # np.round da 13.58; round de Python (y Carrera.calcular_ritmo) da 13.57
+    assert calcular_ritmos(np.array([108.6]), np.array([8.0])).tolist() == [round(108.6 / 8.0, 2)]
+    assert calcular_ritmos(108.6, 8.0) == round(108.6 / 8.0, 2)
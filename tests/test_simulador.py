@@ -0,0 +1,12 @@
+import pytest
+
+from ejercicio1.simulador import ProgramaDia
+
+
+def test_programa_dia_no_comparte_mapeos_modificables():
+    programa = ProgramaDia()
+    with pytest.raises(TypeError):
+        programa.recargas["P1"] = 500.0
+    with pytest.raises(TypeError):
+        programa.modos["P1"] = "estricto"
+    assert not ProgramaDia().recargas and not ProgramaDia().modos
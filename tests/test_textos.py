@@ -0,0 +1,20 @@
+from comun.textos import internar_texto, tamanio_tabla
+from ejercicio1.desarrollo import Evento
+from ejercicio2.desarrollo2 import Evento as EventoPublicacion
+
+
+def test_texto_libre_no_crece_la_tabla():
+    previo = tamanio_tabla()
+    eventos = [Evento("Prueba", f"Detalle único {i}") for i in range(1000)]
+    eventos += [EventoPublicacion("titulo", f"Anterior {i}", f"Nuevo {i}") for i in range(1000)]
+    # Solo se agregan los textos de baja cardinalidad ("Prueba", "titulo")
+    assert tamanio_tabla() - previo <= 2
+    assert len(eventos) == 2000
+
+
+def test_internar_texto_comparte_la_instancia():
+    a = "".join(["Detalle ", "repetido"])
+    b = "".join(["Detalle ", "repetido"])
+    assert a is not b
+    assert internar_texto(a) is internar_texto(b)
+    assert internar_texto(3.5) == 3.5